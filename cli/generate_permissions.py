@@ -26,7 +26,7 @@ FILE_TEMPLATE = dedent(
     # Code generated. DO NOT EDIT.
 
     from enum import Enum
-    from typing import Dict, List
+    from typing import Dict, FrozenSet, List
 
     from .get_permission_parts import get_permission_parts
 
@@ -81,12 +81,12 @@ def main() -> None:
     with open(DESTINATION, "w") as dest:
         dest.write(FILE_TEMPLATE)
         all_parents: Dict[str, List[str]] = {}
-        all_permissions: Dict[str, Set[str]] = defaultdict(set)
+        all_permissions: Dict[str, Dict[str, None]] = defaultdict(dict)
         for collection, children in permissions.items():
-            parents = process_permission_level(collection, None, children)
-            for pair in parents:
+            pairs = process_permission_level(collection, None, children)
+            for pair in pairs:
                 collection, _ = get_permission_parts(pair[0])
-                all_permissions[collection].add(pair[0])
+                all_permissions[collection][pair[0]] = None
                 if not pair[0] in all_parents:
                     all_parents[pair[0]] = []
                 if pair[1] is not None:
@@ -106,9 +106,53 @@ def main() -> None:
         dest.write("permission_parents: Dict[Permission, List[Permission]] = ")
         dest.write(repr(all_parents))
 
+        all_children: Dict[str, List[str]] = {child: [] for child in all_parents}
+        for child, parent_permissions in all_parents.items():
+            for parent in parent_permissions:
+                all_children[parent].append(child)
+
+        dest.write(
+            "\n\n# Holds all direct and indirect parents for each permission including itself.\n"
+        )
+        dest.write("permission_ancestors: Dict[Permission, FrozenSet[Permission]] = ")
+        dest.write(repr_closure(get_closure(all_parents)))
+        dest.write(
+            "\n\n# Holds all direct and indirect children for each permission including itself.\n"
+        )
+        dest.write("permission_descendants: Dict[Permission, FrozenSet[Permission]] = ")
+        dest.write(repr_closure(get_closure(all_children)))
+
     print(f"Permissions file {DESTINATION} successfully created.")
 
 
+def get_closure(relations: Dict[str, List[str]]) -> Dict[str, Set[str]]:
+    """
+    Returns the transitive and reflexive closure of the given relation.
+    """
+    closure: Dict[str, Set[str]] = {}
+    for permission in relations:
+        closure[permission] = set()
+        queue = [permission]
+        while queue:
+            current = queue.pop()
+            if current not in closure[permission]:
+                closure[permission].add(current)
+                queue.extend(relations[current])
+    return closure
+
+
+def repr_closure(closure: Dict[str, Set[str]]) -> str:
+    """
+    Returns a deterministic representation of the closure with frozensets. The
+    permissions are sorted by their enum names like in the generated file.
+    """
+    items = (
+        f"{repr(permission)}: frozenset({{{', '.join(sorted(repr(p) for p in permissions))}}})"
+        for permission, permissions in closure.items()
+    )
+    return "{" + ", ".join(items) + "}"
+
+
 def process_permission_level(
     collection: str, permission: Optional[str], children: Dict[str, Any]
 ) -> Iterable[Tuple[str, Optional[str]]]:
@@ -5,7 +5,7 @@ import fastjsonschema
 
 from ..models.base import Model, model_registry
 from ..models.fields import BaseTemplateField, BaseTemplateRelationField
-from ..permissions.permission_helper import has_perm
+from ..permissions.permission_helper import PermissionResolver
 from ..permissions.permissions import Permission
 from ..services.auth.interface import AuthenticationService
 from ..services.datastore.interface import DatastoreService
@@ -73,9 +73,11 @@ class Action(BaseAction, metaclass=SchemaProvider):
     permission_model: Optional[Model] = None
     permission_id: Optional[str] = None
     relation_manager: RelationManager
+    permission_resolver: PermissionResolver
 
     write_requests: List[WriteRequest]
     results: ActionResults
+    external_permission_instances: List[Dict[str, Any]]
 
     def __init__(
         self,
@@ -83,6 +85,7 @@ class Action(BaseAction, metaclass=SchemaProvider):
         datastore: DatastoreService,
         relation_manager: RelationManager,
         logging: LoggingModule,
+        permission_resolver: Optional[PermissionResolver] = None,
     ) -> None:
         self.services = services
         self.permission_service = services.permission()
@@ -90,10 +93,12 @@ class Action(BaseAction, metaclass=SchemaProvider):
         self.media = services.media()
         self.datastore = datastore
         self.relation_manager = relation_manager
+        self.permission_resolver = permission_resolver or PermissionResolver(datastore)
         self.logging = logging
         self.logger = logging.getLogger(__name__)
         self.write_requests = []
         self.results = []
+        self.external_permission_instances = []
 
     def perform(
         self, action_data: ActionData, user_id: int, internal: bool = False
@@ -105,16 +110,25 @@ class Action(BaseAction, metaclass=SchemaProvider):
         self.index = 0
         for instance in action_data:
             self.validate_instance(instance)
-            # perform permission check not for internal actions
-            if not internal:
-                self.check_permissions(instance)
             self.index += 1
+
+        # perform permission check not for internal actions
+        if not internal:
+            self.external_permission_instances = []
+            self.index = 0
+            for instance in action_data:
+                self.check_permissions(instance)
+                self.index += 1
+            self.check_external_permissions()
         self.index = -1
 
         instances = self.get_updated_instances(action_data)
         is_original_instances = hasattr(
             self.get_updated_instances, "_original_instances"
         )
+        if is_original_instances:
+            # every instance of the action data is processed
+            self.reserve_ids(len(action_data))  # type: ignore
         for instance in instances:
             # only increment index if the instances which are iterated here are the
             # same as the ones from the action data list (meaning get_updated_instances was
@@ -143,21 +157,35 @@ class Action(BaseAction, metaclass=SchemaProvider):
 
     def check_permissions(self, instance: Dict[str, Any]) -> None:
         """
-        Checks permission by requesting permission service or using internal check.
+        Checks permission by using internal check or collecting the instance for
+        the permission service, which is requested once for all instances in
+        check_external_permissions.
         """
         # switch between internal and external permission service
         if self.permission:
             meeting_id = self.get_meeting_id(instance)
-            if has_perm(self.datastore, self.user_id, self.permission, meeting_id):
+            if self.permission_resolver.has_perm(
+                self.user_id, self.permission, meeting_id
+            ):
                 return
+            msg = f"You are not allowed to perform action {self.name}."
+            msg += f" Missing permission: {self.permission}"
+            raise PermissionDenied(msg)
         else:
-            if self.permission_service.is_allowed(self.name, self.user_id, [instance]):
-                return
+            self.external_permission_instances.append(instance)
 
-        msg = f"You are not allowed to perform action {self.name}."
-        if self.permission:
-            msg += f" Missing permission: {self.permission}"
-        raise PermissionDenied(msg)
+    def check_external_permissions(self) -> None:
+        """
+        Requests the permission service with all collected instances at once.
+        """
+        if not self.external_permission_instances:
+            return
+        if not self.permission_service.is_allowed(
+            self.name, self.user_id, self.external_permission_instances
+        ):
+            raise PermissionDenied(
+                f"You are not allowed to perform action {self.name}."
+            )
 
     def get_meeting_id(self, instance: Dict[str, Any]) -> int:
         """
@@ -201,6 +229,13 @@ class Action(BaseAction, metaclass=SchemaProvider):
         except fastjsonschema.JsonSchemaException as exception:
             raise ActionException(exception.message)
 
+    def reserve_ids(self, amount: int) -> None:
+        """
+        Reserves the ids of the given amount of new models at once before the
+        instances are updated. Does nothing by default, only actions which create
+        models need new ids.
+        """
+
     def base_update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         """
         Updates one instance of the action data. This can be overridden by custom
@@ -345,7 +380,7 @@ class Action(BaseAction, metaclass=SchemaProvider):
             if type_ == EventType.Create:
                 required_fields = [
                     field.own_field_name
-                    for field in model_registry[fqid.collection]().get_required_fields()
+                    for field in model_registry[fqid.collection].get_required_fields()
                     if field.own_field_name not in instance
                     or (
                         field.own_field_name in instance
@@ -356,7 +391,7 @@ class Action(BaseAction, metaclass=SchemaProvider):
             elif type_ == EventType.Update:
                 required_fields = [
                     field.own_field_name
-                    for field in model_registry[fqid.collection]().get_required_fields()
+                    for field in model_registry[fqid.collection].get_required_fields()
                     if field.own_field_name in instance
                     and not instance[field.own_field_name]
                 ]
@@ -417,11 +452,11 @@ class Action(BaseAction, metaclass=SchemaProvider):
                             self.datastore, fqids, own_equal_field_value
                         )
                     else:
+                        related_instances = self.datastore.fetch_models(
+                            fqids, [equal_field]
+                        )
                         for fqid in fqids:
-                            related_instance = self.datastore.fetch_model(
-                                fqid,
-                                [equal_field],
-                            )
+                            related_instance = related_instances[fqid]
                             if (
                                 related_instance.get(equal_field)
                                 != own_equal_field_value
@@ -473,7 +508,9 @@ class Action(BaseAction, metaclass=SchemaProvider):
             self.datastore,
             self.relation_manager,
             self.logging,
+            self.permission_resolver,
         )
+        action.media = self.media
         write_request, action_results = action.perform(
             action_data, self.user_id, internal=True
         )
@@ -1,20 +1,26 @@
+from collections import defaultdict
 from copy import deepcopy
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, cast
 
 import fastjsonschema
 
-from ..shared.env import is_dev_mode
+from ..permissions.permission_helper import PermissionResolver
+from ..services.datastore.metrics import DatastoreMetrics
+from ..shared.env import get_query_budget, is_dev_mode
 from ..shared.exceptions import (
     ActionException,
     DatastoreLockedException,
     View400Exception,
 )
 from ..shared.handlers.base_handler import BaseHandler
+from ..shared.interfaces.logging import LoggingModule
+from ..shared.interfaces.services import Services
 from ..shared.interfaces.write_request import WriteRequest
 from ..shared.schema import schema_version
 from . import actions  # noqa
 from .relations.relation_manager import RelationManager
 from .util.actions_map import actions_map
+from .util.media_uploads import MediaUploads
 from .util.typing import (
     ActionError,
     ActionResults,
@@ -63,6 +69,12 @@ class ActionHandler(BaseHandler):
 
     MAX_RETRY = 3
 
+    def __init__(self, services: Services, logging: LoggingModule) -> None:
+        super().__init__(services, logging)
+        self.permission_resolver = PermissionResolver(self.datastore)
+        self.action_metrics: Dict[str, DatastoreMetrics] = defaultdict(DatastoreMetrics)
+        self.media_uploads = MediaUploads(services.media())
+
     @classmethod
     def get_health_info(cls) -> Iterable[Tuple[str, Dict[str, Any]]]:
         """
@@ -87,6 +99,8 @@ class ActionHandler(BaseHandler):
         parsing all actions. In the end it sends everything to the event store.
         """
         self.user_id = user_id
+        self.permission_resolver.reset()
+        self.action_metrics.clear()
 
         try:
             payload_schema(payload)
@@ -113,6 +127,12 @@ class ActionHandler(BaseHandler):
                     error = cast(ActionError, exception.get_json())
                     results.append(error)
 
+        for action_name, metrics in self.action_metrics.items():
+            self.logger.debug(
+                "Datastore metrics of action %s: %s", action_name, metrics
+            )
+        self.logger.debug("Datastore metrics of request: %s", self.datastore.metrics)
+
         # Return action result
         self.logger.debug("Request was successful. Send response now.")
         return ActionsResponse(
@@ -124,10 +144,15 @@ class ActionHandler(BaseHandler):
         get_write_requests: Callable[..., Tuple[List[WriteRequest], T]],
         *args: Any,
     ) -> T:
+        # The uploads to the media service run in the background and are joined
+        # before the write.
+        self.media_uploads.reset()
         retried = 0
         while True:
+            self.media_uploads.start_attempt()
             try:
                 write_requests, data = get_write_requests(*args)
+                self.media_uploads.join()
                 if write_requests:
                     self.datastore.write(write_requests)
                 return data
@@ -137,6 +162,7 @@ class ActionHandler(BaseHandler):
                     raise ActionException(exception.message)
                 else:
                     self.datastore.reset()
+                    self.permission_resolver.reset()
 
     def parse_actions(
         self, payload: Payload
@@ -191,22 +217,54 @@ class ActionHandler(BaseHandler):
         if not relation_manager:
             relation_manager = RelationManager(self.datastore)
 
-        self.logger.debug(f"Perform action {action_name}.")
+        self.logger.debug("Perform action %s.", action_name)
         action = ActionClass(
-            self.services, self.datastore, relation_manager, self.logging
+            self.services,
+            self.datastore,
+            relation_manager,
+            self.logging,
+            self.permission_resolver,
         )
-        action_data = deepcopy(action_payload_element["data"])
+        action.media = self.media_uploads
+        # Copy-on-write: Actions add, replace and pop fields of the instances but
+        # must not change nested values of the payload in place (see
+        # TreeSortMixin). So a shallow copy of each instance keeps the payload
+        # untouched for retries and error reporting without copying large values
+        # like texts or files.
+        action_data = [dict(instance) for instance in action_payload_element["data"]]
 
+        metrics_before = self.datastore.metrics.copy()
         try:
             write_request, results = action.perform(action_data, self.user_id)
             if write_request:
                 action.validate_required_fields(write_request)
+            self.check_query_budget(
+                action_name, self.datastore.metrics - metrics_before
+            )
             return (write_request, results)
         except ActionException as exception:
             self.logger.debug(
-                f"Error occured on index {action.index}: {exception.message}"
+                "Error occured on index %s: %s", action.index, exception.message
             )
             # -1: error which cannot be directly associated with a single action data
             if action.index > -1:
                 exception.action_data_error_index = action.index
             raise exception
+        finally:
+            self.action_metrics[action_name].add(
+                self.datastore.metrics - metrics_before
+            )
+
+    def check_query_budget(self, action_name: str, metrics: DatastoreMetrics) -> None:
+        """
+        Checks the number of datastore calls of the action against the optional
+        query budget. Exceeding it is an error in development mode and a warning
+        otherwise.
+        """
+        budget = get_query_budget()
+        if budget is None or metrics.total_calls <= budget:
+            return
+        message = f"Action {action_name} exceeded the query budget of {budget} datastore calls: {metrics}"
+        if is_dev_mode():
+            raise ActionException(message)
+        self.logger.warning(message)
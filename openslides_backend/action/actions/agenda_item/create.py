@@ -3,6 +3,7 @@ from typing import Any, Dict
 from ....models.models import AgendaItem
 from ....permissions.permissions import Permissions
 from ....shared.patterns import Collection, FullQualifiedId
+from ...action import original_instances
 from ...mixins.create_action_with_inferred_meeting import (
     CreateActionWithInferredMeeting,
 )
@@ -49,6 +50,7 @@ class AgendaItemCreate(CreateActionWithInferredMeeting):
         instance["weight"] = parent["weight"] + 1
         return instance
 
+    @original_instances
     def get_updated_instances(self, action_data: ActionData) -> ActionData:
         for instance in action_data:
             if instance.get("parent_id") is None:
@@ -1,6 +1,4 @@
-import base64
 import mimetypes
-from io import BytesIO
 from time import time
 from typing import Any, Dict, TypedDict
 
@@ -12,6 +10,7 @@ from ....permissions.permissions import Permissions
 from ....shared.exceptions import ActionException
 from ....shared.patterns import FullQualifiedId
 from ...mixins.create_action_with_dependencies import CreateActionWithDependencies
+from ...util.base64_file import get_decoded_size, open_base64_file
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
 from ..list_of_speakers.create import ListOfSpeakersCreate
@@ -55,10 +54,9 @@ class MediafileUploadAction(
         instance["mimetype"] = mimetypes.guess_type(instance["filename"])[0]
         if instance["mimetype"] is None:
             raise ActionException(f"Cannot guess mimetype for {instance['filename']}.")
-        decoded_file = base64.b64decode(instance["file"])
-        instance["filesize"] = len(decoded_file)
+        instance["filesize"] = get_decoded_size(instance["file"])
         if instance["mimetype"] == "application/pdf":
-            instance["pdf_information"] = self.get_pdf_information(decoded_file)
+            instance["pdf_information"] = self.get_pdf_information(instance["file"])
 
         if instance.get("parent_id"):
             parent_mediafile = self.datastore.get(
@@ -86,10 +84,13 @@ class MediafileUploadAction(
         self.media.upload_mediafile(file_, id_, mimetype_)
         return instance
 
-    def get_pdf_information(self, file_bytes: bytes) -> PDFInformation:
-        bytes_io = BytesIO(file_bytes)
+    def get_pdf_information(self, file: str) -> PDFInformation:
+        """
+        PyPDF only reads the trailer, the cross-reference table and the page tree
+        root to count the pages, so only these parts of the file are decoded.
+        """
         try:
-            pdf = PdfFileReader(bytes_io)
+            pdf = PdfFileReader(open_base64_file(file))
             return {"pages": pdf.getNumPages()}
         except PdfReadError:
             # File could be encrypted but not be detected by PyPDF.
@@ -1,16 +1,43 @@
-from ....models.models import Meeting, Speaker
-from ....services.datastore.commands import GetManyRequest
-from ....shared.patterns import Collection
-from ...generics.delete import DeleteAction
+from collections import defaultdict
+from typing import Any, Dict, List, Set, cast
+
+from ....models.fields import BaseTemplateField
+from ....models.models import Meeting, Speaker, User
+from ....shared.interfaces.event import EventType
+from ....shared.patterns import Collection, FullQualifiedId
+from ....shared.typing import DeletedModel
+from ...action import Action
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
 from ...util.typing import ActionData
 
+# The speaker relations which are reset in bulk, by the collection of the
+# related model.
+SPEAKER_RELATION_FIELDS = {
+    collection: field_name
+    for field in Speaker.relation_fields
+    for collection, field_name in field.to.items()
+}
+assert set(SPEAKER_RELATION_FIELDS) == {
+    Collection("list_of_speakers"),
+    Collection("meeting"),
+    Collection("user"),
+}, "The bulk deletion has to handle all relations of speakers."
+LIST_OF_SPEAKERS_FIELD = SPEAKER_RELATION_FIELDS[Collection("list_of_speakers")]
+MEETING_FIELD = SPEAKER_RELATION_FIELDS[Collection("meeting")]
+USER_FIELD = cast(
+    BaseTemplateField, User().get_field(SPEAKER_RELATION_FIELDS[Collection("user")])
+)
+
 
 @register_action("meeting.delete_all_speakers_of_all_lists")
-class DeleteAllSpeakersOfAllListsAction(DeleteAction):
+class DeleteAllSpeakersOfAllListsAction(Action):
     """
     Action to delete all speakers of all lists of a meeting.
+
+    The speakers are deleted in bulk: Instead of one delete with relation
+    handling per speaker, the remaining values of the relation fields of the
+    lists of speakers, meetings and users are calculated once.
     """
 
     model = Speaker()  # we want to delete Speakers
@@ -21,23 +48,100 @@ class DeleteAllSpeakersOfAllListsAction(DeleteAction):
     )
 
     def get_updated_instances(self, action_data: ActionData) -> ActionData:
-        new_action_data = []
-        meeting_ids = [instance["id"] for instance in action_data]
-        get_many_request = GetManyRequest(
-            Collection("meeting"), meeting_ids, ["list_of_speakers_ids"]
+        meetings = self.datastore.fetch_models(
+            [
+                FullQualifiedId(Collection("meeting"), instance["id"])
+                for instance in action_data
+            ],
+            ["list_of_speakers_ids", MEETING_FIELD],
+            lock_result=True,
         )
-        gm_result = self.datastore.get_many([get_many_request])
-        meetings = gm_result.get(Collection("meeting"), {})
-
-        los_ids = []
-        for meeting in meetings.values():
-            los_ids.extend(meeting.get("list_of_speakers_ids", []))
-        get_many_request = GetManyRequest(
-            Collection("list_of_speakers"), los_ids, ["speaker_ids"]
+        # The meeting of a speaker is the meeting of its list of speakers.
+        meeting_ids: Dict[FullQualifiedId, int] = {}
+        for meeting_fqid, meeting in meetings.items():
+            for los_id in meeting.get("list_of_speakers_ids", []):
+                los_fqid = FullQualifiedId(Collection("list_of_speakers"), los_id)
+                meeting_ids[los_fqid] = meeting_fqid.id
+        lists_of_speakers = self.datastore.fetch_models(
+            list(meeting_ids), [LIST_OF_SPEAKERS_FIELD], lock_result=True
+        )
+        for los_fqid, los in lists_of_speakers.items():
+            for speaker_id in los.get(LIST_OF_SPEAKERS_FIELD, []):
+                speaker_fqid = FullQualifiedId(self.model.collection, speaker_id)
+                meeting_ids[speaker_fqid] = meeting_ids[los_fqid]
+        speakers = self.datastore.fetch_models(
+            [fqid for fqid in meeting_ids if fqid.collection == self.model.collection],
+            ["user_id"],
+            lock_result=True,
+        )
+        if not speakers:
+            return []
+
+        deleted_speaker_ids: Set[int] = set()
+        speaker_ids_per_user: Dict[int, Dict[int, Set[int]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        for speaker_fqid, speaker in speakers.items():
+            deleted_speaker_ids.add(speaker_fqid.id)
+            if speaker.get("user_id"):
+                meeting_id = meeting_ids[speaker_fqid]
+                speaker_ids_per_user[speaker["user_id"]][meeting_id].add(
+                    speaker_fqid.id
+                )
+        template_field_name = USER_FIELD.get_template_field_name()
+        users = self.datastore.fetch_models(
+            [FullQualifiedId(Collection("user"), id) for id in speaker_ids_per_user],
+            [template_field_name]
+            + [
+                USER_FIELD.get_structured_field_name(meeting_fqid.id)
+                for meeting_fqid in meetings
+            ],
+            lock_result=True,
+        )
+
+        for los_fqid, los in lists_of_speakers.items():
+            if los.get(LIST_OF_SPEAKERS_FIELD):
+                self.update_related_model(los_fqid, {LIST_OF_SPEAKERS_FIELD: []})
+        for meeting_fqid, meeting in meetings.items():
+            speaker_ids = meeting.get(MEETING_FIELD, [])
+            remaining_ids = [id for id in speaker_ids if id not in deleted_speaker_ids]
+            if len(remaining_ids) < len(speaker_ids):
+                self.update_related_model(meeting_fqid, {MEETING_FIELD: remaining_ids})
+        for user_fqid, user in users.items():
+            fields: Dict[str, Any] = {}
+            replacements: List[str] = user.get(template_field_name, [])
+            for meeting_id, speaker_ids in speaker_ids_per_user[user_fqid.id].items():
+                field_name = USER_FIELD.get_structured_field_name(meeting_id)
+                fields[field_name] = [
+                    id for id in user.get(field_name, []) if id not in speaker_ids
+                ]
+                if not fields[field_name]:
+                    replacements = [
+                        replacement
+                        for replacement in replacements
+                        if replacement != str(meeting_id)
+                    ]
+            if replacements != user.get(template_field_name, []):
+                fields[template_field_name] = replacements
+            self.update_related_model(user_fqid, fields)
+
+        for speaker_fqid in speakers:
+            self.datastore.update_additional_models(speaker_fqid, DeletedModel())
+            self.write_requests.append(
+                self.build_write_request(
+                    EventType.Delete, speaker_fqid, "Object deleted"
+                )
+            )
+        return []
+
+    def update_related_model(
+        self, fqid: FullQualifiedId, fields: Dict[str, Any]
+    ) -> None:
+        self.write_requests.append(
+            self.build_write_request(
+                EventType.Update,
+                fqid,
+                f"Object attachment to {self.model.collection} reset",
+                fields,
+            )
         )
-        gm_result = self.datastore.get_many([get_many_request])
-        lists_of_speakers = gm_result.get(Collection("list_of_speakers"), {})
-        for los in lists_of_speakers.values():
-            for speaker in los.get("speaker_ids", []):
-                new_action_data.append({"id": speaker})
-        return new_action_data
@@ -1,13 +1,15 @@
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Type
 
 from ....models.models import Motion
 from ....shared.exceptions import ActionException
 from ....shared.patterns import POSITIVE_NUMBER_REGEX, Collection, FullQualifiedId
 from ....shared.schema import id_list_schema, optional_id_schema
+from ...action import Action, original_instances
 from ...mixins.create_action_with_dependencies import CreateActionWithDependencies
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ...util.typing import ActionData
 from ..agenda_item.agenda_creation import (
     CreateActionWithAgendaItemMixin,
     agenda_creation_properties,
@@ -61,7 +63,68 @@ class MotionCreate(
             **agenda_creation_properties,
         },
     )
-    dependencies = [AgendaItemCreate, ListOfSpeakersCreate]
+    dependencies = [MotionSubmitterCreateAction, AgendaItemCreate, ListOfSpeakersCreate]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.submitter_ids: Dict[int, List[int]] = {}
+
+    @original_instances
+    def get_updated_instances(self, action_data: ActionData) -> ActionData:
+        """
+        Fetches the settings of all meetings, workflows and first states needed by
+        the action data with one request each. Missing models are reported later
+        by the single instances.
+        """
+        action_data = list(action_data)
+        meetings = self.datastore.fetch_models(
+            [
+                FullQualifiedId(Collection("meeting"), instance["meeting_id"])
+                for instance in action_data
+            ],
+            [
+                "motions_default_workflow_id",
+                "motions_default_amendment_workflow_id",
+                "motions_default_statute_amendment_workflow_id",
+                "motions_reason_required",
+                "committee_id",
+                "agenda_item_creation",
+                "motions_number_type",
+                "motions_number_min_digits",
+                "motions_number_with_blank",
+                "motions_amendments_prefix",
+            ],
+            lock_result=True,
+            exception=False,
+        )
+        workflow_fqids = []
+        for instance in action_data:
+            meeting = meetings.get(
+                FullQualifiedId(Collection("meeting"), instance["meeting_id"]), {}
+            )
+            workflow_id = self.get_workflow_id(instance, meeting)
+            if workflow_id:
+                workflow_fqids.append(
+                    FullQualifiedId(Collection("motion_workflow"), workflow_id)
+                )
+        workflows = self.datastore.fetch_models(
+            workflow_fqids, ["first_state_id"], exception=False
+        )
+        self.datastore.fetch_models(
+            [
+                FullQualifiedId(Collection("motion_state"), workflow["first_state_id"])
+                for workflow in workflows.values()
+                if workflow.get("first_state_id")
+            ],
+            ["set_number"],
+            exception=False,
+        )
+        self.fetch_used_numbers(
+            (instance["meeting_id"], instance["number"])
+            for instance in action_data
+            if instance.get("number")
+        )
+        yield from action_data
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         # special check logic
@@ -104,16 +167,8 @@ class MotionCreate(
             raise ActionException("Reason is required")
 
         # calculate state_id from workflow_id
-        workflow_id = instance.pop("workflow_id", None)
-        if workflow_id is None:
-            if instance.get("lead_motion_id"):
-                workflow_id = meeting.get("motions_default_amendment_workflow_id")
-            elif instance.get("statute_paragraph_id"):
-                workflow_id = meeting.get(
-                    "motions_default_statute_amendment_workflow_id"
-                )
-            else:
-                workflow_id = meeting.get("motions_default_workflow_id")
+        workflow_id = self.get_workflow_id(instance, meeting)
+        instance.pop("workflow_id", None)
         if workflow_id:
             workflow = self.datastore.get(
                 FullQualifiedId(Collection("motion_workflow"), workflow_id),
@@ -152,15 +207,9 @@ class MotionCreate(
                     f"Committee id {meeting['committee_id']} not in {committee.get('forward_to_committee_ids', [])}"
                 )
 
-        # create submitters
+        # the submitters are created together with the other dependencies
         submitter_ids = instance.pop("submitter_ids", None)
-        if not submitter_ids:
-            submitter_ids = [self.user_id]
-        self.apply_instance(instance)
-        action_data = []
-        for user_id in submitter_ids:
-            action_data.append({"motion_id": instance["id"], "user_id": user_id})
-        self.execute_other_action(MotionSubmitterCreateAction, action_data)
+        self.submitter_ids[instance["id"]] = submitter_ids or [self.user_id]
 
         instance["sequential_number"] = self.get_sequential_number(
             instance["meeting_id"]
@@ -178,3 +227,25 @@ class MotionCreate(
         )
 
         return instance
+
+    def get_dependent_action_data_motion_submitter(
+        self, instance: Dict[str, Any], CreateActionClass: Type[Action]
+    ) -> List[Dict[str, Any]]:
+        return [
+            {"motion_id": instance["id"], "user_id": user_id}
+            for user_id in self.submitter_ids.pop(instance["id"])
+        ]
+
+    def get_workflow_id(
+        self, instance: Dict[str, Any], meeting: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Returns the given workflow or the matching default workflow of the meeting.
+        """
+        if instance.get("workflow_id") is not None:
+            return instance["workflow_id"]
+        if instance.get("lead_motion_id"):
+            return meeting.get("motions_default_amendment_workflow_id")
+        elif instance.get("statute_paragraph_id"):
+            return meeting.get("motions_default_statute_amendment_workflow_id")
+        return meeting.get("motions_default_workflow_id")
@@ -1,13 +1,25 @@
+from typing import Any, Dict
+
 from ....services.datastore.deleted_models_behaviour import DeletedModelsBehaviour
 from ....shared.filters import FilterOperator
 from ...generics.create import CreateAction
 
 
 class SequentialNumbersMixin(CreateAction):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.sequential_numbers: Dict[int, int] = {}
+
     def get_sequential_number(self, meeting_id: int) -> int:
         """
-        Creates a sequential number, unique per meeting and returns it
+        Creates a sequential number, unique per meeting and returns it. The
+        maximum is fetched once per meeting, further numbers of this action are
+        counted up from it.
         """
+        if meeting_id in self.sequential_numbers:
+            self.sequential_numbers[meeting_id] += 1
+            return self.sequential_numbers[meeting_id]
+
         filter = FilterOperator("meeting_id", "=", meeting_id)
 
         number = self.datastore.max(
@@ -18,4 +30,5 @@ class SequentialNumbersMixin(CreateAction):
             lock_result=True,
         )
         number = 1 if number is None else number + 1
+        self.sequential_numbers[meeting_id] = number
         return number
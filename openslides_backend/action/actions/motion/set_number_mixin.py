@@ -1,12 +1,24 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
 
 from ....shared.exceptions import ActionException
-from ....shared.filters import And, FilterOperator
+from ....shared.filters import And, FilterOperator, Or
 from ....shared.patterns import Collection, FullQualifiedId
-from ...action import BaseAction
+from ...action import Action
 
 
-class SetNumberMixin(BaseAction):
+class SetNumberMixin(Action):
+    """
+    Mixin to generate the number of a motion. The used numbers with a prefix and
+    the maximal number values are fetched once per action and kept up to date
+    with the numbers set by it, so numbering many motions needs no further
+    requests.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.used_numbers: Dict[Tuple[int, str], Set[str]] = {}
+        self.number_values: Dict[Tuple[Any, ...], int] = {}
+
     def set_number(
         self,
         instance: Dict[str, Any],
@@ -24,12 +36,18 @@ class SetNumberMixin(BaseAction):
         if instance.get("number"):
             if not self._check_if_unique(instance["number"], meeting_id):
                 raise ActionException("Number is not unique.")
+            self._add_used_number(instance["number"], meeting_id)
             return
         if existing_number:
             return
         meeting = self.datastore.get(
             FullQualifiedId(Collection("meeting"), meeting_id),
-            ["motions_number_type", "motions_number_min_digits"],
+            [
+                "motions_number_type",
+                "motions_number_min_digits",
+                "motions_number_with_blank",
+                "motions_amendments_prefix",
+            ],
         )
         if meeting.get("motions_number_type") == "manually":
             return
@@ -40,9 +58,9 @@ class SetNumberMixin(BaseAction):
             return
 
         # Generate the components of the number
-        prefix = self._get_prefix(meeting_id, lead_motion_id, category_id)
+        prefix = self._get_prefix(meeting, lead_motion_id, category_id)
         number_value = self._get_number_value(
-            meeting_id, lead_motion_id, category_id, existing_number_value
+            meeting, meeting_id, lead_motion_id, category_id, existing_number_value
         )
 
         # Generate test number and check uniqueness
@@ -50,7 +68,8 @@ class SetNumberMixin(BaseAction):
             meeting.get("motions_number_min_digits", 0), "0"
         )
         number = f"{prefix}{number_value_str}"
-        while not self._check_if_unique(number, meeting_id):
+        used_numbers = self._get_used_numbers(meeting_id, prefix)
+        while number in used_numbers:
             number_value += 1
             number_value_str = str(number_value).rjust(
                 meeting.get("motions_number_min_digits", 0), "0"
@@ -59,14 +78,14 @@ class SetNumberMixin(BaseAction):
 
         instance["number"] = number
         instance["number_value"] = number_value
+        self._add_used_number(number, meeting_id)
 
     def _get_prefix(
-        self, meeting_id: int, lead_motion_id: Optional[int], category_id: Optional[int]
+        self,
+        meeting: Dict[str, Any],
+        lead_motion_id: Optional[int],
+        category_id: Optional[int],
     ) -> str:
-        meeting = self.datastore.get(
-            FullQualifiedId(Collection("meeting"), meeting_id),
-            ["motions_number_with_blank", "motions_amendments_prefix"],
-        )
         blank = " " if meeting.get("motions_number_with_blank") else ""
         if lead_motion_id:
             lead_motion = self.datastore.get(
@@ -87,6 +106,7 @@ class SetNumberMixin(BaseAction):
 
     def _get_number_value(
         self,
+        meeting: Dict[str, Any],
         meeting_id: int,
         lead_motion_id: Optional[int],
         category_id: Optional[int],
@@ -95,31 +115,76 @@ class SetNumberMixin(BaseAction):
         if existing_number_value:
             return existing_number_value
 
-        meeting = self.datastore.get(
-            FullQualifiedId(Collection("meeting"), meeting_id), ["motions_number_type"]
-        )
+        key: Tuple[Any, ...]
         if lead_motion_id:
+            key = ("lead_motion_id", lead_motion_id)
             filter: Union[And, FilterOperator] = FilterOperator(
                 "lead_motion_id", "=", lead_motion_id
             )
         elif meeting.get("motions_number_type") == "per_category":
+            key = ("category_id", meeting_id, category_id)
             filter = And(
                 FilterOperator("category_id", "=", category_id),
                 FilterOperator("meeting_id", "=", meeting_id),
             )
         else:
+            key = ("meeting_id", meeting_id)
             filter = And(
                 FilterOperator("meeting_id", "=", meeting_id),
                 FilterOperator("lead_motion_id", "=", None),
             )
-        max_result = self.datastore.max(Collection("motion"), filter, "number_value")
-        max_result = 1 if max_result is None else max_result + 1
-        return max_result
+        if key not in self.number_values:
+            max_result = self.datastore.max(
+                Collection("motion"), filter, "number_value"
+            )
+            self.number_values[key] = 0 if max_result is None else max_result
+        self.number_values[key] += 1
+        return self.number_values[key]
 
     def _check_if_unique(self, number: str, meeting_id: int) -> bool:
-        filter = And(
-            FilterOperator("meeting_id", "=", meeting_id),
-            FilterOperator("number", "=", number),
+        return number not in self._get_used_numbers(meeting_id, number)
+
+    def _get_used_numbers(self, meeting_id: int, prefix: str) -> Set[str]:
+        """
+        Returns the numbers of all motions of the meeting which start with the
+        prefix. They are fetched on first use and cached for the rest of the
+        action.
+        """
+        key = (meeting_id, prefix)
+        self.fetch_used_numbers([key])
+        return self.used_numbers[key]
+
+    def fetch_used_numbers(self, keys: Iterable[Tuple[int, str]]) -> None:
+        """
+        Fetches the used numbers of all uncached pairs of meeting id and prefix
+        with one request. Given numbers can be passed as prefixes to check their
+        uniqueness at once.
+        """
+        missing_keys = set(keys) - set(self.used_numbers)
+        if not missing_keys:
+            return
+        filter = Or(
+            *(
+                And(
+                    FilterOperator("meeting_id", "=", meeting_id),
+                    FilterOperator("number", "%=", f"{prefix}%"),
+                )
+                for meeting_id, prefix in missing_keys
+            )
         )
-        exists = self.datastore.exists(collection=Collection("motion"), filter=filter)
-        return not exists
+        motions = self.datastore.filter(
+            Collection("motion"), filter, ["meeting_id", "number"]
+        )
+        for meeting_id, prefix in missing_keys:
+            # The filter is case insensitive, so the numbers are checked again.
+            self.used_numbers[(meeting_id, prefix)] = {
+                motion["number"]
+                for motion in motions.values()
+                if motion.get("meeting_id") == meeting_id
+                and motion.get("number", "").startswith(prefix)
+            }
+
+    def _add_used_number(self, number: str, meeting_id: int) -> None:
+        for (used_meeting_id, prefix), used_numbers in self.used_numbers.items():
+            if used_meeting_id == meeting_id and number.startswith(prefix):
+                used_numbers.add(number)
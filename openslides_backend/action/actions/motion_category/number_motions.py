@@ -1,5 +1,5 @@
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Dict, List, Optional, Tuple
 
 from ....models.models import Motion, MotionCategory
@@ -34,17 +34,17 @@ class MotionCategoryNumberMotions(UpdateAction):
 
             affected_categories = self.get_affected_categories(instance["id"])
             affected_motions = self.get_affected_motions(affected_categories)
-            non_affected_motion_ids = [
-                id for id in self.mem_motions if id not in affected_motions
-            ]
-            non_affected_numbers = [
-                self.mem_motions[id].get("number") for id in non_affected_motion_ids
-            ]
+            affected_motions_set = set(affected_motions)
+            non_affected_numbers = {
+                motion.get("number")
+                for id, motion in self.mem_motions.items()
+                if id not in affected_motions_set
+            }
 
             # check for missing lead_motion_ids in affected_motions.
             for motion_id in affected_motions:
                 lead_motion_id = self.get_lead_motion_id(motion_id)
-                if lead_motion_id and lead_motion_id not in affected_motions:
+                if lead_motion_id and lead_motion_id not in affected_motions_set:
                     raise ActionException(
                         f'Amendment "{motion_id}" cannot be numbered, because it\'s lead motion ({lead_motion_id}) is not in category {instance["id"]} or any subcategory.'
                     )
@@ -119,16 +119,19 @@ class MotionCategoryNumberMotions(UpdateAction):
         self.mem_categories = result.get(Collection("motion_category"), {})
         self.mem_motions = result.get(Collection("motion"), {})
         self.mem_meetings = {category.get("meeting_id"): meeting}
+        self.mem_numbers: Dict[int, str] = {}
 
     def get_prefix(self, category_id: int) -> str:
         """Get the prefix of a category. If none, get the prefix of the parent if exists."""
-        category = self.mem_categories.get(category_id, {})
-        if category.get("prefix"):
-            return category["prefix"]
-        elif (not category.get("parent_id")) or category_id == self.main_category_id:
-            return ""
-        else:
-            return self.get_prefix(category["parent_id"])
+        while True:
+            category = self.mem_categories.get(category_id, {})
+            if category.get("prefix"):
+                return category["prefix"]
+            elif (
+                not category.get("parent_id")
+            ) or category_id == self.main_category_id:
+                return ""
+            category_id = category["parent_id"]
 
     def get_lead_motion_id(self, motion_id: int) -> Optional[int]:
         """Helper to get the lead_motions_id."""
@@ -136,23 +139,16 @@ class MotionCategoryNumberMotions(UpdateAction):
         return motion.get("lead_motion_id")
 
     def get_affected_categories(self, category_id: int) -> List[int]:
-        """Get all affected categories, inits and calls the helper."""
+        """Get all affected categories, tree walk by level."""
         affected_categories: List[int] = []
-        queue = [category_id]
-        self.helper_affected_categories(queue, affected_categories)
+        queue = deque([category_id])
+        while queue:
+            category_id = queue.popleft()
+            affected_categories.append(category_id)
+            category = self.mem_categories.get(category_id, {})
+            queue.extend(self.sort_category_children(category.get("child_ids", [])))
         return affected_categories
 
-    def helper_affected_categories(
-        self, queue: List[int], aff_categories: List[int]
-    ) -> None:
-        """Fill the aff_categories, tree walk by level."""
-        if not queue:
-            return
-        aff_categories.append(queue[0])
-        category = self.mem_categories.get(queue[0], {})
-        queue.extend(self.sort_category_children(category.get("child_ids", [])))
-        self.helper_affected_categories(queue[1:], aff_categories)
-
     def sort_category_children(self, child_ids: List[int]) -> List[int]:
         """Sort the categories by weight. Important for the helper_affected_categories."""
         weighted_child_ids = []
@@ -182,27 +178,35 @@ class MotionCategoryNumberMotions(UpdateAction):
     def get_number(
         self, motion_id: int, number_value_map: Dict[int, int]
     ) -> Tuple[str, int]:
-        """Get number, uses the number_value_map, two main cases."""
-        lead_motion_id = self.get_lead_motion_id(motion_id)
-        if lead_motion_id:
-            lead_number, _ = self.get_number(lead_motion_id, number_value_map)
-            meeting = self.meeting
-            blank = " " if meeting.get("motions_number_with_blank") else ""
-            amendments_prefix = meeting.get("motions_amendments_prefix", "")
-            number_value_str = str(number_value_map[motion_id]).rjust(
-                meeting.get("motions_number_min_digits", 0), "0"
-            )
-            number = f"{lead_number}{blank}{amendments_prefix}{blank}{number_value_str}"
-        else:
-            motion = self.mem_motions.get(motion_id, {})
-            if motion.get("category_id"):
-                prefix = self.get_prefix(motion["category_id"])
+        """
+        Get number, uses the number_value_map, two main cases. The numbers are
+        memorized, so the chain of lead motions of an amendment is walked only
+        up to the first motion which is already numbered.
+        """
+        chain = []
+        current_id: Optional[int] = motion_id
+        while current_id and current_id not in self.mem_numbers:
+            chain.append(current_id)
+            current_id = self.get_lead_motion_id(current_id)
+
+        meeting = self.meeting
+        blank = " " if meeting.get("motions_number_with_blank") else ""
+        min_digits = meeting.get("motions_number_min_digits", 0)
+        for id in reversed(chain):
+            number_value_str = str(number_value_map[id]).rjust(min_digits, "0")
+            lead_motion_id = self.get_lead_motion_id(id)
+            if lead_motion_id:
+                lead_number = self.mem_numbers[lead_motion_id]
+                amendments_prefix = meeting.get("motions_amendments_prefix", "")
+                number = (
+                    f"{lead_number}{blank}{amendments_prefix}{blank}{number_value_str}"
+                )
             else:
-                prefix = ""
-            meeting = self.meeting
-            blank = " " if meeting.get("motions_number_with_blank") else ""
-            number_value_str = str(number_value_map[motion_id]).rjust(
-                meeting.get("motions_number_min_digits", 0), "0"
-            )
-            number = f"{prefix}{blank}{number_value_str}"
-        return number, number_value_map[motion_id]
+                motion = self.mem_motions.get(id, {})
+                if motion.get("category_id"):
+                    prefix = self.get_prefix(motion["category_id"])
+                else:
+                    prefix = ""
+                number = f"{prefix}{blank}{number_value_str}"
+            self.mem_numbers[id] = number
+        return self.mem_numbers[motion_id], number_value_map[motion_id]
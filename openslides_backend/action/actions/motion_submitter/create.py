@@ -1,16 +1,18 @@
-from typing import Any, Dict
+from typing import Any, Dict, Set, Tuple
 
 from ....models.models import MotionSubmitter
 from ....permissions.permissions import Permissions
 from ....shared.exceptions import ActionException
-from ....shared.filters import And, FilterOperator
+from ....shared.filters import And, FilterOperator, Or
 from ....shared.patterns import Collection, FullQualifiedId
+from ...action import original_instances
 from ...generics.create import CreateAction
 from ...mixins.create_action_with_inferred_meeting import (
     CreateActionWithInferredMeetingMixin,
 )
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ...util.typing import ActionData
 
 
 @register_action("motion_submitter.create")
@@ -27,6 +29,34 @@ class MotionSubmitterCreateAction(CreateActionWithInferredMeetingMixin, CreateAc
 
     relation_field_for_meeting = "motion_id"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.existing_pairs: Set[Tuple[int, int]] = set()
+
+    @original_instances
+    def get_updated_instances(self, action_data: ActionData) -> ActionData:
+        """
+        Fetches all (user_id, motion_id) pairs of the action data which are already
+        in the datastore with one filter request.
+        """
+        action_data = list(action_data)
+        if action_data:
+            filter = Or(
+                *(
+                    And(
+                        FilterOperator("user_id", "=", instance["user_id"]),
+                        FilterOperator("motion_id", "=", instance["motion_id"]),
+                    )
+                    for instance in action_data
+                )
+            )
+            submitters = self.datastore.filter(
+                self.model.collection, filter, ["user_id", "motion_id"]
+            )
+            for submitter in submitters.values():
+                self.existing_pairs.add((submitter["user_id"], submitter["motion_id"]))
+        yield from action_data
+
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         """
         Check if motion and user belong to the same meeting if the user is a temporary user.
@@ -43,11 +73,6 @@ class MotionSubmitterCreateAction(CreateActionWithInferredMeetingMixin, CreateAc
             )
 
         # check, if (user_id, motion_id) already in the datastore.
-        filter = And(
-            FilterOperator("user_id", "=", instance["user_id"]),
-            FilterOperator("motion_id", "=", instance["motion_id"]),
-        )
-        exists = self.datastore.exists(collection=self.model.collection, filter=filter)
-        if exists:
+        if (instance["user_id"], instance["motion_id"]) in self.existing_pairs:
             raise ActionException("(user_id, motion_id) must be unique.")
         return instance
@@ -4,6 +4,7 @@ from ....models.models import MotionWorkflow
 from ....permissions.permissions import Permissions
 from ....shared.exceptions import ActionException
 from ....shared.patterns import Collection, FullQualifiedId
+from ....shared.typing import DeletedModel
 from ...generics.delete import DeleteAction
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
@@ -21,15 +22,23 @@ class MotionWorkflowDeleteAction(DeleteAction):
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         """
-        check if is default or last workflow of meeting.
+        check if is default or last workflow of meeting. This is skipped if the
+        meeting is deleted as well.
         """
         workflow = self.datastore.fetch_model(
             FullQualifiedId(Collection("motion_workflow"), instance["id"]),
             ["meeting_id"],
             lock_result=True,
         )
+        meeting_fqid = FullQualifiedId(
+            Collection("meeting"), int(workflow["meeting_id"])
+        )
+        if isinstance(
+            self.datastore.additional_relation_models.get(meeting_fqid), DeletedModel
+        ):
+            return instance
         meeting = self.datastore.fetch_model(
-            FullQualifiedId(Collection("meeting"), int(workflow["meeting_id"])),
+            meeting_fqid,
             [
                 "motions_default_workflow_id",
                 "motions_default_amendment_workflow_id",
@@ -1,6 +1,9 @@
+from decimal import Decimal
 from typing import Any, Dict
 
 from ....models.models import Option
+from ....services.datastore.commands import GetManyRequest
+from ....shared.patterns import Collection, FullQualifiedId
 from ...generics.update import UpdateAction
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
@@ -9,7 +12,8 @@ from ...util.register import register_action
 @register_action("option.set_auto_fields", internal=True)
 class OptionSetAutoFields(UpdateAction):
     """
-    Action to calculate auto fields for options (yes, no, abstain)
+    Action to calculate auto fields for options (yes, no, abstain). If no
+    values are given, they are recounted from the votes of the option.
     """
 
     model = Option()
@@ -22,6 +26,29 @@ class OptionSetAutoFields(UpdateAction):
             instance.get("yes") or instance.get("no") or instance.get("abstain")
         )
         if not set_without_calc:
-            # TODO in this case we should autogenerate the fields.
-            raise NotImplementedError
+            instance.update(self.count_votes(instance["id"]))
         return instance
+
+    def count_votes(self, option_id: int) -> Dict[str, str]:
+        option = self.datastore.get(
+            FullQualifiedId(self.model.collection, option_id), ["vote_ids"]
+        )
+        gmr = GetManyRequest(
+            Collection("vote"), option.get("vote_ids", []), ["weight", "value"]
+        )
+        result = self.datastore.get_many([gmr])
+        votes = result.get(Collection("vote"), {})
+
+        totals = {
+            "Y": Decimal("0.000000"),
+            "N": Decimal("0.000000"),
+            "A": Decimal("0.000000"),
+        }
+        for vote in votes.values():
+            if vote.get("value", "") in totals:
+                totals[vote["value"]] += Decimal(vote.get("weight", "0"))
+        return {
+            "yes": str(totals["Y"]),
+            "no": str(totals["N"]),
+            "abstain": str(totals["A"]),
+        }
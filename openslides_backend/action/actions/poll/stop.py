@@ -6,6 +6,7 @@ from ....shared.patterns import Collection, FullQualifiedId
 from ...generics.update import UpdateAction
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ..option.set_auto_fields import OptionSetAutoFields
 from ..projector_countdown.mixins import CountdownControl
 
 
@@ -21,7 +22,7 @@ class PollStopAction(CountdownControl, UpdateAction):
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         poll = self.datastore.get(
             FullQualifiedId(self.model.collection, instance["id"]),
-            ["state", "meeting_id"],
+            ["state", "meeting_id", "type", "option_ids", "global_option_id"],
         )
         if poll.get("state") != Poll.STATE_STARTED:
             raise ActionException(
@@ -29,6 +30,17 @@ class PollStopAction(CountdownControl, UpdateAction):
             )
         instance["state"] = Poll.STATE_FINISHED
 
+        # poll.vote tallies the votes incrementally, so the final results are
+        # recounted from the votes.
+        if poll.get("type") != Poll.TYPE_ANALOG:
+            option_ids = list(poll.get("option_ids", []))
+            if poll.get("global_option_id"):
+                option_ids.append(poll["global_option_id"])
+            if option_ids:
+                self.execute_other_action(
+                    OptionSetAutoFields, [{"id": id_} for id_ in option_ids]
+                )
+
         # reset countdown given by meeting
         meeting = self.datastore.get(
             FullQualifiedId(Collection("meeting"), poll["meeting_id"]),
@@ -1,22 +1,48 @@
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from ....models.models import Poll
 from ....services.datastore.commands import GetManyRequest
-from ....shared.exceptions import ActionException
+from ....shared.exceptions import ActionException, DatastoreException
 from ....shared.patterns import Collection, FullQualifiedId
 from ....shared.schema import required_id_schema
+from ...action import original_instances
 from ...generics.update import UpdateAction
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ...util.typing import ActionData
 from ..option.set_auto_fields import OptionSetAutoFields
 from ..vote.create import VoteCreate
 
+# Maps the vote values to the option fields which hold their totals.
+OPTION_TOTAL_FIELDS = {"Y": "yes", "N": "no", "A": "abstain"}
+
+POLL_FIELDS = [
+    "type",
+    "option_ids",
+    "meeting_id",
+    "global_option_id",
+    "global_yes",
+    "global_no",
+    "global_abstain",
+    "pollmethod",
+    "voted_ids",
+    "entitled_group_ids",
+    "state",
+    "votesvalid",
+    "min_votes_amount",
+    "max_votes_amount",
+]
+
 
 @register_action("poll.vote")
 class PollVote(UpdateAction):
     """
     Action to vote for a poll.
+
+    All instances are processed as one batch: The polls, voters and options are
+    fetched once for all instances, and all votes and option totals are created
+    together after the last instance.
     """
 
     model = Poll()
@@ -30,8 +56,42 @@ class PollVote(UpdateAction):
         },
     )
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.polls: Dict[int, Dict[str, Any]] = {}
+        self.users: Dict[int, Dict[str, Any]] = {}
+        self.option_totals: Dict[int, Dict[str, Decimal]] = {}
+        self.updated_option_ids: List[int] = []
+        self.vote_action_data: List[Dict[str, Any]] = []
+
+    @original_instances
+    def get_updated_instances(self, action_data: ActionData) -> ActionData:
+        action_data = list(action_data)
+        self.polls = self.fetch_polls([instance["id"] for instance in action_data])
+        self.users = self.fetch_users([instance["user_id"] for instance in action_data])
+        self.fetch_option_totals()
+
+        yield from action_data
+
+        if self.vote_action_data:
+            self.execute_other_action(VoteCreate, self.vote_action_data)
+        if self.updated_option_ids:
+            self.execute_other_action(
+                OptionSetAutoFields,
+                [
+                    {
+                        "id": option_id,
+                        **{
+                            field: str(total)
+                            for field, total in self.option_totals[option_id].items()
+                        },
+                    }
+                    for option_id in self.updated_option_ids
+                ],
+            )
+
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
-        self.poll = self.fetch_poll(instance["id"])
+        self.poll = self.polls[instance["id"]]
         value = instance.pop("value")
         user_id = instance.pop("user_id")
 
@@ -46,8 +106,8 @@ class PollVote(UpdateAction):
         # check for double vote
         if user_id in self.poll.get("voted_ids", []):
             raise ActionException("Only one vote per poll per user allowed.")
-        instance["voted_ids"] = self.poll.get("voted_ids", [])
-        instance["voted_ids"].append(user_id)
+        instance["voted_ids"] = self.poll.get("voted_ids", []) + [user_id]
+        self.poll["voted_ids"] = instance["voted_ids"]
         instance["votescast"] = f"{len(instance['voted_ids'])}.000000"
 
         # check for analog type
@@ -68,42 +128,63 @@ class PollVote(UpdateAction):
 
         return instance
 
-    def fetch_poll(self, poll_id: int) -> Dict[str, Any]:
-        return self.datastore.get(
-            FullQualifiedId(self.model.collection, poll_id),
-            [
-                "type",
-                "option_ids",
-                "meeting_id",
-                "global_option_id",
-                "global_yes",
-                "global_no",
-                "global_abstain",
-                "pollmethod",
-                "voted_ids",
-                "entitled_group_ids",
-                "state",
-                "votesvalid",
-                "min_votes_amount",
-                "max_votes_amount",
-            ],
+    def fetch_polls(self, poll_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        gmr = GetManyRequest(self.model.collection, list(set(poll_ids)), POLL_FIELDS)
+        result = self.datastore.get_many([gmr])
+        polls = result.get(self.model.collection, {})
+        for poll_id in poll_ids:
+            if poll_id not in polls:
+                raise DatastoreException(
+                    f"Model '{FullQualifiedId(self.model.collection, poll_id)}' does not exist."
+                )
+        return polls
+
+    def fetch_users(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetches the groups, presence and vote weights of all voters for all
+        meetings of the polls.
+        """
+        mapped_fields = ["is_present_in_meeting_ids", "default_vote_weight"]
+        meeting_ids = set(poll.get("meeting_id") for poll in self.polls.values())
+        meeting_ids.discard(None)
+        for meeting_id in meeting_ids:
+            mapped_fields += [f"group_${meeting_id}_ids", f"vote_weight_${meeting_id}"]
+        gmr = GetManyRequest(Collection("user"), list(set(user_ids)), mapped_fields)
+        result = self.datastore.get_many([gmr])
+        return result.get(Collection("user"), {})
+
+    def fetch_option_totals(self) -> None:
+        """
+        Fetches the totals of all options of the polls. They are locked, so
+        concurrent votes are retried instead of overwriting each other.
+        poll.stop recounts them from the votes.
+        """
+        option_ids: Set[int] = set()
+        for poll in self.polls.values():
+            option_ids.update(poll.get("option_ids", []))
+            if poll.get("global_option_id"):
+                option_ids.add(poll["global_option_id"])
+        gmr = GetManyRequest(
+            Collection("option"), list(option_ids), list(OPTION_TOTAL_FIELDS.values())
         )
+        result = self.datastore.get_many([gmr], lock_result=True)
+        for option_id, option in result.get(Collection("option"), {}).items():
+            self.option_totals[option_id] = {
+                field: Decimal(option.get(field) or "0.000000")
+                for field in OPTION_TOTAL_FIELDS.values()
+            }
 
     def check_user_entitled_groups(self, user_id: int) -> None:
         group_ids = self.poll.get("entitled_group_ids", [])
         meeting_id = self.poll["meeting_id"]
-        user = self.datastore.get(
-            FullQualifiedId(Collection("user"), user_id), [f"group_${meeting_id}_ids"]
-        )
+        user = self.users.get(user_id, {})
         for id_ in user.get(f"group_${meeting_id}_ids", []):
             if id_ in group_ids:
                 return
         raise ActionException("User is not allowed to vote.")
 
     def check_user_is_present_in_meeting(self, user_id: int) -> None:
-        user = self.datastore.get(
-            FullQualifiedId(Collection("user"), user_id), ["is_present_in_meeting_ids"]
-        )
+        user = self.users.get(user_id, {})
         if self.poll["meeting_id"] not in user.get("is_present_in_meeting_ids", []):
             raise ActionException("User is not present in the meeting.")
 
@@ -140,13 +221,14 @@ class PollVote(UpdateAction):
         action_data: List[Dict[str, Any]] = []
         self._handle_value_keys(value, user_id, action_data)
         if action_data:
-            self.execute_other_action(VoteCreate, action_data)
+            self.vote_action_data.extend(action_data)
             total_votes = 0
             for data in action_data:
                 self.update_option(data["option_id"], data["value"], data["weight"])
-                self.update_votes_valid(instance, data["weight"])
                 total_votes += 1
             self.check_total_votes(total_votes)
+            # the weight of the voter counts once, regardless of the options
+            self.update_votes_valid(instance, action_data[0]["weight"])
 
     def _handle_value_keys(
         self,
@@ -180,10 +262,7 @@ class PollVote(UpdateAction):
     def get_vote_weigth(self, user_id: int) -> str:
         meeting_id = self.poll["meeting_id"]
         field_id = f"vote_weight_${meeting_id}"
-        user = self.datastore.get(
-            FullQualifiedId(Collection("user"), user_id),
-            [field_id, "default_vote_weight"],
-        )
+        user = self.users.get(user_id, {})
         vote_weight = user.get(field_id)
         if vote_weight is None:
             vote_weight = user.get("default_vote_weight")
@@ -216,7 +295,7 @@ class PollVote(UpdateAction):
                         "1.000000",
                     )
                 ]
-                self.execute_other_action(VoteCreate, action_data)
+                self.vote_action_data.extend(action_data)
                 self.update_option(
                     action_data[0]["option_id"],
                     action_data[0]["value"],
@@ -227,44 +306,20 @@ class PollVote(UpdateAction):
     def update_option(
         self, option_id: int, extra_value: str, extra_weight: str
     ) -> None:
-        option = self.datastore.get(
-            FullQualifiedId(Collection("option"), option_id), ["vote_ids"]
-        )
-        vote_ids = option.get("vote_ids", [])
-        gmr = GetManyRequest(Collection("vote"), vote_ids, ["weight", "value"])
-        result = self.datastore.get_many([gmr])
-        votes = result.get(Collection("vote"), {})
-
-        yes = Decimal("0.000000")
-        no = Decimal("0.000000")
-        abstain = Decimal("0.000000")
-
-        for key in votes:
-            vote = votes[key]
-            if vote.get("value", "") == "Y":
-                yes += Decimal(vote.get("weight", "0"))
-            elif vote.get("value", "") == "N":
-                no += Decimal(vote.get("weight", "0"))
-            elif vote.get("value", "") == "A":
-                abstain += Decimal(vote.get("weight", "0"))
-
-        if extra_value == "Y":
-            yes += Decimal(extra_weight)
-        elif extra_value == "N":
-            no += Decimal(extra_weight)
-        elif extra_value == "A":
-            abstain += Decimal(extra_weight)
-
-        action_data = [
-            {"id": option_id, "yes": str(yes), "no": str(no), "abstain": str(abstain)}
-        ]
-        self.execute_other_action(OptionSetAutoFields, action_data)
+        """
+        Adds the weight of the new vote to the totals of the option.
+        """
+        totals = self.option_totals[option_id]
+        if extra_value in OPTION_TOTAL_FIELDS:
+            totals[OPTION_TOTAL_FIELDS[extra_value]] += Decimal(extra_weight)
+        if option_id not in self.updated_option_ids:
+            self.updated_option_ids.append(option_id)
 
     def update_votes_valid(self, instance: Dict[str, Any], extra_weight: str) -> None:
         votesvalid = Decimal(self.poll.get("votesvalid", "0.000000")) + Decimal(
             extra_weight
         )
-        instance["votesvalid"] = str(votesvalid)
+        instance["votesvalid"] = self.poll["votesvalid"] = str(votesvalid)
 
     def _get_vote_create_action_data(
         self,
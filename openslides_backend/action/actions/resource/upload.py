@@ -1,4 +1,3 @@
-import base64
 import mimetypes
 from typing import Any, Dict
 
@@ -7,6 +6,7 @@ from ....shared.exceptions import ActionException
 from ....shared.filters import And, FilterOperator
 from ...action import original_instances
 from ...generics.create import CreateAction
+from ...util.base64_file import get_decoded_size
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
 from ...util.typing import ActionData
@@ -35,8 +35,7 @@ class MediafileUploadAction(CreateAction):
         instance["mimetype"] = mimetypes.guess_type(filename_)[0]
         if instance["mimetype"] is None:
             raise ActionException(f"Cannot guess mimetype for {filename_}.")
-        decoded_file = base64.b64decode(file_)
-        instance["filesize"] = len(decoded_file)
+        instance["filesize"] = get_decoded_size(file_)
         id_ = instance["id"]
         mimetype_ = instance["mimetype"]
         self.media.upload_resource(file_, id_, mimetype_)
@@ -1,6 +1,5 @@
 from typing import Any, Dict
 
-from openslides_backend.permissions.permission_helper import has_perm
 from openslides_backend.permissions.permissions import Permissions
 
 from ....models.models import User
@@ -49,8 +48,7 @@ class UserSetPasswordSelf(UpdateAction):
         ).get("meeting_id")
 
         if meeting_id:
-            if has_perm(
-                self.datastore,
+            if self.permission_resolver.has_perm(
                 self.user_id,
                 Permissions.User.CAN_CHANGE_OWN_PASSWORD,
                 meeting_id,
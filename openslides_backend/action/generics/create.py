@@ -1,10 +1,11 @@
-from typing import Any, Dict, Iterable, Optional
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
 
 from ...shared.interfaces.event import EventType
 from ...shared.interfaces.write_request import WriteRequest
 from ...shared.patterns import FullQualifiedId
 from ..action import Action
-from ..util.typing import ActionResultElement
+from ..util.typing import ActionData, ActionResultElement, ActionResults
 
 
 class CreateAction(Action):
@@ -12,14 +13,17 @@ class CreateAction(Action):
     Generic create action.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.reserved_ids: Deque[int] = deque()
+
     def base_update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         # Primary instance manipulation for defaults and extra fields.
         instance = self.set_defaults(instance)
         instance = self.validate_fields(instance)
 
         # Fetch new id to have it available in update_instance method
-        new_id = self.datastore.reserve_id(collection=self.model.collection)
-        instance["id"] = new_id
+        instance["id"] = self.get_new_id()
 
         instance = self.update_instance(instance)
         self.apply_instance(instance)
@@ -27,12 +31,36 @@ class CreateAction(Action):
 
         return instance
 
+    def perform(
+        self, action_data: ActionData, user_id: int, internal: bool = False
+    ) -> Tuple[Optional[WriteRequest], ActionResults]:
+        try:
+            return super().perform(action_data, user_id, internal)
+        finally:
+            # give back the ids which were not used because of an error
+            if self.reserved_ids:
+                self.datastore.release_ids(self.model.collection, self.reserved_ids)
+                self.reserved_ids.clear()
+
+    def reserve_ids(self, amount: int) -> None:
+        """
+        Reserves the ids for the next instances with one request to the datastore.
+        """
+        self.reserved_ids.extend(
+            self.datastore.reserve_ids(collection=self.model.collection, amount=amount)
+        )
+
+    def get_new_id(self) -> int:
+        """
+        Returns the next previously reserved id or reserves a new one.
+        """
+        if self.reserved_ids:
+            return self.reserved_ids.popleft()
+        return self.datastore.reserve_id(collection=self.model.collection)
+
     def set_defaults(self, instance: Dict[str, Any]) -> Dict[str, Any]:
-        for field in self.model.get_fields():
-            if (
-                field.own_field_name not in instance.keys()
-                and field.default is not None
-            ):
+        for field in self.model.default_fields:
+            if field.own_field_name not in instance:
                 instance[field.own_field_name] = field.default
         return instance
 
@@ -49,5 +77,5 @@ class CreateAction(Action):
     def create_action_result_element(
         self, instance: Dict[str, Any]
     ) -> Optional[ActionResultElement]:
-        """ Returns the newly created id. """
+        """Returns the newly created id."""
         return {"id": instance["id"]}
@@ -1,10 +1,7 @@
-from typing import Any, Dict, Iterable, List, Tuple, Type
+from typing import Any, Dict, Iterable, List, Type
 
-from ...models.fields import (
-    BaseGenericRelationField,
-    BaseTemplateRelationField,
-    OnDelete,
-)
+from ...models.base import model_registry
+from ...models.fields import BaseTemplateRelationField, OnDelete
 from ...shared.exceptions import ActionException, ProtectedModelsException
 from ...shared.interfaces.event import EventType
 from ...shared.interfaces.write_request import WriteRequest
@@ -12,7 +9,6 @@ from ...shared.patterns import FullQualifiedId, transform_to_fqids
 from ...shared.typing import DeletedModel
 from ..action import Action
 from ..util.actions_map import actions_map
-from ..util.typing import ActionData
 
 
 class DeleteAction(Action):
@@ -29,110 +25,118 @@ class DeleteAction(Action):
         # Update instance (by default this does nothing)
         instance = self.update_instance(instance)
 
-        # Fetch db instance with all relevant fields
+        # Gather all models to be deleted and the delete actions for them
         this_fqid = FullQualifiedId(self.model.collection, instance["id"])
-        relevant_fields = [
-            field.own_field_name
-            for field in self.model.get_relation_fields()
-            if field.on_delete != OnDelete.SET_NULL
-        ]
-        db_instance = self.datastore.fetch_model(
-            fqid=this_fqid,
-            mapped_fields=relevant_fields,
-            lock_result=True,
-        )
+        delete_actions = self.plan_cascade(this_fqid)
 
         # Update instance and set relation fields to None.
-        # Gather all delete actions with action data and also all models to be deleted
-        delete_actions: List[Tuple[Type[Action], ActionData]] = []
-        self.datastore.update_additional_models(this_fqid, DeletedModel())
         for field in self.model.get_relation_fields():
-            # Check on_delete.
             if field.on_delete != OnDelete.SET_NULL:
-                if isinstance(field, BaseTemplateRelationField):
-                    # We currently do not support such template fields.
-                    raise NotImplementedError
-
-                # Extract all foreign keys as fqids from the model
-                foreign_fqids = db_instance.get(field.own_field_name, [])
-                if not isinstance(foreign_fqids, list):
-                    foreign_fqids = [foreign_fqids]
-                if not isinstance(field, BaseGenericRelationField):
-                    assert len(field.to) == 1
-                    foreign_fqids = [
-                        FullQualifiedId(field.get_target_collection(), id)
-                        for id in foreign_fqids
-                    ]
-
-                if field.on_delete == OnDelete.PROTECT:
-                    protected_fqids = [
-                        fqid
-                        for fqid in foreign_fqids
-                        if not isinstance(
-                            self.datastore.additional_relation_models.get(fqid),
-                            DeletedModel,
-                        )
-                    ]
-                    if protected_fqids:
-                        raise ProtectedModelsException(this_fqid, protected_fqids)
-                else:
-                    # field.on_delete == OnDelete.CASCADE
+                continue
+            if isinstance(field, BaseTemplateRelationField):
+                template_field_name = field.get_template_field_name()
+                db_instance = self.datastore.fetch_model(
+                    fqid=this_fqid,
+                    mapped_fields=[template_field_name],
+                    lock_result=True,
+                )
+                for replacement in db_instance.get(template_field_name, []):
+                    structured_field_name = field.get_structured_field_name(replacement)
+                    instance[structured_field_name] = None
+            else:
+                instance[field.own_field_name] = None
+
+        # Execute all previously gathered delete actions
+        # catch all protected models exception to gather all protected fqids
+        all_protected_fqids: List[FullQualifiedId] = []
+        for delete_action_class, delete_action_data in delete_actions.items():
+            try:
+                self.execute_other_action(delete_action_class, delete_action_data)
+            except ProtectedModelsException as e:
+                all_protected_fqids.extend(e.fqids)
+
+        if all_protected_fqids:
+            raise ProtectedModelsException(this_fqid, all_protected_fqids)
+
+        return instance
+
+    def plan_cascade(
+        self, fqid: FullQualifiedId
+    ) -> Dict[Type[Action], List[Dict[str, Any]]]:
+        """
+        Walks the CASCADE and PROTECT relations of the given model level by level.
+        All models of one level are fetched with one request. The full models are
+        fetched since the relation handling of their delete actions needs all
+        relation fields anyway, so it is served from the cache. The cascaded models
+        are marked as deleted, so they do not protect other models anymore and
+        their own delete actions do not cascade again.
+
+        Returns the action data for the delete actions of all cascaded models
+        grouped by action class. Raises a ProtectedModelsException if a protected
+        model is not deleted as well.
+        """
+        delete_actions: Dict[Type[Action], List[Dict[str, Any]]] = {}
+        protected_fqids: List[FullQualifiedId] = []
+        self.datastore.update_additional_models(fqid, DeletedModel())
+        level = [fqid]
+        while level:
+            db_instances = self.datastore.fetch_models(
+                level, mapped_fields=[], lock_result=True
+            )
+            next_level: List[FullQualifiedId] = []
+            for level_fqid in level:
+                model = model_registry[level_fqid.collection]
+                for field in model.on_delete_relation_fields:
+                    if isinstance(field, BaseTemplateRelationField):
+                        # We currently do not support such template fields.
+                        raise NotImplementedError
+
                     # Extract all foreign keys as fqids from the model
-                    value = db_instance.get(field.own_field_name, [])
                     foreign_fqids = transform_to_fqids(
-                        value, field.get_target_collection()
+                        db_instances[level_fqid].get(field.own_field_name),
+                        field.get_target_collection(),
                     )
+                    if field.on_delete == OnDelete.PROTECT:
+                        protected_fqids.extend(foreign_fqids)
+                        continue
 
-                    # Execute the delete action for all fqids
-                    for fqid in foreign_fqids:
+                    # field.on_delete == OnDelete.CASCADE
+                    for foreign_fqid in foreign_fqids:
                         if isinstance(
-                            self.datastore.additional_relation_models.get(fqid),
+                            self.datastore.additional_relation_models.get(foreign_fqid),
                             DeletedModel,
                         ):
                             # skip models that are already deleted
                             continue
                         delete_action_class = actions_map.get(
-                            f"{str(fqid.collection)}.delete"
+                            f"{str(foreign_fqid.collection)}.delete"
                         )
                         if not delete_action_class:
                             raise ActionException(
-                                f"Can't cascade the delete action to {str(fqid.collection)} "
+                                f"Can't cascade the delete action to {str(foreign_fqid.collection)} "
                                 "since no delete action was found."
                             )
                         # Assume that the delete action uses the standard action data
-                        action_data = [{"id": fqid.id}]
-                        delete_actions.append((delete_action_class, action_data))
-                        self.datastore.update_additional_models(fqid, DeletedModel())
-            else:
-                # field.on_delete == OnDelete.SET_NULL
-                if isinstance(field, BaseTemplateRelationField):
-                    template_field_name = field.get_template_field_name()
-                    db_instance = self.datastore.fetch_model(
-                        fqid=FullQualifiedId(self.model.collection, instance["id"]),
-                        mapped_fields=[template_field_name],
-                        lock_result=True,
-                    )
-                    for replacement in db_instance.get(template_field_name, []):
-                        structured_field_name = field.get_structured_field_name(
-                            replacement
+                        delete_actions.setdefault(delete_action_class, []).append(
+                            {"id": foreign_fqid.id}
                         )
-                        instance[structured_field_name] = None
-                else:
-                    instance[field.own_field_name] = None
-
-        # Add additional relation models and execute all previously gathered delete actions
-        # catch all protected models exception to gather all protected fqids
-        all_protected_fqids: List[FullQualifiedId] = []
-        for delete_action_class, delete_action_data in delete_actions:
-            try:
-                self.execute_other_action(delete_action_class, delete_action_data)
-            except ProtectedModelsException as e:
-                all_protected_fqids.extend(e.fqids)
-
-        if all_protected_fqids:
-            raise ProtectedModelsException(this_fqid, all_protected_fqids)
+                        self.datastore.update_additional_models(
+                            foreign_fqid, DeletedModel()
+                        )
+                        next_level.append(foreign_fqid)
+            level = next_level
 
-        return instance
+        protected_fqids = [
+            protected_fqid
+            for protected_fqid in dict.fromkeys(protected_fqids)
+            if not isinstance(
+                self.datastore.additional_relation_models.get(protected_fqid),
+                DeletedModel,
+            )
+        ]
+        if protected_fqids:
+            raise ProtectedModelsException(fqid, protected_fqids)
+        return delete_actions
 
     def create_write_requests(self, instance: Dict[str, Any]) -> Iterable[WriteRequest]:
         fqid = FullQualifiedId(self.model.collection, instance["id"])
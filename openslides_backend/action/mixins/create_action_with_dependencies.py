@@ -1,5 +1,6 @@
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Type
 
+from ...shared.interfaces.write_request import WriteRequest
 from ..action import Action
 from ..generics.create import CreateAction
 
@@ -7,6 +8,8 @@ from ..generics.create import CreateAction
 class CreateActionWithDependencies(CreateAction):
     """
     A CreateAction which has dependant actions which should be executed for each item.
+    The action data of all items is collected, so every dependent action is executed
+    only once for all items before the write requests are merged.
     """
 
     dependencies: List[Type[Action]]
@@ -14,6 +17,12 @@ class CreateActionWithDependencies(CreateAction):
     A list of actions which should be executed together with this create action.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.dependent_action_data: Dict[Type[Action], List[Dict[str, Any]]] = {
+            ActionClass: [] for ActionClass in self.dependencies
+        }
+
     def base_update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         instance = super().base_update_instance(instance)
         self.apply_instance(instance)
@@ -35,9 +44,15 @@ class CreateActionWithDependencies(CreateAction):
                 self, special_action_data_method_name, self.get_dependent_action_data
             )
             action_data = action_data_method(instance, ActionClass)
-            self.execute_other_action(ActionClass, action_data)
+            self.dependent_action_data[ActionClass].extend(action_data)
         return instance
 
+    def process_write_requests(self) -> Optional[WriteRequest]:
+        for ActionClass, action_data in self.dependent_action_data.items():
+            if action_data:
+                self.execute_other_action(ActionClass, action_data)
+        return super().process_write_requests()
+
     def check_dependant_action_execution(
         self, instance: Dict[str, Any], CreateActionClass: Type[Action]
     ) -> bool:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import fastjsonschema
 
@@ -45,13 +45,13 @@ class TreeSortMixin(BaseAction):
         all_model_ids = set(db_instances.keys())
 
         # Setup initial node using a fake root node.
-        fake_root: Dict[str, Any] = {"id": None, "children": []}
-        fake_root["children"].extend(nodes)  # This will prevent mutating the nodes.
+        fake_root: Dict[str, Any] = {"id": None, "children": nodes}
 
-        # The stack where all nodes to check are saved. Invariant: Each node
-        # must be a dict with an id, a parent id (may be None for the root
-        # layer) and a weight.
-        nodes_to_check = [fake_root]
+        # The stack where all nodes to check are saved together with the id of
+        # their parent (None for the root layer). The nodes of the request data
+        # are not changed, so the action data can be used again if the action is
+        # retried.
+        nodes_to_check: List[Tuple[Dict[str, Any], Optional[int]]] = [(fake_root, None)]
 
         # Traverse and check if every id is given, valid and there are no duplicate ids.
         ids_found: Set[int] = set()  # Set to save all found ids.
@@ -66,7 +66,7 @@ class TreeSortMixin(BaseAction):
 
         # Now walk through the tree.
         while len(nodes_to_check) > 0:
-            node = nodes_to_check.pop()
+            node, parent_id = nodes_to_check.pop()
             id = node["id"]
 
             if id is not None:  # Exclude the fake_root
@@ -76,7 +76,6 @@ class TreeSortMixin(BaseAction):
                 nodes_to_update[id]["id"] = id
                 nodes_to_update[id][children_ids_key] = []
                 nodes_to_update[id][weight_key] = weight
-                parent_id = node.get(parent_id_key)
                 nodes_to_update[id][parent_id_key] = parent_id
                 if parent_id is not None:
                     nodes_to_update[parent_id][children_ids_key].append(id)
@@ -90,13 +89,10 @@ class TreeSortMixin(BaseAction):
 
             # Add children if exist.
             if node.get("children"):
-                node[
-                    "children"
-                ].reverse()  # Use reverse() because we use pop() some lines, so this is LIFO and not FIFO.
-                for child in node["children"]:
+                # Use reversed() because we use pop() some lines, so this is LIFO and not FIFO.
+                for child in reversed(node["children"]):
                     validate_sort_node(child)
-                    child[parent_id_key] = id
-                    nodes_to_check.append(child)
+                    nodes_to_check.append((child, id))
 
         # Check if all ids are used.
         if len(all_model_ids) != len(ids_found):
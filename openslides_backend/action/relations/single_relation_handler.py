@@ -143,14 +143,15 @@ class SingleRelationHandler:
 
             # acquire all related models with the related fields
             rels = defaultdict(dict)
+            related_models = self.datastore.fetch_models(
+                changed_fqids_per_collection[collection],
+                [related_name],
+                get_deleted_models=DeletedModelsBehaviour.NO_DELETED,
+                lock_result=True,
+                exception=False,
+            )
             for fqid in changed_fqids_per_collection[collection]:
-                related_model = self.datastore.fetch_model(
-                    fqid,
-                    [related_name],
-                    get_deleted_models=DeletedModelsBehaviour.NO_DELETED,
-                    lock_result=True,
-                    exception=False,
-                )
+                related_model = related_models.get(fqid, {})
                 # again, we transform everything to lists of fqids
                 rels[fqid][related_name] = transform_to_fqids(
                     related_model.get(related_name), self.model.collection
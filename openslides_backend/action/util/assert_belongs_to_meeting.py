@@ -1,9 +1,9 @@
-from typing import List, Union
+from typing import Dict, List, Union
 
 from ...services.datastore.deleted_models_behaviour import InstanceAdditionalBehaviour
 from ...services.datastore.interface import DatastoreService
 from ...shared.exceptions import ActionException
-from ...shared.patterns import FullQualifiedId
+from ...shared.patterns import Collection, FullQualifiedId
 
 
 def assert_belongs_to_meeting(
@@ -14,31 +14,52 @@ def assert_belongs_to_meeting(
     if not isinstance(fqids, list):
         fqids = [fqids]
 
-    errors: List[str] = []
+    errors = get_fqids_not_belonging_to_meeting(datastore, fqids, meeting_id)
+    if errors:
+        raise ActionException(
+            f"The following models do not belong to meeting {meeting_id}: {[str(fqid) for fqid in errors]}"
+        )
+
+
+def get_fqids_not_belonging_to_meeting(
+    datastore: DatastoreService, fqids: List[FullQualifiedId], meeting_id: int
+) -> List[FullQualifiedId]:
+    """
+    Returns all given fqids whose models do not belong to the given meeting. All
+    models are fetched at once, grouped by collection, so the number of
+    requested collections does not depend on the number of fqids.
+    """
+    mapped_fields: Dict[Collection, List[str]] = {}
+    for fqid in fqids:
+        if fqid.collection.collection == "meeting":
+            continue
+        if fqid.collection not in mapped_fields:
+            mapped_fields[fqid.collection] = ["meeting_id"]
+            if fqid.collection.collection == "user":
+                mapped_fields[fqid.collection] += [
+                    "guest_meeting_ids",
+                    f"group_${meeting_id}_ids",
+                ]
+
+    instances = datastore.fetch_models(
+        [fqid for fqid in fqids if fqid.collection in mapped_fields],
+        mapped_fields,
+        db_additional_relevance=InstanceAdditionalBehaviour.ADDITIONAL_BEFORE_DBINST,
+        exception=False,
+    )
+
+    errors: List[FullQualifiedId] = []
     for fqid in fqids:
         if fqid.collection.collection == "meeting":
             if fqid.id != meeting_id:
-                errors.append(str(fqid))
+                errors.append(fqid)
             continue
-        mapped_fields = ["meeting_id"]
-        if fqid.collection.collection == "user":
-            mapped_fields += ["guest_meeting_ids", f"group_${meeting_id}_ids"]
-
-        instance = datastore.fetch_model(
-            fqid,
-            mapped_fields,
-            db_additional_relevance=InstanceAdditionalBehaviour.ADDITIONAL_BEFORE_DBINST,
-            exception=False,
-        )
+        instance = instances.get(fqid, {})
         if instance.get("meeting_id") != meeting_id:
             if fqid.collection.collection == "user" and (
                 meeting_id in instance.get("guest_meeting_ids", [])
                 or instance.get(f"group_${meeting_id}_ids")
             ):
                 continue
-            errors.append(str(fqid))
-
-    if errors:
-        raise ActionException(
-            f"The following models do not belong to meeting {meeting_id}: {errors}"
-        )
+            errors.append(fqid)
+    return errors
@@ -0,0 +1,84 @@
+import base64
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedReader, BytesIO, RawIOBase
+from typing import BinaryIO, cast
+
+from ...shared.exceptions import ActionException
+
+WHITESPACE = " \t\r\n"
+
+
+def get_decoded_size(file: str) -> int:
+    """
+    Returns the size of the decoded content of the base64 string without decoding
+    it. Whitespace is ignored like in base64.b64decode.
+    """
+    length = len(file) - sum(file.count(char) for char in WHITESPACE)
+    if length % 4:
+        raise ActionException("The file is not correctly base64 encoded.")
+    padding = 0
+    index = len(file) - 1
+    while index >= 0 and padding < 2:
+        if file[index] == "=":
+            padding += 1
+        elif file[index] not in WHITESPACE:
+            break
+        index -= 1
+    return length // 4 * 3 - padding
+
+
+def open_base64_file(file: str) -> BinaryIO:
+    """
+    Returns a seekable file object with the decoded content of the base64 string.
+    Only the parts which are read are decoded. Strings with whitespace are
+    decoded as a whole since the positions of the bytes can not be calculated.
+    """
+    if any(char in file for char in WHITESPACE):
+        return BytesIO(base64.b64decode(file))
+    return cast(BinaryIO, BufferedReader(Base64FileReader(file)))
+
+
+class Base64FileReader(RawIOBase):
+    """
+    Raw file object for the decoded content of a base64 string without
+    whitespace. Each read decodes only the groups of four characters which
+    contain the requested bytes.
+    """
+
+    def __init__(self, file: str) -> None:
+        self.file = file
+        self.size = get_decoded_size(file)
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self.position
+        elif whence == SEEK_END:
+            offset += self.size
+        elif whence != SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence}).")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}.")
+        self.position = offset
+        return self.position
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore
+        end = min(self.position + len(buffer), self.size)
+        if end <= self.position:
+            return 0
+        first_group = self.position // 3
+        last_group = (end + 2) // 3
+        decoded = base64.b64decode(self.file[first_group * 4 : last_group * 4])
+        offset = self.position - first_group * 3
+        length = end - self.position
+        buffer[:length] = decoded[offset : offset + length]
+        self.position = end
+        return length
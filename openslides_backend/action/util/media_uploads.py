@@ -0,0 +1,89 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Set, Tuple
+
+from ...services.media.interface import MediaService
+
+UPLOAD_WORKERS = 4
+
+executor: Optional[ThreadPoolExecutor] = None
+executor_lock = threading.Lock()
+
+# The kind of the file (mediafile or resource) and its id.
+UploadKey = Tuple[str, int]
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the upload pool of this worker process. It is created on first use,
+    so that every gunicorn worker gets its own threads after forking.
+    """
+    global executor
+    with executor_lock:
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                UPLOAD_WORKERS, thread_name_prefix="media_upload"
+            )
+        return executor
+
+
+class Upload:
+    def __init__(self, file: str, mimetype: str, future: Future) -> None:
+        self.file = file
+        self.mimetype = mimetype
+        self.future = future
+
+
+class MediaUploads(MediaService):
+    """
+    Media service for the actions of one write of the action handler. Uploads
+    are started in the upload pool of the worker as soon as an action requests
+    them, so they overlap with the remaining actions and the datastore requests.
+    Before the write, join waits for all uploads and raises the first error.
+
+    If the actions are performed again after a DatastoreLockedException, an
+    upload of the same file with the same id is not repeated.
+    """
+
+    def __init__(self, media: MediaService) -> None:
+        self.media = media
+        self.uploads: Dict[UploadKey, Upload] = {}
+        self.requested: Set[UploadKey] = set()
+
+    def upload_mediafile(self, file: str, id: int, mimetype: str) -> None:
+        self.stage("mediafile", file, id, mimetype)
+
+    def upload_resource(self, file: str, id: int, mimetype: str) -> None:
+        self.stage("resource", file, id, mimetype)
+
+    def reset(self) -> None:
+        """
+        Forgets all uploads, so that the next write starts from scratch.
+        """
+        self.uploads = {}
+        self.requested = set()
+
+    def start_attempt(self) -> None:
+        """
+        Starts a new attempt to perform the actions.
+        """
+        self.requested = set()
+
+    def stage(self, kind: str, file: str, id: int, mimetype: str) -> None:
+        key = (kind, id)
+        self.requested.add(key)
+        upload = self.uploads.get(key)
+        if upload is not None and upload.file == file and upload.mimetype == mimetype:
+            return
+        future = get_executor().submit(
+            getattr(self.media, f"upload_{kind}"), file, id, mimetype
+        )
+        self.uploads[key] = Upload(file, mimetype, future)
+
+    def join(self) -> None:
+        """
+        Waits for all uploads of the current attempt and raises the first error.
+        Uploads of earlier attempts which were not requested again are ignored.
+        """
+        for key in self.requested:
+            self.uploads[key].future.result()
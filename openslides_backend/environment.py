@@ -9,6 +9,8 @@ Environment = TypedDict(
         "media_url": str,
         "datastore_reader_url": str,
         "datastore_writer_url": str,
+        "datastore_pool_size": int,
+        "media_pool_size": int,
     },
 )
 
@@ -29,6 +31,8 @@ DEFAULTS = {
     "DATASTORE_WRITER_HOST": "localhost",
     "DATASTORE_WRITER_PORT": "9011",
     "DATASTORE_WRITER_PATH": "/internal/datastore/writer",
+    "DATASTORE_POOL_SIZE": "10",
+    "MEDIA_POOL_SIZE": "10",
 }
 
 
@@ -41,6 +45,8 @@ def get_environment() -> Environment:
         media_url=get_endpoint("MEDIA"),
         datastore_reader_url=get_endpoint("DATASTORE_READER"),
         datastore_writer_url=get_endpoint("DATASTORE_WRITER"),
+        datastore_pool_size=get_pool_size("DATASTORE"),
+        media_pool_size=get_pool_size("MEDIA"),
     )
 
 
@@ -57,3 +63,15 @@ def get_endpoint(service: str) -> str:
         else:
             parts[suffix] = value
     return f"{parts['PROTOCOL']}://{parts['HOST']}:{parts['PORT']}{parts['PATH']}"
+
+
+def get_pool_size(service: str) -> int:
+    variable = "_".join((service, "POOL_SIZE"))
+    value = os.environ.get(variable, DEFAULTS[variable])
+    try:
+        pool_size = int(value)
+    except ValueError:
+        raise ValueError(f"Environment variable {variable} must be an integer.")
+    if pool_size < 1:
+        raise ValueError(f"Environment variable {variable} must be positive.")
+    return pool_size
@@ -11,6 +11,7 @@ from ..shared.env import is_truthy
 from ..shared.exceptions import ViewException
 from ..shared.interfaces.wsgi import StartResponse, WSGIEnvironment
 from .http_exceptions import BadRequest, Forbidden, HTTPException, MethodNotAllowed
+from .json_encoder import encode_json
 from .request import Request
 
 health_route = re.compile("^/health$")
@@ -42,12 +43,13 @@ class OpenSlidesBackendWSGIApplication:
 
     def default_route(self, request: Request) -> Union[Response, HTTPException]:
         """
-        Default route that calls the injected view.
+        Default route that calls the injected view. The response body is
+        streamed, see encode_json.
         """
         # Check request method
         if request.method != self.view.method:
             return MethodNotAllowed(valid_methods=[self.view.method])
-        self.logger.debug(f"Request method is {request.method}.")
+        self.logger.debug("Request method is %s.", request.method)
 
         # Check mimetype and parse JSON body. The result is cached in request.json.
         if not request.is_json:
@@ -60,7 +62,7 @@ class OpenSlidesBackendWSGIApplication:
             request_body = request.get_json()
         except WerkzeugBadRequest as exception:
             return BadRequest(ViewException(exception.description))
-        self.logger.debug(f"Request contains JSON: {request_body}.")
+        self.logger.debug("Request contains JSON: %s.", request_body)
 
         # Dispatch view and return response.
         view_instance = self.view(self.logging, self.services)
@@ -82,9 +84,9 @@ class OpenSlidesBackendWSGIApplication:
                 self.logger.error(text)
                 raise
         self.logger.debug(
-            f"All done. Application sends HTTP 200 with body {response_body}."
+            "All done. Application sends HTTP 200 with body %s.", response_body
         )
-        response = Response(json.dumps(response_body), content_type="application/json")
+        response = Response(encode_json(response_body), content_type="application/json")
         if access_token is not None:
             response.headers[HEADER_NAME] = access_token
         return response
@@ -0,0 +1,96 @@
+from typing import Any, Iterable, Iterator, List
+
+import simplejson as json
+
+from ..shared.env import get_json_encoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+CHUNK_SIZE = 64 * 1024
+
+# Nesting level up to which lists and dicts are encoded element by element. This
+# covers the results of all actions and presenters in a response body.
+STREAM_DEPTH = 3
+
+# Number of list elements which are encoded together at the last streamed level.
+BATCH_SIZE = 1000
+
+
+def encode_json(body: Any) -> Iterable[bytes]:
+    """
+    Encodes the given response body as JSON and returns it as a WSGI iterable.
+
+    The default simplejson encoder streams the body in chunks, so large bodies
+    are never held in memory as one string. The optional orjson encoder encodes
+    the body in one piece, which is much faster. Bodies which orjson can not
+    encode (e.g. decimals) are streamed with simplejson instead.
+    """
+    if get_json_encoder() == "orjson":
+        if orjson is None:
+            raise ValueError("The JSON encoder orjson is not installed.")
+        try:
+            return [orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)]
+        except orjson.JSONEncodeError:
+            pass
+    return iter_json(body)
+
+
+def iter_json(body: Any, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields the encoded body in chunks of at least chunk_size bytes (except for
+    the last one). The result is equal to json.dumps(body).
+    """
+    parts: List[str] = []
+    size = 0
+    for part in iter_json_parts(body, STREAM_DEPTH):
+        parts.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(parts).encode()
+            parts = []
+            size = 0
+    if parts:
+        yield "".join(parts).encode()
+
+
+def iter_json_parts(body: Any, depth: int) -> Iterator[str]:
+    """
+    Encodes lists and dicts with string keys up to the given depth element by
+    element. The lists of the last level are encoded in batches of BATCH_SIZE
+    elements. Everything below is encoded with json.dumps, which uses the C
+    speedups of simplejson.
+    """
+    if depth == 1 and isinstance(body, list) and len(body) > BATCH_SIZE:
+        yield "["
+        for index in range(0, len(body), BATCH_SIZE):
+            if index:
+                yield ", "
+            # strip the brackets of the encoded slice
+            yield json.dumps(body[index : index + BATCH_SIZE])[1:-1]
+        yield "]"
+    elif depth > 1 and isinstance(body, list) and body:
+        yield "["
+        for index, element in enumerate(body):
+            if index:
+                yield ", "
+            yield from iter_json_parts(element, depth - 1)
+        yield "]"
+    elif (
+        depth > 1
+        and isinstance(body, dict)
+        and body
+        and all(isinstance(key, str) for key in body)
+    ):
+        yield "{"
+        for index, (key, value) in enumerate(body.items()):
+            if index:
+                yield ", "
+            yield json.dumps(key)
+            yield ": "
+            yield from iter_json_parts(value, depth - 1)
+        yield "}"
+    else:
+        yield json.dumps(body)
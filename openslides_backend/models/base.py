@@ -1,5 +1,5 @@
-import re
-from typing import Dict, Iterable, Optional, Type
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple, Type
 
 from ..shared.exceptions import ActionException
 from ..shared.patterns import Collection
@@ -7,6 +7,10 @@ from . import fields
 
 model_registry: Dict[Collection, Type["Model"]] = {}
 
+# Maximum number of field names resolved by Model.resolve_field which are cached
+# per model. The least recently used field names are evicted first.
+RESOLVED_FIELDS_CACHE_SIZE = 1024
+
 
 class ModelMetaClass(type):
     """
@@ -15,7 +19,8 @@ class ModelMetaClass(type):
     This metaclass ensures that all fields get attributes set so that they
     know its own collection and its own field name.
 
-    It also creates the registry for models and collections.
+    It also creates the registry for models and collections and the tuples of
+    fields used by the model methods below.
     """
 
     def __new__(metaclass, class_name, class_parents, class_attributes):  # type: ignore
@@ -24,6 +29,7 @@ class ModelMetaClass(type):
         )
         if class_name != "Model":
             new_class.field_prefix_map = {}
+            new_class.resolved_fields = OrderedDict()
             for attr_name in class_attributes:
                 attr = getattr(new_class, attr_name)
                 if isinstance(attr, fields.Field):
@@ -35,6 +41,27 @@ class ModelMetaClass(type):
                     if isinstance(attr, fields.BaseTemplateField):
                         prefix = attr_name[: attr.index]
                         new_class.field_prefix_map[prefix] = attr
+            new_class.all_fields = tuple(
+                attr
+                for attr_name in dir(new_class)
+                if isinstance(attr := getattr(new_class, attr_name), fields.Field)
+            )
+            new_class.relation_fields = tuple(
+                field
+                for field in new_class.all_fields
+                if isinstance(field, fields.BaseRelationField)
+            )
+            new_class.required_fields = tuple(
+                field for field in new_class.all_fields if field.required
+            )
+            new_class.default_fields = tuple(
+                field for field in new_class.all_fields if field.default is not None
+            )
+            new_class.on_delete_relation_fields = tuple(
+                field
+                for field in new_class.relation_fields
+                if field.on_delete != fields.OnDelete.SET_NULL
+            )
             model_registry[new_class.collection] = new_class
         return new_class
 
@@ -52,6 +79,18 @@ class Model(metaclass=ModelMetaClass):
     # once only with the prefix.
     field_prefix_map: Dict[str, fields.BaseRelationField]
 
+    # LRU cache of Model.resolve_field for this model.
+    resolved_fields: "OrderedDict[str, Optional[Tuple[fields.Field, Optional[str]]]]"
+
+    # All fields sorted by their name and some subsets of them. They are built
+    # once by the metaclass, so use them instead of iterating over the class.
+    all_fields: Tuple[fields.Field, ...]
+    relation_fields: Tuple[fields.BaseRelationField, ...]
+    required_fields: Tuple[fields.Field, ...]
+    default_fields: Tuple[fields.Field, ...]
+    # Relation fields with on_delete CASCADE or PROTECT.
+    on_delete_relation_fields: Tuple[fields.BaseRelationField, ...]
+
     def __str__(self) -> str:
         return self.verbose_name
 
@@ -80,33 +119,65 @@ class Model(metaclass=ModelMetaClass):
 
         Returns None if field is not found.
         """
+        resolved = self.resolve_field(field_name)
+        if not resolved:
+            return None
+        return resolved[0]
+
+    @classmethod
+    def resolve_field(
+        cls, field_name: str
+    ) -> Optional[Tuple[fields.Field, Optional[str]]]:
+        """
+        Returns the field for the given field name together with the replacement
+        if the field name is a structured field (an empty string for the template
+        field itself). The replacement is not validated, use [try_]get_replacement
+        of the field for this.
+
+        The results are cached for each model, so the regex of a template field
+        is only matched once per field name. The cache keeps the
+        RESOLVED_FIELDS_CACHE_SIZE most recently used field names.
+
+        Returns None if field is not found.
+        """
+        if field_name in cls.resolved_fields:
+            cls.resolved_fields.move_to_end(field_name)
+            return cls.resolved_fields[field_name]
+        result = cls._resolve_field(field_name)
+        cls.resolved_fields[field_name] = result
+        if len(cls.resolved_fields) > RESOLVED_FIELDS_CACHE_SIZE:
+            cls.resolved_fields.popitem(last=False)
+        return result
+
+    @classmethod
+    def _resolve_field(
+        cls, field_name: str
+    ) -> Optional[Tuple[fields.Field, Optional[str]]]:
         prefix = field_name.split("$")[0]
-        if prefix not in self.field_prefix_map:
+        if (field := cls.field_prefix_map.get(prefix)) is None:
             return None
 
-        field = self.field_prefix_map[prefix]
-        if isinstance(field, fields.BaseTemplateField):
+        replacement = None
+        if isinstance(field, fields.BaseTemplateField) and "$" in field_name:
             # We use the regex here since we want to also match template fields.
-            if "$" in field_name and not re.match(field.get_regex(), field_name):
+            if not (match := field.regex.match(field_name)):
                 return None
-        return field
+            replacement = match.group(1)
+        return field, replacement
 
-    def get_fields(self) -> Iterable[fields.Field]:
+    @classmethod
+    def get_fields(cls) -> Iterable[fields.Field]:
         """
-        Yields all fields in form of a tuple containing field name and field.
+        Returns all fields sorted by their name.
         """
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, fields.Field):
-                yield attr
+        return cls.all_fields
 
-    def get_relation_fields(self) -> Iterable[fields.BaseRelationField]:
+    @classmethod
+    def get_relation_fields(cls) -> Iterable[fields.BaseRelationField]:
         """
-        Yields all relation fields (using BaseRelationField).
+        Returns all relation fields (using BaseRelationField).
         """
-        for model_field in self.get_fields():
-            if isinstance(model_field, fields.BaseRelationField):
-                yield model_field
+        return cls.relation_fields
 
     def get_property(
         self, field_name: str, replacement_pattern: Optional[str] = None
@@ -131,16 +202,16 @@ class Model(metaclass=ModelMetaClass):
             properties.update(self.get_property(field))
         return properties
 
-    def get_required_fields(self) -> Iterable[fields.Field]:
+    @classmethod
+    def get_required_fields(cls) -> Iterable[fields.Field]:
         """
-        Yields all required fields
+        Returns all required fields
         """
-        for model_field in self.get_fields():
-            if model_field.required:
-                if isinstance(model_field, fields.RelationListField) or isinstance(
-                    model_field, fields.GenericRelationListField
-                ):
-                    raise NotImplementedError(
-                        f"NotImplementedError: {self.collection.collection}.{model_field.own_field_name}"
-                    )
-                yield model_field
+        for model_field in cls.required_fields:
+            if isinstance(model_field, fields.RelationListField) or isinstance(
+                model_field, fields.GenericRelationListField
+            ):
+                raise NotImplementedError(
+                    f"NotImplementedError: {cls.collection.collection}.{model_field.own_field_name}"
+                )
+        return cls.required_fields
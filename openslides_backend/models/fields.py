@@ -1,6 +1,6 @@
 import re
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Pattern, Union
 
 from ..shared.patterns import ID_REGEX, Collection, string_to_fqid
 from ..shared.schema import (
@@ -56,7 +56,7 @@ class Field:
         return dict(**self.constraints)
 
     def get_payload_schema(self, *args: Any, **kwargs: Any) -> Schema:
-        """ Calls get_schema by default. """
+        """Calls get_schema by default."""
         return self.get_schema()
 
     def extend_schema(self, schema: Schema, **kwargs: Any) -> Schema:
@@ -289,6 +289,7 @@ class BaseTemplateField(Field):
 
     replacement: Optional[str]
     index: int
+    _regex: Optional[Pattern[str]] = None
 
     def __init__(self, **kwargs: Any) -> None:
         self.replacement = kwargs.pop("replacement", None)
@@ -322,6 +323,16 @@ class BaseTemplateField(Field):
             + r"$"
         )
 
+    @property
+    def regex(self) -> Pattern[str]:
+        """
+        The compiled regex. It is compiled on first usage since the own field name
+        is set later by the model.
+        """
+        if self._regex is None:
+            self._regex = re.compile(self.get_regex())
+        return self._regex
+
     def get_replacement(self, field_name: str) -> str:
         replacement = self.try_get_replacement(field_name)
         if not replacement:
@@ -345,7 +356,7 @@ class BaseTemplateField(Field):
         return field_name == self.get_template_field_name()
 
     def try_get_replacement(self, field_name: str) -> Optional[str]:
-        match = re.match(self.get_regex(), field_name)
+        match = self.regex.match(field_name)
         if not match:
             return None
         replacement = match.group(1)
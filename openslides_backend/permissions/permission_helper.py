@@ -1,81 +1,128 @@
-from typing import List
+from typing import Dict, FrozenSet, Set, Tuple
 
 from ..services.datastore.commands import GetManyRequest
 from ..services.datastore.interface import DatastoreService
 from ..shared.exceptions import PermissionDenied
 from ..shared.patterns import Collection, FullQualifiedId
-from .permissions import OrganisationManagementLevel, Permission, permission_parents
+from .permissions import (
+    OrganisationManagementLevel,
+    Permission,
+    permission_ancestors,
+    permission_descendants,
+)
+
+ALL_PERMISSIONS: FrozenSet[Permission] = frozenset(permission_descendants)
+
+
+class PermissionResolver:
+    """
+    Resolves the permissions of users in meetings. An instance should live for
+    one request only: The effective permissions of a user in a meeting are
+    loaded once, so all further checks for this user and meeting are answered
+    without asking the datastore.
+    """
+
+    def __init__(self, datastore: DatastoreService) -> None:
+        self.datastore = datastore
+        self.permissions: Dict[Tuple[int, int], FrozenSet[Permission]] = {}
+
+    def has_perm(self, user_id: int, permission: Permission, meeting_id: int) -> bool:
+        return permission in self.get_permissions(user_id, meeting_id)
+
+    def get_permissions(self, user_id: int, meeting_id: int) -> FrozenSet[Permission]:
+        """
+        Returns all permissions the given user has in the given meeting, including
+        all child permissions of the group permissions.
+        """
+        key = (user_id, meeting_id)
+        if key not in self.permissions:
+            self.permissions[key] = self.load_permissions(user_id, meeting_id)
+        return self.permissions[key]
+
+    def load_permissions(self, user_id: int, meeting_id: int) -> FrozenSet[Permission]:
+        # anonymous cannot be fetched from db
+        if user_id > 0:
+            user = self.datastore.get(
+                FullQualifiedId(Collection("user"), user_id),
+                [
+                    f"group_${meeting_id}_ids",
+                    "guest_meeting_ids",
+                    "organisation_management_level",
+                ],
+            )
+        else:
+            user = {}
+
+        # superadmins have all permissions
+        if (
+            user.get("organisation_management_level")
+            == OrganisationManagementLevel.SUPERADMIN
+        ):
+            return ALL_PERMISSIONS
+
+        # get correct group ids for this user
+        if user.get(f"group_${meeting_id}_ids"):
+            group_ids = user[f"group_${meeting_id}_ids"]
+        else:
+            # guests, temporary users and anonymous are in the default group
+            if meeting_id in user.get("guest_meeting_ids", []) or user_id == 0:
+                meeting = self.datastore.get(
+                    FullQualifiedId(Collection("meeting"), meeting_id),
+                    ["default_group_id", "enable_anonymous"],
+                )
+                # check if anonymous is allowed
+                if user_id == 0 and not meeting.get("enable_anonymous"):
+                    raise PermissionDenied(
+                        f"Anonymous is not enabled for meeting {meeting_id}"
+                    )
+                group_ids = [meeting["default_group_id"]]
+            else:
+                raise PermissionDenied(f"You do not belong to meeting {meeting_id}")
+
+        gmr = GetManyRequest(
+            Collection("group"),
+            group_ids,
+            ["permissions", "admin_group_for_meeting_id"],
+        )
+        result = self.datastore.get_many([gmr])
+        group_permissions: Set[Permission] = set()
+        for group in result.get(Collection("group"), {}).values():
+            # admins implicitly have all permissions
+            if group.get("admin_group_for_meeting_id") == meeting_id:
+                return ALL_PERMISSIONS
+            group_permissions.update(group.get("permissions", []))
+        # the groups have the permissions themselves and all of their children
+        return frozenset().union(
+            *(
+                permission_descendants.get(permission, frozenset())
+                for permission in group_permissions
+            )
+        )
+
+    def reset(self) -> None:
+        self.permissions.clear()
 
 
 def has_perm(
     datastore: DatastoreService, user_id: int, permission: Permission, meeting_id: int
 ) -> bool:
-    # anonymous cannot be fetched from db
-    if user_id > 0:
-        user = datastore.get(
-            FullQualifiedId(Collection("user"), user_id),
-            [
-                f"group_${meeting_id}_ids",
-                "guest_meeting_ids",
-                "organisation_management_level",
-            ],
-        )
-    else:
-        user = {}
-
-    # superadmins have all permissions
-    if (
-        user.get("organisation_management_level")
-        == OrganisationManagementLevel.SUPERADMIN
-    ):
-        return True
-
-    # get correct group ids for this user
-    if user.get(f"group_${meeting_id}_ids"):
-        group_ids = user[f"group_${meeting_id}_ids"]
-    else:
-        # guests, temporary users and anonymous are in the default group
-        if meeting_id in user.get("guest_meeting_ids", []) or user_id == 0:
-            meeting = datastore.get(
-                FullQualifiedId(Collection("meeting"), meeting_id),
-                ["default_group_id", "enable_anonymous"],
-            )
-            # check if anonymous is allowed
-            if user_id == 0 and not meeting.get("enable_anonymous"):
-                raise PermissionDenied(
-                    f"Anonymous is not enabled for meeting {meeting_id}"
-                )
-            group_ids = [meeting["default_group_id"]]
-        else:
-            raise PermissionDenied(f"You do not belong to meeting {meeting_id}")
-
-    gmr = GetManyRequest(
-        Collection("group"),
-        group_ids,
-        ["permissions", "admin_group_for_meeting_id"],
-    )
-    result = datastore.get_many([gmr])
-    for group in result[Collection("group")].values():
-        # admins implicitly have all permissions
-        if group.get("admin_group_for_meeting_id") == meeting_id:
-            return True
-        # check if the current group has the needed permission (or a higher one)
-        for group_permission in group.get("permissions", []):
-            if is_child_permission(permission, group_permission):
-                return True
-    return False
+    """
+    Checks a single permission. Use a PermissionResolver to check many
+    permissions within one request.
+    """
+    return PermissionResolver(datastore).has_perm(user_id, permission, meeting_id)
 
 
 def is_child_permission(child: Permission, parent: Permission) -> bool:
     """
-    Iterate the permission tree (represented in the permissions object) from child to
-    parent or until there are no parents anymore
+    Looks up the parent in the precomputed ancestors of the child.
+    """
+    return parent in permission_ancestors.get(child, frozenset())
+
+
+def get_child_permissions(permission: Permission) -> FrozenSet[Permission]:
+    """
+    Returns the given permission and all permissions which are (transitively)
+    children of it.
     """
-    queue: List[Permission] = [child]
-    while queue:
-        current = queue.pop()
-        if current == parent:
-            return True
-        parents = permission_parents[current]
-        queue.extend(parents)
-    return False
+    return permission_descendants.get(permission, frozenset())
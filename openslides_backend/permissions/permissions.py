@@ -1,7 +1,7 @@
 # Code generated. DO NOT EDIT.
 
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 
 from .get_permission_parts import get_permission_parts
 
@@ -13,20 +13,20 @@ class OrganisationManagementLevel(str, Enum):
 
 
 class Permission(str):
-    """ Marker class to use typing with permissions. """
+    """Marker class to use typing with permissions."""
 
 
 class _AgendaItem(Permission, Enum):
-    CAN_SEE_INTERNAL = "agenda_item.can_see_internal"
     CAN_SEE = "agenda_item.can_see"
+    CAN_SEE_INTERNAL = "agenda_item.can_see_internal"
     CAN_MANAGE = "agenda_item.can_manage"
 
 
 class _Assignment(Permission, Enum):
     CAN_SEE = "assignment.can_see"
     CAN_NOMINATE_OTHER = "assignment.can_nominate_other"
-    CAN_NOMINATE_SELF = "assignment.can_nominate_self"
     CAN_MANAGE = "assignment.can_manage"
+    CAN_NOMINATE_SELF = "assignment.can_nominate_self"
 
 
 class _ListOfSpeakers(Permission, Enum):
@@ -41,23 +41,23 @@ class _Mediafile(Permission, Enum):
 
 
 class _Meeting(Permission, Enum):
-    CAN_SEE_HISTORY = "meeting.can_see_history"
+    CAN_MANAGE_SETTINGS = "meeting.can_manage_settings"
     CAN_MANAGE_LOGOS_AND_FONTS = "meeting.can_manage_logos_and_fonts"
     CAN_SEE_FRONTPAGE = "meeting.can_see_frontpage"
     CAN_SEE_AUTOPILOT = "meeting.can_see_autopilot"
-    CAN_MANAGE_SETTINGS = "meeting.can_manage_settings"
     CAN_SEE_LIVESTREAM = "meeting.can_see_livestream"
+    CAN_SEE_HISTORY = "meeting.can_see_history"
 
 
 class _Motion(Permission, Enum):
-    CAN_CREATE = "motion.can_create"
-    CAN_MANAGE = "motion.can_manage"
-    CAN_SUPPORT = "motion.can_support"
+    CAN_SEE = "motion.can_see"
     CAN_MANAGE_METADATA = "motion.can_manage_metadata"
     CAN_MANAGE_POLLS = "motion.can_manage_polls"
-    CAN_SEE = "motion.can_see"
-    CAN_CREATE_AMENDMENTS = "motion.can_create_amendments"
     CAN_SEE_INTERNAL = "motion.can_see_internal"
+    CAN_CREATE = "motion.can_create"
+    CAN_CREATE_AMENDMENTS = "motion.can_create_amendments"
+    CAN_MANAGE = "motion.can_manage"
+    CAN_SUPPORT = "motion.can_support"
 
 
 class _Poll(Permission, Enum):
@@ -65,8 +65,8 @@ class _Poll(Permission, Enum):
 
 
 class _Projector(Permission, Enum):
-    CAN_MANAGE = "projector.can_manage"
     CAN_SEE = "projector.can_see"
+    CAN_MANAGE = "projector.can_manage"
 
 
 class _Tag(Permission, Enum):
@@ -74,10 +74,10 @@ class _Tag(Permission, Enum):
 
 
 class _User(Permission, Enum):
+    CAN_SEE = "user.can_see"
     CAN_SEE_EXTRA_DATA = "user.can_see_extra_data"
     CAN_MANAGE = "user.can_manage"
     CAN_CHANGE_OWN_PASSWORD = "user.can_change_own_password"
-    CAN_SEE = "user.can_see"
 
 
 class Permissions:
@@ -149,3 +149,149 @@ permission_parents: Dict[Permission, List[Permission]] = {
     _User.CAN_MANAGE: [],
     _User.CAN_CHANGE_OWN_PASSWORD: [],
 }
+
+# Holds all direct and indirect parents for each permission including itself.
+permission_ancestors: Dict[Permission, FrozenSet[Permission]] = {
+    _AgendaItem.CAN_SEE: frozenset(
+        {_AgendaItem.CAN_MANAGE, _AgendaItem.CAN_SEE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _AgendaItem.CAN_SEE_INTERNAL: frozenset(
+        {_AgendaItem.CAN_MANAGE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _AgendaItem.CAN_MANAGE: frozenset({_AgendaItem.CAN_MANAGE}),
+    _Assignment.CAN_SEE: frozenset(
+        {
+            _Assignment.CAN_MANAGE,
+            _Assignment.CAN_NOMINATE_OTHER,
+            _Assignment.CAN_NOMINATE_SELF,
+            _Assignment.CAN_SEE,
+        }
+    ),
+    _Assignment.CAN_NOMINATE_OTHER: frozenset(
+        {_Assignment.CAN_MANAGE, _Assignment.CAN_NOMINATE_OTHER}
+    ),
+    _Assignment.CAN_MANAGE: frozenset({_Assignment.CAN_MANAGE}),
+    _Assignment.CAN_NOMINATE_SELF: frozenset({_Assignment.CAN_NOMINATE_SELF}),
+    _ListOfSpeakers.CAN_SEE: frozenset(
+        {
+            _ListOfSpeakers.CAN_BE_SPEAKER,
+            _ListOfSpeakers.CAN_MANAGE,
+            _ListOfSpeakers.CAN_SEE,
+        }
+    ),
+    _ListOfSpeakers.CAN_MANAGE: frozenset({_ListOfSpeakers.CAN_MANAGE}),
+    _ListOfSpeakers.CAN_BE_SPEAKER: frozenset({_ListOfSpeakers.CAN_BE_SPEAKER}),
+    _Mediafile.CAN_SEE: frozenset({_Mediafile.CAN_MANAGE, _Mediafile.CAN_SEE}),
+    _Mediafile.CAN_MANAGE: frozenset({_Mediafile.CAN_MANAGE}),
+    _Meeting.CAN_MANAGE_SETTINGS: frozenset({_Meeting.CAN_MANAGE_SETTINGS}),
+    _Meeting.CAN_MANAGE_LOGOS_AND_FONTS: frozenset(
+        {_Meeting.CAN_MANAGE_LOGOS_AND_FONTS}
+    ),
+    _Meeting.CAN_SEE_FRONTPAGE: frozenset({_Meeting.CAN_SEE_FRONTPAGE}),
+    _Meeting.CAN_SEE_AUTOPILOT: frozenset({_Meeting.CAN_SEE_AUTOPILOT}),
+    _Meeting.CAN_SEE_LIVESTREAM: frozenset({_Meeting.CAN_SEE_LIVESTREAM}),
+    _Meeting.CAN_SEE_HISTORY: frozenset({_Meeting.CAN_SEE_HISTORY}),
+    _Motion.CAN_SEE: frozenset(
+        {
+            _Motion.CAN_CREATE,
+            _Motion.CAN_CREATE_AMENDMENTS,
+            _Motion.CAN_MANAGE,
+            _Motion.CAN_MANAGE_METADATA,
+            _Motion.CAN_MANAGE_POLLS,
+            _Motion.CAN_SEE,
+            _Motion.CAN_SEE_INTERNAL,
+            _Motion.CAN_SUPPORT,
+        }
+    ),
+    _Motion.CAN_MANAGE_METADATA: frozenset(
+        {_Motion.CAN_MANAGE, _Motion.CAN_MANAGE_METADATA}
+    ),
+    _Motion.CAN_MANAGE_POLLS: frozenset({_Motion.CAN_MANAGE, _Motion.CAN_MANAGE_POLLS}),
+    _Motion.CAN_SEE_INTERNAL: frozenset({_Motion.CAN_MANAGE, _Motion.CAN_SEE_INTERNAL}),
+    _Motion.CAN_CREATE: frozenset({_Motion.CAN_CREATE, _Motion.CAN_MANAGE}),
+    _Motion.CAN_CREATE_AMENDMENTS: frozenset(
+        {_Motion.CAN_CREATE_AMENDMENTS, _Motion.CAN_MANAGE}
+    ),
+    _Motion.CAN_MANAGE: frozenset({_Motion.CAN_MANAGE}),
+    _Motion.CAN_SUPPORT: frozenset({_Motion.CAN_SUPPORT}),
+    _Poll.CAN_MANAGE: frozenset({_Poll.CAN_MANAGE}),
+    _Projector.CAN_SEE: frozenset({_Projector.CAN_MANAGE, _Projector.CAN_SEE}),
+    _Projector.CAN_MANAGE: frozenset({_Projector.CAN_MANAGE}),
+    _Tag.CAN_MANAGE: frozenset({_Tag.CAN_MANAGE}),
+    _User.CAN_SEE: frozenset(
+        {_User.CAN_MANAGE, _User.CAN_SEE, _User.CAN_SEE_EXTRA_DATA}
+    ),
+    _User.CAN_SEE_EXTRA_DATA: frozenset({_User.CAN_MANAGE, _User.CAN_SEE_EXTRA_DATA}),
+    _User.CAN_MANAGE: frozenset({_User.CAN_MANAGE}),
+    _User.CAN_CHANGE_OWN_PASSWORD: frozenset({_User.CAN_CHANGE_OWN_PASSWORD}),
+}
+
+# Holds all direct and indirect children for each permission including itself.
+permission_descendants: Dict[Permission, FrozenSet[Permission]] = {
+    _AgendaItem.CAN_SEE: frozenset({_AgendaItem.CAN_SEE}),
+    _AgendaItem.CAN_SEE_INTERNAL: frozenset(
+        {_AgendaItem.CAN_SEE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _AgendaItem.CAN_MANAGE: frozenset(
+        {_AgendaItem.CAN_MANAGE, _AgendaItem.CAN_SEE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _Assignment.CAN_SEE: frozenset({_Assignment.CAN_SEE}),
+    _Assignment.CAN_NOMINATE_OTHER: frozenset(
+        {_Assignment.CAN_NOMINATE_OTHER, _Assignment.CAN_SEE}
+    ),
+    _Assignment.CAN_MANAGE: frozenset(
+        {_Assignment.CAN_MANAGE, _Assignment.CAN_NOMINATE_OTHER, _Assignment.CAN_SEE}
+    ),
+    _Assignment.CAN_NOMINATE_SELF: frozenset(
+        {_Assignment.CAN_NOMINATE_SELF, _Assignment.CAN_SEE}
+    ),
+    _ListOfSpeakers.CAN_SEE: frozenset({_ListOfSpeakers.CAN_SEE}),
+    _ListOfSpeakers.CAN_MANAGE: frozenset(
+        {_ListOfSpeakers.CAN_MANAGE, _ListOfSpeakers.CAN_SEE}
+    ),
+    _ListOfSpeakers.CAN_BE_SPEAKER: frozenset(
+        {_ListOfSpeakers.CAN_BE_SPEAKER, _ListOfSpeakers.CAN_SEE}
+    ),
+    _Mediafile.CAN_SEE: frozenset({_Mediafile.CAN_SEE}),
+    _Mediafile.CAN_MANAGE: frozenset({_Mediafile.CAN_MANAGE, _Mediafile.CAN_SEE}),
+    _Meeting.CAN_MANAGE_SETTINGS: frozenset({_Meeting.CAN_MANAGE_SETTINGS}),
+    _Meeting.CAN_MANAGE_LOGOS_AND_FONTS: frozenset(
+        {_Meeting.CAN_MANAGE_LOGOS_AND_FONTS}
+    ),
+    _Meeting.CAN_SEE_FRONTPAGE: frozenset({_Meeting.CAN_SEE_FRONTPAGE}),
+    _Meeting.CAN_SEE_AUTOPILOT: frozenset({_Meeting.CAN_SEE_AUTOPILOT}),
+    _Meeting.CAN_SEE_LIVESTREAM: frozenset({_Meeting.CAN_SEE_LIVESTREAM}),
+    _Meeting.CAN_SEE_HISTORY: frozenset({_Meeting.CAN_SEE_HISTORY}),
+    _Motion.CAN_SEE: frozenset({_Motion.CAN_SEE}),
+    _Motion.CAN_MANAGE_METADATA: frozenset(
+        {_Motion.CAN_MANAGE_METADATA, _Motion.CAN_SEE}
+    ),
+    _Motion.CAN_MANAGE_POLLS: frozenset({_Motion.CAN_MANAGE_POLLS, _Motion.CAN_SEE}),
+    _Motion.CAN_SEE_INTERNAL: frozenset({_Motion.CAN_SEE, _Motion.CAN_SEE_INTERNAL}),
+    _Motion.CAN_CREATE: frozenset({_Motion.CAN_CREATE, _Motion.CAN_SEE}),
+    _Motion.CAN_CREATE_AMENDMENTS: frozenset(
+        {_Motion.CAN_CREATE_AMENDMENTS, _Motion.CAN_SEE}
+    ),
+    _Motion.CAN_MANAGE: frozenset(
+        {
+            _Motion.CAN_CREATE,
+            _Motion.CAN_CREATE_AMENDMENTS,
+            _Motion.CAN_MANAGE,
+            _Motion.CAN_MANAGE_METADATA,
+            _Motion.CAN_MANAGE_POLLS,
+            _Motion.CAN_SEE,
+            _Motion.CAN_SEE_INTERNAL,
+        }
+    ),
+    _Motion.CAN_SUPPORT: frozenset({_Motion.CAN_SEE, _Motion.CAN_SUPPORT}),
+    _Poll.CAN_MANAGE: frozenset({_Poll.CAN_MANAGE}),
+    _Projector.CAN_SEE: frozenset({_Projector.CAN_SEE}),
+    _Projector.CAN_MANAGE: frozenset({_Projector.CAN_MANAGE, _Projector.CAN_SEE}),
+    _Tag.CAN_MANAGE: frozenset({_Tag.CAN_MANAGE}),
+    _User.CAN_SEE: frozenset({_User.CAN_SEE}),
+    _User.CAN_SEE_EXTRA_DATA: frozenset({_User.CAN_SEE, _User.CAN_SEE_EXTRA_DATA}),
+    _User.CAN_MANAGE: frozenset(
+        {_User.CAN_MANAGE, _User.CAN_SEE, _User.CAN_SEE_EXTRA_DATA}
+    ),
+    _User.CAN_CHANGE_OWN_PASSWORD: frozenset({_User.CAN_CHANGE_OWN_PASSWORD}),
+}
@@ -1,10 +1,15 @@
-from operator import itemgetter
-from typing import Any, Dict, List
+import threading
+from bisect import bisect_left, insort
+from itertools import groupby, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from weakref import WeakKeyDictionary
 
 import fastjsonschema
 
 from ..services.datastore.deleted_models_behaviour import DeletedModelsBehaviour
+from ..services.datastore.interface import DatastoreService, Engine
 from ..shared.exceptions import PresenterException
+from ..shared.filters import FilterOperator
 from ..shared.patterns import Collection
 from ..shared.schema import schema_version
 from .base import BasePresenter
@@ -52,22 +57,202 @@ ALLOWED = {
 }
 
 
+SEARCH_FIELDS = ("username", "first_name", "last_name")
+NGRAM_SIZE = 3
+MAX_ORDERS = 16
+
+SortKey = Tuple[Any, ...]
+
+
+class UserIndex:
+    """
+    In-worker index of all users for the get_users presenter. It holds the
+    sortable fields of the users, the trigrams of their names and one sorted
+    list of sort keys per used sort criteria. A sort key consists of the values
+    of the criteria (with the defaults for None) followed by the id.
+
+    The index is built with one full scan of the users. Afterwards each request
+    only fetches the users which changed after the highest position known to the
+    index and updates the index with them.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.position: Optional[int] = None
+        self.users: Dict[int, Dict[str, Any]] = {}
+        self.ngrams: Dict[str, Set[int]] = {}
+        self.orders: Dict[Tuple[str, ...], List[SortKey]] = {}
+
+    def update(self, datastore: DatastoreService) -> None:
+        fields = [*ALLOWED, "id", "meeting_id", "meta_position", "meta_deleted"]
+        if self.position is None:
+            users = datastore.get_all(
+                Collection("user"), fields, DeletedModelsBehaviour.ALL_MODELS
+            )
+        else:
+            users = datastore.filter(
+                Collection("user"),
+                FilterOperator("meta_position", ">", self.position),
+                fields,
+                DeletedModelsBehaviour.ALL_MODELS,
+            )
+        position = self.position or 0
+        for user in sorted(users.values(), key=lambda user: user["id"]):
+            self.remove(user["id"])
+            if not user.get("meta_deleted"):
+                self.add(user["id"], user)
+            position = max(position, user.get("meta_position", 0))
+        self.position = position
+
+    def add(self, id: int, user: Dict[str, Any]) -> None:
+        self.users[id] = {
+            field: user[field]
+            for field in (*ALLOWED, "meeting_id")
+            if user.get(field) is not None
+        }
+        for ngram in self.get_ngrams(id):
+            self.ngrams.setdefault(ngram, set()).add(id)
+        for criteria, order in self.orders.items():
+            insort(order, self.get_sort_key(id, criteria))
+
+    def remove(self, id: int) -> None:
+        if id not in self.users:
+            return
+        for criteria, order in self.orders.items():
+            del order[bisect_left(order, self.get_sort_key(id, criteria))]
+        for ngram in self.get_ngrams(id):
+            ids = self.ngrams[ngram]
+            ids.discard(id)
+            if not ids:
+                del self.ngrams[ngram]
+        del self.users[id]
+
+    def get_ngrams(self, id: int) -> Set[str]:
+        ngrams: Set[str] = set()
+        for field in SEARCH_FIELDS:
+            value = self.users[id].get(field)
+            if isinstance(value, str):
+                ngrams.update(
+                    value[i : i + NGRAM_SIZE]
+                    for i in range(len(value) - NGRAM_SIZE + 1)
+                )
+        return ngrams
+
+    def get_sort_key(self, id: int, criteria: Sequence[str]) -> SortKey:
+        user = self.users[id]
+        return tuple(user.get(crit, ALLOWED[crit]) for crit in criteria) + (id,)
+
+    def get_order(self, criteria: Tuple[str, ...]) -> List[SortKey]:
+        """
+        Returns the sorted keys of all users for the given criteria. The list is
+        built on first use and kept up to date by add and remove afterwards.
+        """
+        if criteria not in self.orders:
+            if len(self.orders) >= MAX_ORDERS:
+                del self.orders[next(iter(self.orders))]
+            self.orders[criteria] = sorted(
+                self.get_sort_key(id, criteria) for id in self.users
+            )
+        return self.orders[criteria]
+
+    def find(self, keyword: str) -> Iterable[int]:
+        """
+        Returns the ids of all users with the keyword in one of their names. The
+        candidates are narrowed down with the trigrams of the keyword if it is
+        long enough.
+        """
+        candidates: Iterable[int] = self.users
+        if len(keyword) >= NGRAM_SIZE:
+            postings = sorted(
+                (
+                    self.ngrams.get(keyword[i : i + NGRAM_SIZE], set())
+                    for i in range(len(keyword) - NGRAM_SIZE + 1)
+                ),
+                key=len,
+            )
+            candidates = set.intersection(*postings)
+        return [
+            id
+            for id in candidates
+            if any(
+                keyword in self.users[id].get(field, "")
+                for field in SEARCH_FIELDS
+                if isinstance(self.users[id].get(field), str)
+            )
+        ]
+
+    def search(
+        self,
+        criteria: List[str],
+        reverse: bool,
+        include_temporary: bool,
+        keyword: Optional[str],
+        start_index: int,
+        entries: int,
+    ) -> List[int]:
+        keys: Sequence[SortKey]
+        if keyword:
+            keys = sorted(self.get_sort_key(id, criteria) for id in self.find(keyword))
+        else:
+            keys = self.get_order(tuple(criteria))
+        ids = (
+            id
+            for id in iter_ids(keys, reverse)
+            if include_temporary or "meeting_id" not in self.users[id]
+        )
+        if start_index < 0 or entries < 0:
+            return list(ids)[start_index : start_index + entries]
+        return list(islice(ids, start_index, start_index + entries))
+
+
+def iter_ids(keys: Sequence[SortKey], reverse: bool) -> Iterator[int]:
+    """
+    Yields the ids of the sorted keys. Users with equal values keep their
+    ascending order by id in reverse order, too, like with a stable sort.
+    """
+    if not reverse:
+        yield from (key[-1] for key in keys)
+        return
+    for _, group in groupby(reversed(keys), key=lambda key: key[:-1]):
+        yield from reversed([key[-1] for key in group])
+
+
+user_indexes: "WeakKeyDictionary[Engine, UserIndex]" = WeakKeyDictionary()
+indexes_lock = threading.Lock()
+
+
+def get_user_index(engine: Engine) -> UserIndex:
+    with indexes_lock:
+        if engine not in user_indexes:
+            user_indexes[engine] = UserIndex()
+        return user_indexes[engine]
+
+
 @register_presenter("get_users")
 class GetUsers(BasePresenter):
     """
     Gets all users and return some user_ids.
+
+    The users are served from the UserIndex of the worker, which is updated with
+    the changes since the last request first.
     """
 
     schema = get_users_schema
 
     def get_result(self) -> Any:
         criteria = self.get_and_check_criteria()
-        users = self.get_all_users(criteria)
-        users = self.filter_temp_users(users)
-        users = self.filter_keyword(users)
-        users = self.sort_users(users, criteria)
-        users = self.paginate_users(users)
-        return {"users": [user["id"] for user in users]}
+        index = get_user_index(self.datastore.engine)
+        with index.lock:
+            index.update(self.datastore)
+            user_ids = index.search(
+                criteria,
+                self.data.get("reverse", False),
+                self.data.get("include_temporary", False),
+                self.data.get("filter"),
+                self.data.get("start_index", 0),
+                self.data.get("entries", 100),
+            )
+        return {"users": user_ids}
 
     def get_and_check_criteria(self) -> List[str]:
         default_criteria = ["last_name", "first_name", "username"]
@@ -77,53 +262,3 @@ class GetUsers(BasePresenter):
         if not_allowed:
             raise PresenterException(f"Sort criteria '{not_allowed}' are not allowed")
         return criteria
-
-    def get_all_users(self, criteria: List[str]) -> List[Dict[str, Any]]:
-        fields = criteria[:]
-        for name in ("username", "first_name", "last_name", "id", "meeting_id"):
-            if name not in fields:
-                fields.append(name)
-
-        return list(
-            self.datastore.get_all(
-                Collection("user"),
-                fields,
-                DeletedModelsBehaviour.NO_DELETED,
-            ).values()
-        )
-
-    def filter_temp_users(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        if not self.data.get("include_temporary", False):
-            users = [user for user in users if user.get("meeting_id") is None]
-        return users
-
-    def _check_name(self, user: Dict[str, Any], name: str) -> bool:
-        return user.get(name) is not None and self.data["filter"] in user[name]
-
-    def filter_keyword(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        if self.data.get("filter"):
-            users = [
-                user
-                for user in users
-                if self._check_name(user, "username")
-                or self._check_name(user, "first_name")
-                or self._check_name(user, "last_name")
-            ]
-        return users
-
-    def sort_users(
-        self, users: List[Dict[str, Any]], criteria: List[str]
-    ) -> List[Dict[str, Any]]:
-        for user in users:
-            for crit in criteria:
-                if user.get(crit) is None:
-                    user[crit] = ALLOWED[crit]
-
-        users.sort(key=itemgetter(*criteria), reverse=self.data.get("reverse", False))
-        return users
-
-    def paginate_users(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        start_index = self.data.get("start_index", 0)
-        end_index = start_index + self.data.get("entries", 100)
-        users = users[start_index:end_index]
-        return users
@@ -1,5 +1,7 @@
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from copy import copy, deepcopy
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import simplejson as json
 from simplejson.errors import JSONDecodeError
@@ -22,12 +24,45 @@ from .deleted_models_behaviour import (
     InstanceAdditionalBehaviour,
 )
 from .http_engine import HTTPEngine as Engine
-from .interface import DatastoreService, PartialModel
+from .interface import DatastoreService, MappedFields, PartialModel
+from .metrics import DatastoreMetrics
 
 # TODO: Use proper typing here.
 DatastoreResponse = Any
 
 
+def get_mapped_fields(mapped_fields: MappedFields, collection: Collection) -> List[str]:
+    """
+    Returns the mapped fields for the given collection if they are given per
+    collection.
+    """
+    if isinstance(mapped_fields, dict):
+        return mapped_fields[collection]
+    return mapped_fields
+
+
+def get_requested_fields(get_many_request: commands.GetManyRequest) -> Set[str]:
+    """
+    Returns the fields a get_many request fetches. Since the keyword mapped_fields
+    of get_many is not supported, these are the mapped fields of the request. An
+    empty set means the full model.
+    """
+    return get_many_request.mapped_fields or set()
+
+
+class CachedModel:
+    """
+    Partial model in the request cache of the DatastoreAdapter. The attribute
+    fields contains all fields which were requested from the datastore so far
+    (including the ones the model does not have). It is None if the full model
+    was fetched.
+    """
+
+    def __init__(self, data: PartialModel, fields: Optional[Set[str]]) -> None:
+        self.data = data
+        self.fields = fields
+
+
 class DatastoreAdapter(DatastoreService):
     """
     Adapter to connect to readable and writeable datastore.
@@ -42,14 +77,23 @@ class DatastoreAdapter(DatastoreService):
         self.locked_fields = {}
         self.additional_relation_models: ModelMap = defaultdict(dict)
         self.additional_relation_models_lock: Dict[Any, Any] = defaultdict(dict)
+        self.model_cache: Dict[FullQualifiedId, CachedModel] = {}
+        self.reserved_fqids: Set[FullQualifiedId] = set()
+        self.unused_ids: Dict[Collection, List[int]] = defaultdict(list)
+        self.metrics = DatastoreMetrics()
 
     def retrieve(self, command: commands.Command) -> DatastoreResponse:
         """
         Uses engine to send data to datastore and retrieve result.
 
-        This method also checks the payload and decodes JSON body.
+        This method also checks the payload and decodes JSON body and counts the
+        call in the metrics.
         """
+        start = perf_counter()
         content, status_code = self.engine.retrieve(command.name, command.data)
+        self.metrics.add_call(command.name, len(content), perf_counter() - start)
+        if self.reads_additional_models(command):
+            self.metrics.additional_model_bypasses += 1
         if len(content):
             try:
                 payload = json.loads(content)
@@ -58,7 +102,7 @@ class DatastoreAdapter(DatastoreService):
                 raise DatastoreException(error_message)
         else:
             payload = None
-        self.logger.debug(f"Get response with status code {status_code}: {payload}")
+        self.logger.debug("Get response with status code %s: %s", status_code, payload)
         if status_code >= 400:
             error_message = f"Datastore service sends HTTP {status_code}."
             additional_error_message = (
@@ -97,11 +141,28 @@ class DatastoreAdapter(DatastoreService):
         get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
         lock_result: bool = False,
     ) -> PartialModel:
+        if fqid in self.reserved_fqids:
+            # Models with reserved ids are not written yet.
+            raise DatastoreException(f"Model '{fqid}' does not exist.")
         mapped_fields_set = set()
         if mapped_fields:
             mapped_fields_set.update(mapped_fields)
             if lock_result:
                 mapped_fields_set.add("meta_position")
+        use_cache = self.is_cacheable(position, get_deleted_models)
+        if (
+            use_cache
+            and (
+                cached_model := self.get_cached_model(
+                    fqid, mapped_fields_set, lock_result
+                )
+            )
+            is not None
+        ):
+            self.logger.debug("Use cached model %s for GET request.", fqid)
+            if lock_result:
+                self.update_locked_fields(fqid, cached_model["meta_position"])
+            return cached_model
         command = commands.Get(
             fqid=fqid,
             mapped_fields=mapped_fields_set,
@@ -109,9 +170,11 @@ class DatastoreAdapter(DatastoreService):
             get_deleted_models=get_deleted_models,
         )
         self.logger.debug(
-            f"Start GET request to datastore with the following data: {command.data}"
+            "Start GET request to datastore with the following data: %s", command.data
         )
         response = self.retrieve(command)
+        if use_cache:
+            self.update_model_cache(fqid, mapped_fields_set, response)
         if lock_result:
             instance_position = response.get("meta_position")
             if instance_position is None:
@@ -135,9 +198,19 @@ class DatastoreAdapter(DatastoreService):
             )
         if lock_result:
             for get_many_request in get_many_requests:
-                if get_many_request.mapped_fields is not None:
+                if get_many_request.mapped_fields:
                     get_many_request.mapped_fields.add("meta_position")
 
+        result: Dict[Collection, Dict[int, PartialModel]] = {}
+        use_cache = self.is_cacheable(position, get_deleted_models)
+        if use_cache:
+            get_many_requests = self.apply_model_cache_to_get_many_requests(
+                get_many_requests, lock_result, result
+            )
+            if not get_many_requests:
+                self.logger.debug("Use cached models for GET_MANY request.")
+                return result
+
         command = commands.GetMany(
             get_many_requests=get_many_requests,
             mapped_fields=mapped_fields,
@@ -145,25 +218,38 @@ class DatastoreAdapter(DatastoreService):
             get_deleted_models=get_deleted_models,
         )
         self.logger.debug(
-            f"Start GET_MANY request to datastore with the following data: {command.data}"
+            "Start GET_MANY request to datastore with the following data: %s",
+            command.data,
         )
         response = self.retrieve(command)
-        result = {}
+        mapped_fields_per_fqid: Dict[FullQualifiedId, Optional[Set[str]]] = {}
+        if use_cache:
+            for get_many_request in get_many_requests:
+                for id in get_many_request.ids:
+                    fqid = FullQualifiedId(get_many_request.collection, id)
+                    # Models requested twice are not cached since it is unclear
+                    # which fields the response contains.
+                    mapped_fields_per_fqid[fqid] = (
+                        None
+                        if fqid in mapped_fields_per_fqid
+                        else get_requested_fields(get_many_request)
+                    )
         for collection_str in response.keys():
-            inner_result = {}
             collection = Collection(collection_str)
+            inner_result = result.setdefault(collection, {})
             for id_str, value in response[collection_str].items():
                 instance_id = int(id_str)
+                fqid = FullQualifiedId(collection, instance_id)
+                if (fields := mapped_fields_per_fqid.get(fqid)) is not None:
+                    self.update_model_cache(fqid, fields, value)
                 if lock_result:
                     instance_position = value.get("meta_position")
                     if instance_position is None:
                         raise DatastoreException(
                             "Response from datastore does not contain field 'meta_position' but this is required."
                         )
-                    fqid = FullQualifiedId(collection, instance_id)
                     self.update_locked_fields(fqid, instance_position)
                 inner_result[instance_id] = value
-            result[collection] = inner_result
         return result
 
     def get_all(
@@ -184,7 +270,8 @@ class DatastoreAdapter(DatastoreService):
             get_deleted_models=get_deleted_models,
         )
         self.logger.debug(
-            f"Start GET_ALL request to datastore with the following data: {command.data}"
+            "Start GET_ALL request to datastore with the following data: %s",
+            command.data,
         )
         response = self.retrieve(command)
         if lock_result:
@@ -214,7 +301,8 @@ class DatastoreAdapter(DatastoreService):
             collection=collection, filter=full_filter, mapped_fields=set(mapped_fields)
         )
         self.logger.debug(
-            f"Start FILTER request to datastore with the following data: {command.data}"
+            "Start FILTER request to datastore with the following data: %s",
+            command.data,
         )
         response = self.retrieve(command)
         pos = response["position"]
@@ -244,7 +332,8 @@ class DatastoreAdapter(DatastoreService):
         )
         command = commands.Exists(collection=collection, filter=full_filter)
         self.logger.debug(
-            f"Start EXISTS request to datastore with the following data: {command.data}"
+            "Start EXISTS request to datastore with the following data: %s",
+            command.data,
         )
         response = self.retrieve(command)
         if lock_result:
@@ -270,7 +359,7 @@ class DatastoreAdapter(DatastoreService):
         )
         command = commands.Count(collection=collection, filter=full_filter)
         self.logger.debug(
-            f"Start COUNT request to datastore with the following data: {command.data}"
+            "Start COUNT request to datastore with the following data: %s", command.data
         )
         response = self.retrieve(command)
         if lock_result:
@@ -300,7 +389,7 @@ class DatastoreAdapter(DatastoreService):
             collection=collection, filter=full_filter, field=field, type=type
         )
         self.logger.debug(
-            f"Start MIN request to datastore with the following data: {command.data}"
+            "Start MIN request to datastore with the following data: %s", command.data
         )
         response = self.retrieve(command)
         if lock_result:
@@ -332,7 +421,7 @@ class DatastoreAdapter(DatastoreService):
             collection=collection, filter=full_filter, field=field, type=type
         )
         self.logger.debug(
-            f"Start MAX request to datastore with the following data: {command.data}"
+            "Start MAX request to datastore with the following data: %s", command.data
         )
         response = self.retrieve(command)
         if lock_result:
@@ -401,32 +490,154 @@ class DatastoreAdapter(DatastoreService):
         self.locked_fields[str(key)] = lock
 
     def reserve_ids(self, collection: Collection, amount: int) -> Sequence[int]:
-        command = commands.ReserveIds(collection=collection, amount=amount)
+        """
+        Returns new ids. Reserved but released ids are handed out first, the
+        missing ones are reserved with one request to the datastore.
+        """
+        unused_ids = self.unused_ids[collection]
+        ids = unused_ids[:amount]
+        del unused_ids[:amount]
+        if len(ids) == amount:
+            return ids
+        command = commands.ReserveIds(collection=collection, amount=amount - len(ids))
         self.logger.debug(
-            f"Start RESERVE_IDS request to datastore with the following data: "
-            f"Collection: {collection}, Amount: {amount}"
+            "Start RESERVE_IDS request to datastore with the following data: %s",
+            command.data,
         )
         response = self.retrieve(command)
-        return response.get("ids")
+        new_ids = response.get("ids")
+        self.reserved_fqids.update(FullQualifiedId(collection, id) for id in new_ids)
+        return ids + new_ids
 
     def reserve_id(self, collection: Collection) -> int:
         return self.reserve_ids(collection=collection, amount=1)[0]
 
+    def release_ids(self, collection: Collection, ids: Iterable[int]) -> None:
+        """
+        Gives back reserved ids which are not used, so reserve_ids hands them out
+        again. The datastore can not take back ids, so they are only reused
+        during this request.
+        """
+        self.unused_ids[collection] = sorted(self.unused_ids[collection] + list(ids))
+
     def write(self, write_requests: Union[List[WriteRequest], WriteRequest]) -> None:
         if isinstance(write_requests, WriteRequest):
             write_requests = [write_requests]
         command = commands.Write(write_requests=write_requests)
         self.logger.debug(
-            f"Start WRITE request to datastore with the following data: "
-            f"Write request: {write_requests}"
+            "Start WRITE request to datastore with the following data: %s",
+            command.data,
         )
+        self.model_cache.clear()
         self.retrieve(command)
+        self.reserved_fqids = {
+            FullQualifiedId(collection, id)
+            for collection, ids in self.unused_ids.items()
+            for id in ids
+        }
 
     def truncate_db(self) -> None:
         command = commands.TruncateDb()
         self.logger.debug("Start TRUNCATE_DB request to datastore")
+        self.model_cache.clear()
         self.retrieve(command)
 
+    def is_cacheable(
+        self, position: Optional[int], get_deleted_models: DeletedModelsBehaviour
+    ) -> bool:
+        """
+        Only requests for the current state of existing models use the cache.
+        """
+        return (
+            position is None and get_deleted_models == DeletedModelsBehaviour.NO_DELETED
+        )
+
+    def get_cached_model(
+        self, fqid: FullQualifiedId, mapped_fields: Set[str], lock_result: bool
+    ) -> Optional[PartialModel]:
+        """
+        Returns a copy of the requested fields of the cached model or None if
+        the cache does not contain all of them. An empty set of mapped_fields
+        requests the full model.
+        """
+        cached_model = self.model_cache.get(fqid)
+        if cached_model is None:
+            return None
+        if lock_result and "meta_position" not in cached_model.data:
+            return None
+        if not mapped_fields:
+            if cached_model.fields is not None:
+                return None
+            return deepcopy(cached_model.data)
+        if cached_model.fields is not None and not mapped_fields.issubset(
+            cached_model.fields
+        ):
+            return None
+        return {
+            field: deepcopy(cached_model.data[field])
+            for field in mapped_fields
+            if field in cached_model.data
+        }
+
+    def update_model_cache(
+        self, fqid: FullQualifiedId, mapped_fields: Set[str], instance: PartialModel
+    ) -> None:
+        """
+        Merges the fetched fields into the cached model. The cached meta_position
+        is the smallest position at which any of the cached fields was read, so
+        locking a cached model never locks too few changes. If the old fields
+        were fetched without position, they are dropped in favour of the new ones.
+        """
+        fields = set(mapped_fields) if mapped_fields else None
+        cached_model = self.model_cache.get(fqid)
+        old_position = cached_model.data.get("meta_position") if cached_model else None
+        new_position = instance.get("meta_position")
+        if cached_model is None or (old_position is None and new_position is not None):
+            self.model_cache[fqid] = CachedModel(deepcopy(instance), fields)
+            return
+        cached_model.data.update(deepcopy(instance))
+        if old_position is not None and (
+            new_position is None or old_position < new_position
+        ):
+            cached_model.data["meta_position"] = old_position
+        if fields is None:
+            cached_model.fields = None
+        elif cached_model.fields is not None:
+            cached_model.fields.update(fields)
+
+    def apply_model_cache_to_get_many_requests(
+        self,
+        get_many_requests: List[commands.GetManyRequest],
+        lock_result: bool,
+        result: Dict[Collection, Dict[int, PartialModel]],
+    ) -> List[commands.GetManyRequest]:
+        """
+        Adds all cached models to the result and returns the requests for the
+        remaining ids.
+        """
+        remaining_requests = []
+        for get_many_request in get_many_requests:
+            collection = get_many_request.collection
+            mapped_fields = get_requested_fields(get_many_request)
+            inner_result = result.setdefault(collection, {})
+            missing_ids = []
+            for id in get_many_request.ids:
+                fqid = FullQualifiedId(collection, id)
+                cached_model = self.get_cached_model(fqid, mapped_fields, lock_result)
+                if cached_model is None:
+                    missing_ids.append(id)
+                    continue
+                if lock_result:
+                    self.update_locked_fields(fqid, cached_model["meta_position"])
+                inner_result[id] = cached_model
+            if len(missing_ids) == len(get_many_request.ids):
+                remaining_requests.append(get_many_request)
+            elif missing_ids:
+                remaining_request = copy(get_many_request)
+                remaining_request.ids = missing_ids
+                remaining_requests.append(remaining_request)
+        return remaining_requests
+
     def update_additional_models(
         self, fqid: FullQualifiedId, instance: Dict[str, Any], replace: bool = False
     ) -> None:
@@ -450,32 +661,9 @@ class DatastoreAdapter(DatastoreService):
         datastore_exception: Optional[DatastoreException] = None
 
         def get_additional() -> Tuple[bool, Dict[str, Any]]:
-            if fqid in self.additional_relation_models and (
-                get_deleted_models == DeletedModelsBehaviour.ALL_MODELS
-                or (
-                    isinstance(self.additional_relation_models[fqid], DeletedModel)
-                    == (get_deleted_models == DeletedModelsBehaviour.ONLY_DELETED)
-                )
-            ):
-                complete = True
-                if mapped_fields:
-                    instance = {}
-                    for field in mapped_fields:
-                        if field in self.additional_relation_models[fqid]:
-                            instance[field] = self.additional_relation_models[fqid][
-                                field
-                            ]
-                        else:
-                            complete = False
-                else:
-                    instance = self.additional_relation_models[fqid]
-                if lock_result and fqid in self.additional_relation_models_lock:
-                    self.update_locked_fields(
-                        fqid, self.additional_relation_models_lock[fqid]
-                    )
-                return (complete, instance)
-            else:
-                return (False, {})
+            return self.get_additional_model(
+                fqid, mapped_fields, get_deleted_models, lock_result
+            )
 
         def get_db() -> Tuple[bool, Dict[str, Any], Optional[DatastoreException]]:
             try:
@@ -532,6 +720,189 @@ class DatastoreAdapter(DatastoreService):
                 raise DatastoreException(f"{fqid} not found at all.")
         return result
 
+    def fetch_models(
+        self,
+        fqids: Iterable[FullQualifiedId],
+        mapped_fields: MappedFields,
+        position: int = None,
+        get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
+        lock_result: bool = False,
+        db_additional_relevance: InstanceAdditionalBehaviour = InstanceAdditionalBehaviour.ADDITIONAL_BEFORE_DBINST,
+        exception: bool = True,
+    ) -> Dict[FullQualifiedId, Dict[str, Any]]:
+        """
+        Batched version of fetch_model: Fetches all given models with the same
+        behaviour regarding the additional relation models, but uses only one
+        get_many request for all models which have to be fetched from the
+        datastore. The mapped fields may be given per collection. Models which are
+        not found at all are missing in the result if exception is False.
+        """
+        additional: Dict[FullQualifiedId, Tuple[bool, Dict[str, Any]]] = {}
+        db_fqids: List[FullQualifiedId] = []
+        for fqid in dict.fromkeys(fqids):
+            if db_additional_relevance in (
+                InstanceAdditionalBehaviour.ONLY_ADDITIONAL,
+                InstanceAdditionalBehaviour.ADDITIONAL_BEFORE_DBINST,
+            ):
+                additional[fqid] = self.get_additional_model(
+                    fqid,
+                    get_mapped_fields(mapped_fields, fqid.collection),
+                    get_deleted_models,
+                    lock_result,
+                )
+                complete = additional[fqid][0]
+                if (
+                    not complete
+                    and db_additional_relevance
+                    == InstanceAdditionalBehaviour.ADDITIONAL_BEFORE_DBINST
+                ):
+                    db_fqids.append(fqid)
+            else:
+                db_fqids.append(fqid)
+
+        db_instances = self.get_many_by_fqids(
+            db_fqids, mapped_fields, position, get_deleted_models, lock_result
+        )
+
+        result: Dict[FullQualifiedId, Dict[str, Any]] = {}
+        missing_fqids: List[FullQualifiedId] = []
+        for fqid in dict.fromkeys(fqids):
+            db_instance = db_instances.get(fqid)
+            if db_instance is not None and lock_result:
+                self.additional_relation_models_lock[fqid] = self.locked_fields[
+                    str(fqid)
+                ]
+            if (
+                db_additional_relevance
+                == InstanceAdditionalBehaviour.DBINST_BEFORE_ADDITIONAL
+            ):
+                if db_instance is not None:
+                    result[fqid] = db_instance
+                    continue
+                okay, instance = self.get_additional_model(
+                    fqid,
+                    get_mapped_fields(mapped_fields, fqid.collection),
+                    get_deleted_models,
+                    lock_result,
+                )
+            elif db_additional_relevance == InstanceAdditionalBehaviour.ONLY_DBINST:
+                okay = db_instance is not None
+                instance = db_instance or {}
+            else:
+                _, instance = additional[fqid]
+                okay = bool(instance)
+                if db_instance is not None:
+                    okay = True
+                    instance = {**db_instance, **instance}
+            if okay:
+                result[fqid] = instance
+            else:
+                missing_fqids.append(fqid)
+        if missing_fqids and exception:
+            if db_additional_relevance == InstanceAdditionalBehaviour.ONLY_ADDITIONAL:
+                raise DatastoreException(f"{missing_fqids[0]} not found at all.")
+            raise DatastoreException(f"Model '{missing_fqids[0]}' does not exist.")
+        return result
+
+    def get_many_by_fqids(
+        self,
+        fqids: List[FullQualifiedId],
+        mapped_fields: MappedFields,
+        position: int = None,
+        get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
+        lock_result: bool = False,
+    ) -> Dict[FullQualifiedId, PartialModel]:
+        """
+        Fetches the given models with one get_many request and returns them by
+        their fqid. Models with reserved ids are skipped since they are not
+        written yet. The result is keyed by the given fqids, even if their ids are
+        strings.
+        """
+        ids_per_collection: Dict[Collection, List[int]] = defaultdict(list)
+        for fqid in fqids:
+            id = int(fqid.id)
+            if FullQualifiedId(fqid.collection, id) not in self.reserved_fqids:
+                ids_per_collection[fqid.collection].append(id)
+        if not ids_per_collection:
+            return {}
+        response = self.get_many(
+            [
+                commands.GetManyRequest(
+                    collection,
+                    ids,
+                    get_mapped_fields(mapped_fields, collection),
+                )
+                for collection, ids in ids_per_collection.items()
+            ],
+            position=position,
+            get_deleted_models=get_deleted_models,
+            lock_result=lock_result,
+        )
+        return {
+            fqid: response[fqid.collection][int(fqid.id)]
+            for fqid in fqids
+            if int(fqid.id) in response.get(fqid.collection, {})
+        }
+
+    def get_additional_model(
+        self,
+        fqid: FullQualifiedId,
+        mapped_fields: List[str],
+        get_deleted_models: DeletedModelsBehaviour,
+        lock_result: bool,
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Returns the requested fields of the given model from the additional relation
+        models and whether all of them were found.
+        """
+        if fqid in self.additional_relation_models and (
+            get_deleted_models == DeletedModelsBehaviour.ALL_MODELS
+            or (
+                isinstance(self.additional_relation_models[fqid], DeletedModel)
+                == (get_deleted_models == DeletedModelsBehaviour.ONLY_DELETED)
+            )
+        ):
+            complete = True
+            if mapped_fields:
+                instance = {}
+                for field in mapped_fields:
+                    if field in self.additional_relation_models[fqid]:
+                        instance[field] = self.additional_relation_models[fqid][field]
+                    else:
+                        complete = False
+            else:
+                instance = self.additional_relation_models[fqid]
+            if lock_result and fqid in self.additional_relation_models_lock:
+                self.update_locked_fields(
+                    fqid, self.additional_relation_models_lock[fqid]
+                )
+            return (complete, instance)
+        else:
+            return (False, {})
+
+    def reads_additional_models(self, command: commands.Command) -> bool:
+        """
+        Returns whether the command reads a model which has pending changes in the
+        additional relation models, i. e. it should probably use fetch_model.
+        """
+        if not self.additional_relation_models:
+            return False
+        if isinstance(command, commands.Get):
+            return command.fqid in self.additional_relation_models
+        if isinstance(command, commands.GetMany):
+            return any(
+                FullQualifiedId(request.collection, id)
+                in self.additional_relation_models
+                for request in command.get_many_requests
+                for id in request.ids
+            )
+        return False
+
     def reset(self) -> None:
         self.additional_relation_models.clear()
         self.additional_relation_models_lock.clear()
+        self.model_cache.clear()
+        # The models with reserved ids are discarded, so all ids can be used again.
+        self.unused_ids.clear()
+        for fqid in sorted(self.reserved_fqids, key=lambda fqid: fqid.id):
+            self.unused_ids[fqid.collection].append(fqid.id)
@@ -73,8 +73,14 @@ class Command:
     Command is the base class for commands used by the Engine interface.
 
     The property 'name' returns by default the name of the class converted to snake case.
+    The property 'data' returns the encoded body of the command. It is encoded only
+    once, so the command must not be changed after the first access.
     """
 
+    def __init__(self) -> None:
+        self._data: Optional[str] = None
+        self._encoded = False
+
     @property
     def name(self) -> str:
         name = type(self).__name__
@@ -84,6 +90,12 @@ class Command:
 
     @property
     def data(self) -> Optional[str]:
+        if not self._encoded:
+            self._data = self.encode()
+            self._encoded = True
+        return self._data
+
+    def encode(self) -> Optional[str]:
         return json.dumps(self.get_raw_data())
 
     def get_raw_data(self) -> CommandData:
@@ -107,6 +119,7 @@ class Get(Command):
         position: int = None,
         get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
     ) -> None:
+        super().__init__()
         self.fqid = fqid
         self.mapped_fields = mapped_fields
         self.position = position
@@ -136,6 +149,7 @@ class GetMany(Command):
         position: int = None,
         get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
     ) -> None:
+        super().__init__()
         self.get_many_requests = get_many_requests
         self.mapped_fields = mapped_fields
         self.position = position
@@ -170,6 +184,7 @@ class GetAll(Command):
         mapped_fields: Set[str] = None,
         get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
     ) -> None:
+        super().__init__()
         self.collection = collection
         self.mapped_fields = mapped_fields
         self.get_deleted_models = get_deleted_models
@@ -190,6 +205,7 @@ class Exists(Command):
     """
 
     def __init__(self, collection: Collection, filter: FilterInterface) -> None:
+        super().__init__()
         self.collection = collection
         self.filter = filter
 
@@ -203,6 +219,7 @@ class Count(Command):
     """
 
     def __init__(self, collection: Collection, filter: FilterInterface) -> None:
+        super().__init__()
         self.collection = collection
         self.filter = filter
 
@@ -222,6 +239,7 @@ class Min(Command):
         field: str,
         type: str = None,
     ) -> None:
+        super().__init__()
         self.collection = collection
         self.filter = filter
         self.field = field
@@ -250,6 +268,7 @@ class Max(Command):
         field: str,
         type: str = None,
     ) -> None:
+        super().__init__()
         self.collection = collection
         self.filter = filter
         self.field = field
@@ -277,6 +296,7 @@ class Filter(Command):
         filter: FilterInterface,
         mapped_fields: Set[str] = None,
     ) -> None:
+        super().__init__()
         self.collection = collection
         self.filter = filter
         self.mapped_fields = mapped_fields
@@ -297,6 +317,7 @@ class ReserveIds(Command):
     """
 
     def __init__(self, collection: Collection, amount: int) -> None:
+        super().__init__()
         self.collection = collection
         self.amount = amount
 
@@ -310,10 +331,10 @@ class Write(Command):
     """
 
     def __init__(self, write_requests: List[WriteRequest]) -> None:
+        super().__init__()
         self.write_requests = write_requests
 
-    @property
-    def data(self) -> str:
+    def encode(self) -> str:
         stringified_write_requests: StringifiedWriteRequests = []
         for write_request in self.write_requests:
             information = {}
@@ -344,6 +365,5 @@ class TruncateDb(Command):
     TruncateDb command. Does not need data.
     """
 
-    @property
-    def data(self) -> None:
+    def encode(self) -> None:
         pass
@@ -1,14 +1,23 @@
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...shared.exceptions import DatastoreConnectionException
 from ...shared.interfaces.logging import LoggingModule
 
+DEFAULT_POOL_SIZE = 10
+
+PoolMetrics = Dict[str, int]
+
 
 class HTTPEngine:
     """
     HTTP implementation of the Engine interface
+
+    Reader and writer use separate sessions so that each of them keeps its own
+    pool of keep-alive connections. The engine is a singleton per worker process,
+    so all requests of one worker share these pools.
     """
 
     READER_ENDPOINTS = [
@@ -28,11 +37,30 @@ class HTTPEngine:
         datastore_reader_url: str,
         datastore_writer_url: str,
         logging: LoggingModule,
+        pool_size: Optional[int] = None,
     ):
         self.logger = logging.getLogger(__name__)
         self.datastore_reader_url = datastore_reader_url
         self.datastore_writer_url = datastore_writer_url
         self.headers = {"Content-Type": "application/json"}
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        self.reader_session = self.create_session()
+        self.writer_session = self.create_session()
+
+    def create_session(self) -> requests.Session:
+        """
+        Creates a session with a connection pool of the configured size. The
+        pool blocks if all connections are in use so that the number of
+        connections to the datastore never exceeds the pool size.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_size, pool_block=True
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.headers)
+        return session
 
     def retrieve(self, endpoint: str, data: Optional[str]) -> Tuple[bytes, int]:
         """
@@ -44,15 +72,51 @@ class HTTPEngine:
         # TODO: Check and test this error handling.
         if endpoint in self.READER_ENDPOINTS:
             base_url = self.datastore_reader_url
+            session = self.reader_session
         elif endpoint in self.WRITER_ENDPOINTS:
             base_url = self.datastore_writer_url
+            session = self.writer_session
         else:
             raise DatastoreConnectionException(f"Endpoint {endpoint} does not exist.")
         url = "/".join((base_url, endpoint))
 
         try:
-            response = requests.post(url=url, data=data, headers=self.headers)
+            response = session.post(url=url, data=data)
         except requests.exceptions.ConnectionError as e:
             error_message = f"Cannot reach the datastore service on {url}. Error: {e}"
             raise DatastoreConnectionException(error_message)
         return response.content, response.status_code
+
+    def get_pool_metrics(self) -> Dict[str, PoolMetrics]:
+        """
+        Returns metrics of the reader and writer connection pools: the number of
+        requests sent, the number of connections opened so far and the number of
+        idle connections currently kept alive.
+        """
+        return {
+            "reader": self.get_session_metrics(self.reader_session),
+            "writer": self.get_session_metrics(self.writer_session),
+        }
+
+    def get_session_metrics(self, session: requests.Session) -> PoolMetrics:
+        metrics = {
+            "pool_size": self.pool_size,
+            "requests": 0,
+            "connections": 0,
+            "idle_connections": 0,
+        }
+        adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+        for adapter in adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                metrics["requests"] += pool.num_requests
+                metrics["connections"] += pool.num_connections
+                if pool.pool is not None:
+                    # Unused slots of the pool are filled with None.
+                    metrics["idle_connections"] += sum(
+                        1 for conn in list(pool.pool.queue) if conn is not None
+                    )
+        return metrics
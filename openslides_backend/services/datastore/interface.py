@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from typing_extensions import Protocol
 
@@ -12,8 +12,10 @@ from .deleted_models_behaviour import (
     DeletedModelsBehaviour,
     InstanceAdditionalBehaviour,
 )
+from .metrics import DatastoreMetrics
 
 PartialModel = Dict[str, Any]
+MappedFields = Union[List[str], Dict[Collection, List[str]]]
 
 
 class DatastoreService(Protocol):
@@ -24,6 +26,8 @@ class DatastoreService(Protocol):
     # The key of this dictionary is a stringified FullQualifiedId or FullQualifiedField
     locked_fields: Dict[str, CollectionFieldLock]
     additional_relation_models: ModelMap
+    metrics: DatastoreMetrics
+    engine: "Engine"
 
     def get(
         self,
@@ -110,6 +114,9 @@ class DatastoreService(Protocol):
     def reserve_id(self, collection: Collection) -> int:
         ...
 
+    def release_ids(self, collection: Collection, ids: Iterable[int]) -> None:
+        ...
+
     def write(self, write_requests: Union[List[WriteRequest], WriteRequest]) -> None:
         ...
 
@@ -133,6 +140,18 @@ class DatastoreService(Protocol):
     ) -> Dict[str, Any]:
         ...
 
+    def fetch_models(
+        self,
+        fqids: Iterable[FullQualifiedId],
+        mapped_fields: MappedFields,
+        position: int = None,
+        get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
+        lock_result: bool = False,
+        db_additional_relevance: InstanceAdditionalBehaviour = InstanceAdditionalBehaviour.ADDITIONAL_BEFORE_DBINST,
+        exception: bool = True,
+    ) -> Dict[FullQualifiedId, Dict[str, Any]]:
+        ...
+
     def reset(self) -> None:
         ...
 
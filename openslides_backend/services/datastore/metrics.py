@@ -0,0 +1,59 @@
+from collections import defaultdict
+from typing import Dict
+
+
+class DatastoreMetrics:
+    """
+    Counters for the calls of a DatastoreAdapter to the datastore: the number of
+    calls per command, the received bytes, the time spent waiting for the
+    datastore and the number of reads of models which have pending changes in
+    the additional relation models.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.response_bytes = 0
+        self.latency = 0.0
+        self.additional_model_bypasses = 0
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def add_call(self, command: str, response_bytes: int, latency: float) -> None:
+        self.calls[command] += 1
+        self.response_bytes += response_bytes
+        self.latency += latency
+
+    def add(self, other: "DatastoreMetrics") -> None:
+        for command, count in other.calls.items():
+            self.calls[command] += count
+        self.response_bytes += other.response_bytes
+        self.latency += other.latency
+        self.additional_model_bypasses += other.additional_model_bypasses
+
+    def copy(self) -> "DatastoreMetrics":
+        metrics = DatastoreMetrics()
+        metrics.add(self)
+        return metrics
+
+    def __sub__(self, other: "DatastoreMetrics") -> "DatastoreMetrics":
+        metrics = self.copy()
+        for command, count in other.calls.items():
+            metrics.calls[command] -= count
+            if not metrics.calls[command]:
+                del metrics.calls[command]
+        metrics.response_bytes -= other.response_bytes
+        metrics.latency -= other.latency
+        metrics.additional_model_bypasses -= other.additional_model_bypasses
+        return metrics
+
+    def __str__(self) -> str:
+        calls = ", ".join(
+            f"{command}: {count}" for command, count in sorted(self.calls.items())
+        )
+        return (
+            f"{self.total_calls} calls ({calls}), {self.response_bytes} bytes, "
+            f"{self.latency * 1000:.1f} ms, "
+            f"{self.additional_model_bypasses} additional model bypasses"
+        )
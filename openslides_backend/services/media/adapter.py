@@ -1,25 +1,46 @@
+from typing import Iterator, Optional
+
 import requests
+import simplejson as json
+from requests.adapters import HTTPAdapter
 
 from ...shared.exceptions import MediaServiceException
 from ...shared.interfaces.logging import LoggingModule
 from .interface import MediaService
 
+DEFAULT_POOL_SIZE = 10
+CHUNK_SIZE = 1024 * 1024
+
 
 class MediaServiceAdapter(MediaService):
     """
     Adapter to connect to media service.
+
+    The adapter is a singleton per worker process, so all uploads of one worker
+    share the pool of keep-alive connections of its session.
     """
 
-    def __init__(self, media_url: str, logging: LoggingModule) -> None:
+    def __init__(
+        self, media_url: str, logging: LoggingModule, pool_size: Optional[int] = None
+    ) -> None:
         self.logger = logging.getLogger(__name__)
         self.media_url = media_url + "/"
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size or DEFAULT_POOL_SIZE,
+            pool_block=True,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
 
     def _upload(self, file: str, id: int, mimetype: str, subpath: str) -> None:
         url = self.media_url + subpath + "/"
-        payload = {"file": file, "id": id, "mimetype": mimetype}
+        body = UploadBody(file, id, mimetype)
         self.logger.debug("Starting upload of file")
         try:
-            response = requests.post(url, json=payload)
+            response = self.session.post(url, data=body)
         except requests.exceptions.ConnectionError:
             msg = "Connect to mediaservice failed."
             self.logger.debug("Upload of file: " + msg)
@@ -38,3 +59,44 @@ class MediaServiceAdapter(MediaService):
     def upload_resource(self, file: str, id: int, mimetype: str) -> None:
         subpath = "upload_resource"
         self._upload(file, id, mimetype, subpath)
+
+
+class UploadBody:
+    """
+    JSON body of an upload request which yields the base64 encoded file in chunks
+    of CHUNK_SIZE characters, so the file is never copied as a whole. Since the
+    length is known in advance, requests streams the body with a Content-Length
+    header instead of using chunked transfer encoding.
+    """
+
+    def __init__(self, file: str, id: int, mimetype: str) -> None:
+        self.file = file
+        self.prefix = json.dumps({"id": id, "mimetype": mimetype})[:-1] + ', "file": "'
+        self.suffix = '"}'
+        # Valid base64 strings do not contain characters which need escaping.
+        self.needs_escaping = not (
+            file.isascii()
+            and file.isprintable()
+            and '"' not in file
+            and "\\" not in file
+        )
+        if self.needs_escaping:
+            file_length = sum(len(chunk) for chunk in self.iter_file())
+        else:
+            file_length = len(file)
+        self.length = len(self.prefix) + file_length + len(self.suffix)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix.encode()
+        yield from self.iter_file()
+        yield self.suffix.encode()
+
+    def iter_file(self) -> Iterator[bytes]:
+        for index in range(0, len(self.file), CHUNK_SIZE):
+            chunk = self.file[index : index + CHUNK_SIZE]
+            if self.needs_escaping:
+                chunk = json.dumps(chunk)[1:-1]
+            yield chunk.encode()
@@ -10,12 +10,16 @@ from .interface import PermissionService
 
 class PermissionHTTPAdapter(PermissionService):
     """
-    Adapter to connect to permission service.
+    Adapter to connect to permission service. The adapter is a singleton per
+    worker process, so all requests share the keep-alive connections of its
+    session.
     """
 
     def __init__(self, permission_url: str, logging: LoggingModule) -> None:
         self.endpoint = permission_url + "/is_allowed"
         self.logger = logging.getLogger(__name__)
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
 
     def is_allowed(
         self, name: str, user_id: int, data_list: List[Dict[str, Any]]
@@ -25,11 +29,7 @@ class PermissionHTTPAdapter(PermissionService):
         )
 
         try:
-            response = requests.post(
-                url=self.endpoint,
-                data=payload,
-                headers={"Content-Type": "application/json"},
-            )
+            response = self.session.post(url=self.endpoint, data=payload)
         except requests.exceptions.ConnectionError as e:
             self.logger.error(
                 f"Cannot reach the permission service on {self.endpoint}. Error: {e}"
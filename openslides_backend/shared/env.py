@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 
 
 def is_truthy(value: str) -> bool:
@@ -12,3 +13,34 @@ def is_truthy(value: str) -> bool:
 def is_dev_mode() -> bool:
     dev = os.environ.get("OPENSLIDES_DEVELOPMENT", "off")
     return is_truthy(dev)
+
+
+def get_query_budget() -> Optional[int]:
+    """
+    Returns the maximum number of datastore calls per action or None if there is
+    no budget.
+    """
+    budget = os.environ.get("OPENSLIDES_BACKEND_QUERY_BUDGET")
+    if not budget:
+        return None
+    if not budget.isdigit() or int(budget) <= 0:
+        raise ValueError(
+            "Value of OPENSLIDES_BACKEND_QUERY_BUDGET must be a positive integer."
+        )
+    return int(budget)
+
+
+JSON_ENCODERS = ("simplejson", "orjson")
+
+
+def get_json_encoder() -> str:
+    """
+    Returns the name of the JSON encoder for the response bodies. Defaults to
+    simplejson, orjson is optional and has to be installed separately.
+    """
+    encoder = os.environ.get("OPENSLIDES_BACKEND_JSON_ENCODER", "simplejson")
+    if encoder not in JSON_ENCODERS:
+        raise ValueError(
+            f"Value of OPENSLIDES_BACKEND_JSON_ENCODER must be one of {JSON_ENCODERS}."
+        )
+    return encoder
@@ -1,24 +1,28 @@
-from typing import Protocol
+from typing import Any, Protocol
 
 
 class Logger(Protocol):  # pragma: no cover
     """
     Interface for logger object provided by LoggingModule.
+
+    The message may contain %-style placeholders for the additional arguments.
+    They are only formatted if the message is emitted, so use them instead of
+    f-strings for expensive values.
     """
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any) -> None:
         ...
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         ...
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         ...
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         ...
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         ...
 
 
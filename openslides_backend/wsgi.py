@@ -25,9 +25,15 @@ class OpenSlidesBackendServices(containers.DeclarativeContainer):
     permission = providers.Singleton(
         PermissionHTTPAdapter, config.permission_url, logging
     )
-    media = providers.Singleton(MediaServiceAdapter, config.media_url, logging)
+    media = providers.Singleton(
+        MediaServiceAdapter, config.media_url, logging, config.media_pool_size
+    )
     engine = providers.Singleton(
-        HTTPEngine, config.datastore_reader_url, config.datastore_writer_url, logging
+        HTTPEngine,
+        config.datastore_reader_url,
+        config.datastore_writer_url,
+        logging,
+        config.datastore_pool_size,
     )
     datastore = providers.Factory(DatastoreAdapter, engine, logging)
 
@@ -79,6 +85,8 @@ def create_wsgi_application(logging: LoggingModule, view_name: str) -> WSGIAppli
             "media_url": environment["media_url"],
             "datastore_reader_url": environment["datastore_reader_url"],
             "datastore_writer_url": environment["datastore_writer_url"],
+            "datastore_pool_size": environment["datastore_pool_size"],
+            "media_pool_size": environment["media_pool_size"],
         },
         logging=logging,
     )
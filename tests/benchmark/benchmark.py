@@ -0,0 +1,217 @@
+import logging
+import sys
+from copy import deepcopy
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, List, Optional
+from unittest.mock import MagicMock, Mock
+
+from openslides_backend.action.action_handler import ActionHandler
+from openslides_backend.presenter.presenter import PresenterHandler
+from openslides_backend.services.datastore.adapter import DatastoreAdapter
+from openslides_backend.services.datastore.interface import DatastoreService
+from openslides_backend.services.permission.interface import PermissionService
+
+from .fake_engine import EngineStats, FakeEngine
+from .fixtures import MEETING_ID, OPTION_IDS, POLL_ID, SIZES, create_meeting_fixture
+
+ADMIN_ID = 1
+BULK_SIZE = 100
+
+
+class BenchmarkServices:
+    """
+    Service container for the benchmarks. The datastore uses the given fake
+    engine, all other services are mocked.
+    """
+
+    def __init__(self, engine: FakeEngine) -> None:
+        self.engine = engine
+        self._authentication = MagicMock()
+        self._media = MagicMock()
+        self._permission = Mock(PermissionService)
+        self._permission.is_allowed = MagicMock(return_value=True)
+
+    def authentication(self) -> Any:
+        return self._authentication
+
+    def permission(self) -> Any:
+        return self._permission
+
+    def datastore(self) -> DatastoreService:
+        return DatastoreAdapter(self.engine, logging)  # type: ignore
+
+    def media(self) -> Any:
+        return self._media
+
+
+class Scenario:
+    """
+    A single request to the action or presenter handler. The payload is built
+    from the size of the meeting fixture.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: str,
+        get_payload: Callable[[int], Any],
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.get_payload = get_payload
+
+    def run(self, services: BenchmarkServices, size: int) -> Any:
+        payload = self.get_payload(size)
+        if self.handler == "action":
+            return ActionHandler(services, logging).handle_request(  # type: ignore
+                payload, ADMIN_ID
+            )
+        return PresenterHandler(services, logging).handle_request(  # type: ignore
+            payload, ADMIN_ID
+        )
+
+
+SCENARIOS = [
+    Scenario(
+        "motion.create",
+        "action",
+        lambda size: [
+            {
+                "action": "motion.create",
+                "data": [
+                    {
+                        "meeting_id": MEETING_ID,
+                        "title": "Benchmark motion",
+                        "text": "<p>Benchmark text</p>",
+                    }
+                ],
+            }
+        ],
+    ),
+    Scenario(
+        "motion.create_bulk",
+        "action",
+        lambda size: [
+            {
+                "action": "motion.create",
+                "data": [
+                    {
+                        "meeting_id": MEETING_ID,
+                        "title": f"Benchmark motion {i}",
+                        "text": "<p>Benchmark text</p>",
+                        "agenda_create": True,
+                    }
+                    for i in range(BULK_SIZE)
+                ],
+            }
+        ],
+    ),
+    Scenario(
+        "poll.vote",
+        "action",
+        lambda size: [
+            {
+                "action": "poll.vote",
+                "data": [
+                    {
+                        "id": POLL_ID,
+                        "user_id": size + 1,
+                        "value": {str(OPTION_IDS[0]): "Y", str(OPTION_IDS[1]): "N"},
+                    }
+                ],
+            }
+        ],
+    ),
+    Scenario(
+        "user.update",
+        "action",
+        lambda size: [
+            {
+                "action": "user.update",
+                "data": [
+                    {
+                        "id": size + 1,
+                        "first_name": "Updated",
+                        "group_$_ids": {str(MEETING_ID): [1]},
+                    }
+                ],
+            }
+        ],
+    ),
+    Scenario(
+        "motion.delete",
+        "action",
+        lambda size: [{"action": "motion.delete", "data": [{"id": size}]}],
+    ),
+    Scenario(
+        "get_users",
+        "presenter",
+        lambda size: [
+            {
+                "presenter": "get_users",
+                "data": {"filter": "delegate1", "entries": 50},
+            }
+        ],
+    ),
+]
+
+
+class BenchmarkResult:
+    def __init__(
+        self, scenario: str, size: int, times: List[float], stats: EngineStats
+    ) -> None:
+        self.scenario = scenario
+        self.size = size
+        self.time = median(times)
+        self.stats = stats
+
+    def format(self) -> str:
+        calls = ", ".join(
+            f"{endpoint}={count}"
+            for endpoint, count in sorted(self.stats.calls.items())
+        )
+        return (
+            f"{self.scenario:<14} {self.size:>6} {self.time * 1000:>10.2f} "
+            f"{self.stats.time * 1000:>12.2f} {self.stats.total_calls:>6} "
+            f"{self.stats.bytes_sent:>10} {self.stats.bytes_received:>10}  {calls}"
+        )
+
+
+def run_scenario(scenario: Scenario, size: int, repeat: int = 5) -> BenchmarkResult:
+    """
+    Runs the scenario repeat times on a fresh copy of the meeting fixture. The
+    wall time is the median of all runs, the datastore statistics (including the
+    time spent in the fake engine) are the ones of the last run.
+    """
+    fixture = create_meeting_fixture(size)
+    times = []
+    for _ in range(repeat):
+        engine = FakeEngine()
+        engine.set_models(deepcopy(fixture))
+        services = BenchmarkServices(engine)
+        start = perf_counter()
+        scenario.run(services, size)
+        times.append(perf_counter() - start)
+    return BenchmarkResult(scenario.name, size, times, engine.stats)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Runs all scenarios or the ones given as arguments for all fixture sizes and
+    prints wall time, datastore calls and bytes per request.
+    """
+    names = args or [scenario.name for scenario in SCENARIOS]
+    print(
+        f"{'scenario':<14} {'size':>6} {'time (ms)':>10} {'engine (ms)':>12} "
+        f"{'calls':>6} {'bytes sent':>10} {'bytes recv':>10}  calls per endpoint"
+    )
+    for scenario in SCENARIOS:
+        if scenario.name not in names:
+            continue
+        for size in SIZES:
+            print(run_scenario(scenario, size).format())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,99 @@
+import sys
+import tracemalloc
+from copy import deepcopy
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from .fixtures import MEETING_ID
+
+INSTANCES_SIZE = 1000
+TEXT_SIZE = 10000
+
+ActionData = List[Dict[str, Any]]
+
+
+def create_action_data(size: int, text_size: int = TEXT_SIZE) -> ActionData:
+    """
+    Builds the data of a motion.create payload element with the given number of
+    instances, each with lists and a text of text_size characters.
+    """
+    return [
+        {
+            "meeting_id": MEETING_ID,
+            "title": f"Motion {id}",
+            "text": "x" * text_size,
+            "reason": f"<p>Reason {id}</p>",
+            "submitter_ids": [1, 2, 3],
+            "tag_ids": [1, 2],
+            "supporter_ids": list(range(1, 11)),
+            "amendment_paragraph_$": {"1": "<p>Paragraph</p>"},
+        }
+        for id in range(1, size + 1)
+    ]
+
+
+def copy_deep(action_data: ActionData) -> ActionData:
+    return deepcopy(action_data)
+
+
+def copy_shallow(action_data: ActionData) -> ActionData:
+    """
+    The copy used by ActionHandler.perform_action.
+    """
+    return [dict(instance) for instance in action_data]
+
+
+COPIES: List[Callable[[ActionData], ActionData]] = [copy_deep, copy_shallow]
+
+
+class CopyResult:
+    def __init__(self, copy: str, size: int, times: List[float], peak: int) -> None:
+        self.copy = copy
+        self.size = size
+        self.time = median(times)
+        self.peak = peak
+
+    def format(self) -> str:
+        return (
+            f"{self.copy:<14} {self.size:>6} {self.time * 1000:>10.2f} "
+            f"{self.peak // 1024:>10}"
+        )
+
+
+def run_copy(
+    copy: Callable[[ActionData], ActionData],
+    size: int,
+    text_size: int = TEXT_SIZE,
+    repeat: int = 5,
+) -> CopyResult:
+    """
+    Copies the action data repeat times. The time is the median of all runs,
+    the memory peak is measured in a separate run.
+    """
+    action_data = create_action_data(size, text_size)
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        copy(action_data)
+        times.append(perf_counter() - start)
+    tracemalloc.start()
+    copy(action_data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return CopyResult(copy.__name__, size, times, peak)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Compares the copies of the action data for the given number of instances
+    (default 1000) and prints wall time and memory peak.
+    """
+    size = int(args[0]) if args else INSTANCES_SIZE
+    print(f"{'copy':<14} {'size':>6} {'time (ms)':>10} {'peak (kB)':>10}")
+    for copy in COPIES:
+        print(run_copy(copy, size).format())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,96 @@
+import sys
+import tracemalloc
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Iterable, List, Optional
+
+import simplejson as json
+
+from openslides_backend.http.json_encoder import iter_json, orjson
+
+RESULTS_SIZE = 10000
+
+
+def create_response_body(size: int) -> Any:
+    """
+    Builds the response body of a bulk action with the given number of results.
+    """
+    return {
+        "success": True,
+        "message": "Actions handled successfully",
+        "results": [
+            [
+                {"id": id, "sequential_number": id, "number": f"A{id:05}"}
+                for id in range(1, size + 1)
+            ]
+        ],
+    }
+
+
+def encode_dumps(body: Any) -> Iterable[bytes]:
+    return [json.dumps(body).encode()]
+
+
+def encode_orjson(body: Any) -> Iterable[bytes]:
+    return [orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)]
+
+
+ENCODERS: List[Callable[[Any], Iterable[bytes]]] = [encode_dumps, iter_json]
+if orjson is not None:
+    ENCODERS.append(encode_orjson)
+
+
+class EncoderResult:
+    def __init__(
+        self, encoder: str, size: int, times: List[float], peak: int, length: int
+    ) -> None:
+        self.encoder = encoder
+        self.size = size
+        self.time = median(times)
+        self.peak = peak
+        self.length = length
+
+    def format(self) -> str:
+        return (
+            f"{self.encoder:<14} {self.size:>6} {self.time * 1000:>10.2f} "
+            f"{self.peak // 1024:>10} {self.length:>10}"
+        )
+
+
+def run_encoder(
+    encode: Callable[[Any], Iterable[bytes]], size: int, repeat: int = 5
+) -> EncoderResult:
+    """
+    Encodes the response body repeat times and consumes the chunks like a WSGI
+    server. The time is the median of all runs, the memory peak is measured in
+    a separate run and includes the chunks which are alive at the same time.
+    """
+    body = create_response_body(size)
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        length = sum(len(chunk) for chunk in encode(body))
+        times.append(perf_counter() - start)
+    tracemalloc.start()
+    sum(len(chunk) for chunk in encode(body))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return EncoderResult(encode.__name__, size, times, peak, length)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Compares the JSON encoders for response bodies for the given number of
+    results (default 10000) and prints wall time, memory peak and body length.
+    """
+    size = int(args[0]) if args else RESULTS_SIZE
+    print(
+        f"{'encoder':<14} {'size':>6} {'time (ms)':>10} {'peak (kB)':>10} "
+        f"{'bytes':>10}"
+    )
+    for encode in ENCODERS:
+        print(run_encoder(encode, size).format())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
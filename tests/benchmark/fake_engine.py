@@ -0,0 +1,266 @@
+import re
+from collections import defaultdict
+from copy import deepcopy
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import simplejson as json
+
+from openslides_backend.services.datastore.deleted_models_behaviour import (
+    DeletedModelsBehaviour,
+)
+from openslides_backend.shared.patterns import KEYSEPARATOR
+
+Model = Dict[str, Any]
+
+
+class EngineStats:
+    """
+    Counts the calls of each endpoint of the engine together with the bytes sent
+    and received and the time spent in the engine.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.time = 0.0
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+
+class FakeEngine:
+    """
+    In-process implementation of the Engine interface. It keeps the current
+    state of all models in memory and answers the commands of the
+    DatastoreAdapter like the datastore reader and writer would.
+
+    There is no history: Requests with a position are answered with the current
+    state, and locked fields are not checked since all requests are executed
+    one after another.
+    """
+
+    def __init__(self) -> None:
+        self.models: Dict[str, Model] = {}
+        self.max_ids: Dict[str, int] = defaultdict(int)
+        self.position = 0
+        self.stats = EngineStats()
+        self.endpoints: Dict[str, Callable[[Any], Any]] = {
+            "get": self.get,
+            "get_many": self.get_many,
+            "get_all": self.get_all,
+            "filter": self.filter,
+            "exists": self.exists,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "reserve_ids": self.reserve_ids,
+            "write": self.write,
+            "truncate_db": self.truncate_db,
+        }
+
+    def retrieve(self, endpoint: str, data: Optional[str]) -> Tuple[bytes, int]:
+        start = perf_counter()
+        self.stats.calls[endpoint] += 1
+        self.stats.bytes_sent += len(data) if data else 0
+        try:
+            response = self.endpoints[endpoint](json.loads(data) if data else {})
+            content, status_code = (
+                b"" if response is None else json.dumps(response).encode(),
+                200,
+            )
+        except ModelDoesNotExist as error:
+            content = json.dumps(
+                {"error": {"type_verbose": "MODEL_DOES_NOT_EXIST", "fqid": error.fqid}}
+            ).encode()
+            status_code = 400
+        self.stats.bytes_received += len(content)
+        self.stats.time += perf_counter() - start
+        return content, status_code
+
+    def set_models(self, models: Dict[str, Model]) -> None:
+        """
+        Writes the given models directly without a write request.
+        """
+        self.position += 1
+        for fqid, fields in models.items():
+            collection, id = fqid.split(KEYSEPARATOR)
+            model = {"id": int(id), **fields}
+            model["meta_position"] = self.position
+            model["meta_deleted"] = False
+            self.models[fqid] = model
+            self.max_ids[collection] = max(self.max_ids[collection], int(id))
+
+    def get(self, data: Dict[str, Any]) -> Model:
+        model = self.models.get(data["fqid"])
+        if model is None or not self.matches_deleted(
+            model, data.get("get_deleted_models")
+        ):
+            raise ModelDoesNotExist(data["fqid"])
+        return self.map_fields(model, data.get("mapped_fields"))
+
+    def get_many(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Model]]:
+        result: Dict[str, Dict[str, Model]] = {}
+        for request in data["requests"]:
+            collection = request["collection"]
+            models = result.setdefault(collection, {})
+            for id in request["ids"]:
+                model = self.models.get(f"{collection}{KEYSEPARATOR}{id}")
+                if model is not None and self.matches_deleted(
+                    model, data.get("get_deleted_models")
+                ):
+                    models[str(id)] = self.map_fields(
+                        model, request.get("mapped_fields")
+                    )
+        return result
+
+    def get_all(self, data: Dict[str, Any]) -> Dict[str, Model]:
+        return {
+            str(model["id"]): self.map_fields(model, data.get("mapped_fields"))
+            for model in self.get_collection(data["collection"])
+            if self.matches_deleted(model, data.get("get_deleted_models"))
+        }
+
+    def filter(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "position": self.position,
+            "data": {
+                str(model["id"]): self.map_fields(model, data.get("mapped_fields"))
+                for model in self.filter_collection(data)
+            },
+        }
+
+    def exists(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        exists = any(True for _ in self.filter_collection(data))
+        return {"exists": exists, "position": self.position}
+
+    def count(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        count = sum(1 for _ in self.filter_collection(data))
+        return {"count": count, "position": self.position}
+
+    def min(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        values = self.get_values(data)
+        return {"min": min(values) if values else None, "position": self.position}
+
+    def max(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        values = self.get_values(data)
+        return {"max": max(values) if values else None, "position": self.position}
+
+    def reserve_ids(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        collection = data["collection"]
+        first_id = self.max_ids[collection] + 1
+        self.max_ids[collection] += data["amount"]
+        return {"ids": list(range(first_id, self.max_ids[collection] + 1))}
+
+    def write(self, data: List[Dict[str, Any]]) -> None:
+        for write_request in data:
+            self.position += 1
+            for event in write_request["events"]:
+                self.apply_event(event)
+
+    def truncate_db(self, data: Dict[str, Any]) -> None:
+        self.models.clear()
+        self.max_ids.clear()
+        self.position = 0
+
+    def apply_event(self, event: Dict[str, Any]) -> None:
+        fqid = event["fqid"]
+        collection, id = fqid.split(KEYSEPARATOR)
+        if event["type"] == "create":
+            model = {"id": int(id), **event["fields"]}
+            self.max_ids[collection] = max(self.max_ids[collection], int(id))
+        else:
+            model = self.models[fqid]
+        if event["type"] == "update":
+            for field, value in (event.get("fields") or {}).items():
+                if value is None:
+                    model.pop(field, None)
+                else:
+                    model[field] = value
+            list_fields = event.get("list_fields") or {}
+            for field, values in list_fields.get("add", {}).items():
+                model[field] = model.get(field, []) + [
+                    value for value in values if value not in model.get(field, [])
+                ]
+            for field, values in list_fields.get("remove", {}).items():
+                model[field] = [
+                    value for value in model.get(field, []) if value not in values
+                ]
+        model["meta_position"] = self.position
+        model["meta_deleted"] = event["type"] == "delete"
+        self.models[fqid] = model
+
+    def get_collection(self, collection: str) -> List[Model]:
+        prefix = collection + KEYSEPARATOR
+        return [model for fqid, model in self.models.items() if fqid.startswith(prefix)]
+
+    def filter_collection(self, data: Dict[str, Any]) -> List[Model]:
+        return [
+            model
+            for model in self.get_collection(data["collection"])
+            if matches_filter(model, data["filter"])
+        ]
+
+    def get_values(self, data: Dict[str, Any]) -> List[Any]:
+        return [
+            model[data["field"]]
+            for model in self.filter_collection(data)
+            if model.get(data["field"]) is not None
+        ]
+
+    def matches_deleted(
+        self, model: Model, get_deleted_models: Optional[int] = None
+    ) -> bool:
+        if get_deleted_models == DeletedModelsBehaviour.ALL_MODELS:
+            return True
+        if get_deleted_models == DeletedModelsBehaviour.ONLY_DELETED:
+            return model["meta_deleted"]
+        return not model["meta_deleted"]
+
+    def map_fields(self, model: Model, mapped_fields: Optional[List[str]]) -> Model:
+        if not mapped_fields:
+            return deepcopy(model)
+        return {
+            field: deepcopy(model[field]) for field in mapped_fields if field in model
+        }
+
+
+class ModelDoesNotExist(Exception):
+    def __init__(self, fqid: str) -> None:
+        self.fqid = fqid
+
+
+def matches_filter(model: Model, filter: Dict[str, Any]) -> bool:
+    """
+    Evaluates a filter in the format of the datastore against the given model.
+    """
+    if "and_filter" in filter:
+        return all(matches_filter(model, f) for f in filter["and_filter"])
+    if "or_filter" in filter:
+        return any(matches_filter(model, f) for f in filter["or_filter"])
+    if "not_filter" in filter:
+        return not matches_filter(model, filter["not_filter"])
+    value = model.get(filter["field"])
+    operator = filter["operator"]
+    if operator == "=":
+        return value == filter["value"]
+    if operator == "!=":
+        return value != filter["value"]
+    if operator == "~=":
+        return str(value).lower() == str(filter["value"]).lower()
+    if operator == "%=":
+        pattern = re.escape(filter["value"]).replace("%", ".*")
+        return value is not None and bool(re.fullmatch(pattern, value, re.IGNORECASE))
+    if value is None:
+        return False
+    if operator == "<":
+        return value < filter["value"]
+    if operator == "<=":
+        return value <= filter["value"]
+    if operator == ">":
+        return value > filter["value"]
+    if operator == ">=":
+        return value >= filter["value"]
+    raise NotImplementedError(f"Filter operator {operator} is not supported.")
@@ -0,0 +1,185 @@
+from typing import Any, Dict
+
+from openslides_backend.models.models import Poll
+
+SIZES = (10, 100, 1000)
+
+MEETING_ID = 1
+DELEGATE_GROUP_ID = 3
+POLL_ID = 1
+OPTION_IDS = [1, 2, 3]
+
+
+def create_meeting_fixture(size: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the models of a synthetic meeting with the given number of
+    delegates, motions and votes. User 1 is a superadmin, the delegates have the
+    ids 2 to size + 1. The delegates have already voted for the first option of
+    the started poll 1, except for the last one.
+    """
+    user_ids = list(range(2, size + 2))
+    motion_ids = list(range(1, size + 1))
+    vote_ids = list(range(1, size))
+    models: Dict[str, Dict[str, Any]] = {
+        "organisation/1": {
+            "name": "Benchmark organisation",
+            "committee_ids": [1],
+            "enable_electronic_voting": True,
+        },
+        "committee/1": {
+            "name": "Benchmark committee",
+            "organisation_id": 1,
+            "meeting_ids": [MEETING_ID],
+        },
+        f"meeting/{MEETING_ID}": {
+            "name": f"Benchmark meeting with {size} delegates",
+            "committee_id": 1,
+            "default_group_id": 1,
+            "admin_group_id": 2,
+            "group_ids": [1, 2, DELEGATE_GROUP_ID],
+            "user_ids": [1] + user_ids,
+            "motions_default_workflow_id": 1,
+            "motions_default_amendment_workflow_id": 1,
+            "motions_default_statute_amendment_workflow_id": 1,
+            "motion_workflow_ids": [1],
+            "motion_state_ids": [1, 2],
+            "motion_ids": motion_ids,
+            "motion_submitter_ids": motion_ids,
+            "list_of_speakers_ids": motion_ids,
+            "agenda_item_ids": motion_ids,
+            "poll_ids": [POLL_ID],
+            "option_ids": OPTION_IDS,
+            "vote_ids": vote_ids,
+            "motions_number_type": "serially_numbered",
+        },
+        "group/1": {"name": "Default", "meeting_id": MEETING_ID},
+        "group/2": {
+            "name": "Admin",
+            "meeting_id": MEETING_ID,
+            "admin_group_for_meeting_id": MEETING_ID,
+            "user_ids": [1],
+        },
+        f"group/{DELEGATE_GROUP_ID}": {
+            "name": "Delegates",
+            "meeting_id": MEETING_ID,
+            "user_ids": user_ids,
+            "permissions": ["motion.can_create", "user.can_see"],
+            "poll_ids": [POLL_ID],
+        },
+        "motion_workflow/1": {
+            "name": "Simple workflow",
+            "meeting_id": MEETING_ID,
+            "first_state_id": 1,
+            "state_ids": [1, 2],
+            "default_workflow_meeting_id": MEETING_ID,
+            "default_amendment_workflow_meeting_id": MEETING_ID,
+            "default_statute_amendment_workflow_meeting_id": MEETING_ID,
+        },
+        "motion_state/1": {
+            "name": "submitted",
+            "css_class": "lightblue",
+            "meeting_id": MEETING_ID,
+            "workflow_id": 1,
+            "first_state_of_workflow_id": 1,
+            "set_number": True,
+            "next_state_ids": [2],
+            "motion_ids": motion_ids,
+        },
+        "motion_state/2": {
+            "name": "accepted",
+            "css_class": "green",
+            "meeting_id": MEETING_ID,
+            "workflow_id": 1,
+            "previous_state_ids": [1],
+        },
+        f"poll/{POLL_ID}": {
+            "title": "Benchmark poll",
+            "type": Poll.TYPE_NAMED,
+            "pollmethod": "YNA",
+            "majority_method": "simple",
+            "onehundred_percent_base": "YNA",
+            "state": Poll.STATE_STARTED,
+            "meeting_id": MEETING_ID,
+            "option_ids": OPTION_IDS,
+            "entitled_group_ids": [DELEGATE_GROUP_ID],
+            "voted_ids": user_ids[:-1],
+            "votescast": f"{size - 1}.000000",
+            "votesvalid": f"{size - 1}.000000",
+            "min_votes_amount": 1,
+            "max_votes_amount": 3,
+        },
+    }
+    models["user/1"] = {
+        "username": "admin",
+        "organisation_management_level": "superadmin",
+        "is_active": True,
+        "group_$_ids": [str(MEETING_ID)],
+        f"group_${MEETING_ID}_ids": [2],
+    }
+    for index, user_id in enumerate(user_ids):
+        models[f"user/{user_id}"] = {
+            "username": f"delegate{user_id}",
+            "first_name": f"First {user_id}",
+            "last_name": f"Last {size - index}",
+            "is_active": True,
+            "is_physical_person": True,
+            "group_$_ids": [str(MEETING_ID)],
+            f"group_${MEETING_ID}_ids": [DELEGATE_GROUP_ID],
+            "is_present_in_meeting_ids": [MEETING_ID],
+            f"vote_weight_${MEETING_ID}": "1.000000",
+            "poll_voted_$_ids": [str(MEETING_ID)],
+            f"poll_voted_${MEETING_ID}_ids": [POLL_ID] if index < size - 1 else [],
+        }
+    for id in OPTION_IDS:
+        models[f"option/{id}"] = {
+            "text": f"Option {id}",
+            "meeting_id": MEETING_ID,
+            "poll_id": POLL_ID,
+            "weight": id,
+            "yes": f"{size - 1}.000000" if id == OPTION_IDS[0] else "0.000000",
+            "no": "0.000000",
+            "abstain": "0.000000",
+            "vote_ids": vote_ids if id == OPTION_IDS[0] else [],
+        }
+    for vote_id, user_id in zip(vote_ids, user_ids):
+        models[f"vote/{vote_id}"] = {
+            "value": "Y",
+            "weight": "1.000000",
+            "meeting_id": MEETING_ID,
+            "option_id": OPTION_IDS[0],
+            "user_id": user_id,
+        }
+        models[f"user/{user_id}"]["vote_$_ids"] = [str(MEETING_ID)]
+        models[f"user/{user_id}"][f"vote_${MEETING_ID}_ids"] = [vote_id]
+    for id, user_id in zip(motion_ids, user_ids):
+        models[f"motion/{id}"] = {
+            "title": f"Motion {id}",
+            "text": f"<p>Text of motion {id}</p>",
+            "meeting_id": MEETING_ID,
+            "state_id": 1,
+            "sequential_number": id,
+            "number": str(id),
+            "number_value": id,
+            "submitter_ids": [id],
+            "list_of_speakers_id": id,
+            "agenda_item_id": id,
+        }
+        models[f"motion_submitter/{id}"] = {
+            "meeting_id": MEETING_ID,
+            "motion_id": id,
+            "user_id": user_id,
+            "weight": 1,
+        }
+        models[f"user/{user_id}"]["submitted_motion_$_ids"] = [str(MEETING_ID)]
+        models[f"user/{user_id}"][f"submitted_motion_${MEETING_ID}_ids"] = [id]
+        models[f"list_of_speakers/{id}"] = {
+            "meeting_id": MEETING_ID,
+            "content_object_id": f"motion/{id}",
+        }
+        models[f"agenda_item/{id}"] = {
+            "meeting_id": MEETING_ID,
+            "content_object_id": f"motion/{id}",
+            "item_number": str(id),
+            "weight": id,
+        }
+    return models
@@ -0,0 +1,133 @@
+from unittest import TestCase
+
+from .benchmark import BULK_SIZE, SCENARIOS, BenchmarkServices, run_scenario
+from .copy_benchmark import COPIES, create_action_data, run_copy
+from .encoder_benchmark import ENCODERS, run_encoder
+from .fake_engine import FakeEngine, matches_filter
+from .fixtures import OPTION_IDS, POLL_ID, create_meeting_fixture
+
+SIZE = 10
+
+
+class BenchmarkTester(TestCase):
+    """
+    Runs all benchmark scenarios once on the smallest fixture to make sure they
+    still work.
+    """
+
+    def setUp(self) -> None:
+        self.engine = FakeEngine()
+        self.engine.set_models(create_meeting_fixture(SIZE))
+        self.services = BenchmarkServices(self.engine)
+
+    def run_scenario(self, name: str) -> None:
+        scenario = next(scenario for scenario in SCENARIOS if scenario.name == name)
+        scenario.run(self.services, SIZE)
+
+    def test_motion_create(self) -> None:
+        self.run_scenario("motion.create")
+        motion = self.engine.models[f"motion/{SIZE + 1}"]
+        assert motion["sequential_number"] == SIZE + 1
+        assert motion["number"] == str(SIZE + 1)
+        assert motion["state_id"] == 1
+
+    def test_motion_create_bulk(self) -> None:
+        self.run_scenario("motion.create_bulk")
+        for i in range(1, BULK_SIZE + 1):
+            motion = self.engine.models[f"motion/{SIZE + i}"]
+            assert motion["sequential_number"] == SIZE + i
+            assert motion["number"] == str(SIZE + i)
+            assert motion["agenda_item_id"]
+            assert motion["list_of_speakers_id"]
+        assert self.engine.stats.calls["get"] < 10
+        assert self.engine.stats.calls["get_many"] < 20
+        # the motion numbers and the uniqueness of all motion submitters
+        assert self.engine.stats.calls["filter"] == 2
+        assert "exists" not in self.engine.stats.calls
+        # motion, motion_submitter, agenda_item and list_of_speakers
+        assert self.engine.stats.calls["reserve_ids"] == 4
+        assert self.engine.stats.calls["write"] == 1
+
+    def test_poll_vote(self) -> None:
+        self.run_scenario("poll.vote")
+        assert SIZE + 1 in self.engine.models[f"poll/{POLL_ID}"]["voted_ids"]
+        assert self.engine.models[f"option/{OPTION_IDS[0]}"]["yes"] == f"{SIZE}.000000"
+        assert self.engine.models[f"option/{OPTION_IDS[1]}"]["no"] == "1.000000"
+
+    def test_user_update(self) -> None:
+        self.run_scenario("user.update")
+        user = self.engine.models[f"user/{SIZE + 1}"]
+        assert user["first_name"] == "Updated"
+        assert user["group_$1_ids"] == [1]
+
+    def test_motion_delete(self) -> None:
+        self.run_scenario("motion.delete")
+        for collection in (
+            "motion",
+            "motion_submitter",
+            "list_of_speakers",
+            "agenda_item",
+        ):
+            assert self.engine.models[f"{collection}/{SIZE}"]["meta_deleted"]
+        assert "get" not in self.engine.stats.calls
+
+    def test_get_users(self) -> None:
+        self.run_scenario("get_users")
+        assert self.engine.stats.calls["get_all"] == 1
+
+    def test_get_users_index(self) -> None:
+        self.run_scenario("get_users")
+        self.engine.set_models({"user/3": {"username": "delegate10b"}})
+        self.engine.set_models({"user/11": {"username": "removed"}})
+        scenario = next(
+            scenario for scenario in SCENARIOS if scenario.name == "get_users"
+        )
+        result = scenario.run(self.services, SIZE)
+        assert result == [{"users": [3, 10]}]
+        assert self.engine.stats.calls["get_all"] == 1
+        assert self.engine.stats.calls["filter"] == 1
+
+    def test_run_scenario(self) -> None:
+        result = run_scenario(SCENARIOS[0], SIZE, repeat=1)
+        assert result.stats.calls["write"] == 1
+        assert result.stats.bytes_sent > 0
+        assert result.stats.bytes_received > 0
+
+
+class EncoderBenchmarkTester(TestCase):
+    def test_run_encoder(self) -> None:
+        lengths = {run_encoder(encode, SIZE, repeat=1).length for encode in ENCODERS}
+        assert all(length > 0 for length in lengths)
+
+
+class CopyBenchmarkTester(TestCase):
+    def test_run_copy(self) -> None:
+        for copy in COPIES:
+            assert run_copy(copy, SIZE, text_size=10, repeat=1).time >= 0
+
+    def test_copies_equal(self) -> None:
+        action_data = create_action_data(SIZE, 10)
+        assert all(copy(action_data) == action_data for copy in COPIES)
+
+
+class FakeEngineTester(TestCase):
+    def test_filter(self) -> None:
+        model = {"meeting_id": 1, "number": "A1", "weight": 3}
+        assert matches_filter(
+            model,
+            {
+                "and_filter": [
+                    {"field": "meeting_id", "operator": "=", "value": 1},
+                    {"not_filter": {"field": "weight", "operator": "<", "value": 2}},
+                    {
+                        "or_filter": [
+                            {"field": "number", "operator": "~=", "value": "a1"},
+                            {"field": "number", "operator": "=", "value": None},
+                        ]
+                    },
+                ]
+            },
+        )
+        assert not matches_filter(
+            model, {"field": "number", "operator": "%=", "value": "B%"}
+        )
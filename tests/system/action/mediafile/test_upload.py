@@ -1,7 +1,10 @@
 import base64
+from io import BytesIO
 from time import time
 from typing import cast
 
+from PyPDF2 import PdfFileWriter
+
 from openslides_backend.permissions.permissions import Permissions
 from tests.system.action.base import BaseActionTestCase
 
@@ -109,6 +112,28 @@ class MediafileUploadActionTest(BaseActionTestCase):
             file_content, 1, "application/pdf"
         )
 
+    def test_upload_pdf_pages(self) -> None:
+        self.create_model("meeting/110", {"name": "name_DsJFXoot"})
+        writer = PdfFileWriter()
+        for _ in range(3):
+            writer.addBlankPage(100, 100)
+        bytes_io = BytesIO()
+        writer.write(bytes_io)
+        file_content = base64.b64encode(bytes_io.getvalue()).decode()
+        response = self.request(
+            "mediafile.upload",
+            {
+                "title": "title_xXRGTLAJ",
+                "meeting_id": 110,
+                "filename": "test.pdf",
+                "file": file_content,
+            },
+        )
+        self.assert_status_code(response, 200)
+        mediafile = self.get_model("mediafile/1")
+        assert mediafile.get("filesize") == len(bytes_io.getvalue())
+        assert mediafile.get("pdf_information") == {"pages": 3}
+
     def test_error_in_resource_upload(self) -> None:
         self.create_model("meeting/110", {"name": "name_DsJFXoot"})
         filename = "raises_upload_error.swf"
@@ -75,3 +75,75 @@ class MeetingDeleteAllSpeakersOfAllListsActionTest(BaseActionTestCase):
         self.assert_model_deleted("speaker/1")
         self.assert_model_deleted("speaker/2")
         self.assert_model_deleted("speaker/3")
+
+    def test_with_users(self) -> None:
+        self.set_models(
+            {
+                "list_of_speakers/11": {"meeting_id": 110, "speaker_ids": [1, 2]},
+                "list_of_speakers/12": {"meeting_id": 110, "speaker_ids": [3]},
+                "speaker/1": {
+                    "list_of_speakers_id": 11,
+                    "meeting_id": 110,
+                    "user_id": 5,
+                },
+                "speaker/2": {
+                    "list_of_speakers_id": 11,
+                    "meeting_id": 110,
+                    "user_id": 6,
+                },
+                "speaker/3": {
+                    "list_of_speakers_id": 12,
+                    "meeting_id": 110,
+                    "user_id": 5,
+                },
+                "user/5": {
+                    "speaker_$_ids": ["110", "111"],
+                    "speaker_$110_ids": [1, 3],
+                    "speaker_$111_ids": [4],
+                },
+                "user/6": {"speaker_$_ids": ["110"], "speaker_$110_ids": [2]},
+                "meeting/110": {
+                    "name": "name_srtgb123",
+                    "list_of_speakers_ids": [11, 12],
+                    "speaker_ids": [1, 2, 3],
+                },
+            }
+        )
+        response = self.request("meeting.delete_all_speakers_of_all_lists", {"id": 110})
+        self.assert_status_code(response, 200)
+        for id in (1, 2, 3):
+            self.assert_model_deleted(f"speaker/{id}")
+        self.assert_model_exists("list_of_speakers/11", {"speaker_ids": []})
+        self.assert_model_exists("list_of_speakers/12", {"speaker_ids": []})
+        self.assert_model_exists("meeting/110", {"speaker_ids": []})
+        self.assert_model_exists(
+            "user/5",
+            {
+                "speaker_$_ids": ["111"],
+                "speaker_$110_ids": [],
+                "speaker_$111_ids": [4],
+            },
+        )
+        self.assert_model_exists(
+            "user/6", {"speaker_$_ids": [], "speaker_$110_ids": []}
+        )
+
+    def test_speaker_without_meeting_id(self) -> None:
+        self.set_models(
+            {
+                "list_of_speakers/11": {"meeting_id": 110, "speaker_ids": [1]},
+                "speaker/1": {"list_of_speakers_id": 11, "user_id": 5},
+                "user/5": {"speaker_$_ids": ["110"], "speaker_$110_ids": [1]},
+                "meeting/110": {
+                    "name": "name_srtgb123",
+                    "list_of_speakers_ids": [11],
+                    "speaker_ids": [1],
+                },
+            }
+        )
+        response = self.request("meeting.delete_all_speakers_of_all_lists", {"id": 110})
+        self.assert_status_code(response, 200)
+        self.assert_model_deleted("speaker/1")
+        self.assert_model_exists(
+            "user/5", {"speaker_$_ids": [], "speaker_$110_ids": []}
+        )
@@ -56,6 +56,27 @@ class MotionCreateActionTestSequentialNumber(BaseActionTestCase):
         model = self.get_model("motion/2")
         self.assertEqual(model.get("sequential_number"), 2)
 
+    def test_create_sequential_numbers_multiple_motions(self) -> None:
+        self.create_model("meeting/222", {"name": "meeting222"})
+        self.create_workflow()
+
+        response = self.request_multi(
+            "motion.create",
+            [
+                {
+                    "title": f"motion_title{i}",
+                    "meeting_id": 222,
+                    "workflow_id": 12,
+                    "text": "test",
+                }
+                for i in range(3)
+            ],
+        )
+        self.assert_status_code(response, 200)
+        for i in range(1, 4):
+            model = self.get_model(f"motion/{i}")
+            self.assertEqual(model.get("sequential_number"), i)
+
     def test_create_sequential_numbers_2meetings(self) -> None:
         self.set_models(
             {
@@ -348,6 +348,53 @@ class MotionSetNumberMixinTest(BaseActionTestCase):
         assert model.get("number") == "025"
         assert model.get("number_value") == 25
 
+    def test_create_set_number_multiple_motions(self) -> None:
+        self.set_models(
+            {
+                "meeting/222": {
+                    "name": "name_SNLGsvIV",
+                    "motions_number_min_digits": 3,
+                    "motions_number_type": "per_category",
+                },
+                "motion_workflow/12": {
+                    "name": "name_workflow1",
+                    "first_state_id": 34,
+                    "state_ids": [34],
+                },
+                "motion_state/34": {
+                    "name": "name_state34",
+                    "meeting_id": 222,
+                    "set_number": True,
+                },
+                "motion_category/176": {
+                    "name": "name_category_176",
+                    "meeting_id": 222,
+                    "prefix": "A",
+                },
+            }
+        )
+
+        response = self.request_multi(
+            "motion.create",
+            [
+                {
+                    "title": f"test_Xcdfgee_{i}",
+                    "meeting_id": 222,
+                    "workflow_id": 12,
+                    "text": "test",
+                    "category_id": 176,
+                }
+                for i in range(2)
+            ],
+        )
+        self.assert_status_code(response, 200)
+        model = self.get_model("motion/1")
+        assert model.get("number") == "A001"
+        assert model.get("number_value") == 1
+        model = self.get_model("motion/2")
+        assert model.get("number") == "A002"
+        assert model.get("number_value") == 2
+
     def test_set_number_false(self) -> None:
         self.set_models(
             {
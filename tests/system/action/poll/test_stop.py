@@ -22,6 +22,61 @@ class PollStopActionTest(BaseActionTestCase):
         assert countdown.get("running") is False
         assert countdown.get("countdown_time") == 60
 
+    def test_stop_recount_options(self) -> None:
+        self.set_models(
+            {
+                "meeting/1": {},
+                "poll/1": {
+                    "state": "started",
+                    "type": "named",
+                    "meeting_id": 1,
+                    "option_ids": [1],
+                    "global_option_id": 2,
+                },
+                "option/1": {
+                    "poll_id": 1,
+                    "meeting_id": 1,
+                    "yes": "5.000000",
+                    "no": "0.000000",
+                    "abstain": "0.000000",
+                    "vote_ids": [1, 2, 3],
+                },
+                "option/2": {
+                    "used_as_global_option_in_poll_id": 1,
+                    "meeting_id": 1,
+                    "yes": "1.000000",
+                },
+                "vote/1": {"option_id": 1, "value": "Y", "weight": "2.000000"},
+                "vote/2": {"option_id": 1, "value": "N", "weight": "1.000000"},
+                "vote/3": {"option_id": 1, "value": "Y", "weight": "1.500000"},
+            }
+        )
+        response = self.request("poll.stop", {"id": 1})
+        self.assert_status_code(response, 200)
+        option = self.get_model("option/1")
+        assert option.get("yes") == "3.500000"
+        assert option.get("no") == "1.000000"
+        assert option.get("abstain") == "0.000000"
+        global_option = self.get_model("option/2")
+        assert global_option.get("yes") == "0.000000"
+
+    def test_stop_analog_keeps_results(self) -> None:
+        self.set_models(
+            {
+                "meeting/1": {},
+                "poll/1": {
+                    "state": "started",
+                    "type": "analog",
+                    "meeting_id": 1,
+                    "option_ids": [1],
+                },
+                "option/1": {"poll_id": 1, "meeting_id": 1, "yes": "5.000000"},
+            }
+        )
+        response = self.request("poll.stop", {"id": 1})
+        self.assert_status_code(response, 200)
+        assert self.get_model("option/1").get("yes") == "5.000000"
+
     def test_stop_wrong_state(self) -> None:
         self.create_model("poll/1", {"state": "published"})
         response = self.request("poll.stop", {"id": 1})
@@ -1735,3 +1735,133 @@ class VotePollPseudoAnonymousN(VotePollBaseTestClass):
         self.assert_status_code(response, 400)
         assert "Option 1 has not a right value. (int, str)." in response.json["message"]
         self.assert_model_not_exists("vote/1")
+
+    def test_vote_adds_to_option_totals(self) -> None:
+        self.set_models(
+            {
+                "organisation/1": {"enable_electronic_voting": True},
+                "group/1": {"user_ids": [1]},
+                "option/11": {
+                    "meeting_id": 113,
+                    "poll_id": 1,
+                    "yes": "5.000000",
+                    "no": "1.500000",
+                    "abstain": "0.000000",
+                },
+                "user/1": {
+                    "is_present_in_meeting_ids": [113],
+                    "group_$113_ids": [1],
+                    "group_$_ids": ["113"],
+                    "vote_weight_$113": "2.500000",
+                },
+                "poll/1": {
+                    "title": "my test poll",
+                    "option_ids": [11],
+                    "pollmethod": "YN",
+                    "meeting_id": 113,
+                    "entitled_group_ids": [1],
+                    "state": Poll.STATE_STARTED,
+                    "min_votes_amount": 1,
+                    "max_votes_amount": 10,
+                },
+                "meeting/113": {"name": "my meeting"},
+            }
+        )
+        response = self.request(
+            "poll.vote", {"id": 1, "user_id": 1, "value": {"11": "N"}}
+        )
+        self.assert_status_code(response, 200)
+        option = self.get_model("option/11")
+        assert option.get("yes") == "5.000000"
+        assert option.get("no") == "4.000000"
+        assert option.get("abstain") == "0.000000"
+
+    def test_vote_multiple_users(self) -> None:
+        self.set_models(
+            {
+                "organisation/1": {"enable_electronic_voting": True},
+                "group/1": {"user_ids": [1, 2]},
+                "option/11": {"meeting_id": 113, "poll_id": 1},
+                "option/12": {"meeting_id": 113, "poll_id": 1},
+                "user/1": {
+                    "is_present_in_meeting_ids": [113],
+                    "group_$113_ids": [1],
+                    "group_$_ids": ["113"],
+                },
+                "user/2": {
+                    "username": "test2",
+                    "is_present_in_meeting_ids": [113],
+                    "group_$113_ids": [1],
+                    "group_$_ids": ["113"],
+                    "vote_weight_$113": "2.000000",
+                },
+                "poll/1": {
+                    "title": "my test poll",
+                    "option_ids": [11, 12],
+                    "pollmethod": "YNA",
+                    "meeting_id": 113,
+                    "entitled_group_ids": [1],
+                    "state": Poll.STATE_STARTED,
+                    "min_votes_amount": 1,
+                    "max_votes_amount": 10,
+                },
+                "meeting/113": {"name": "my meeting"},
+            }
+        )
+        response = self.request_multi(
+            "poll.vote",
+            [
+                {"id": 1, "user_id": 1, "value": {"11": "Y", "12": "A"}},
+                {"id": 1, "user_id": 2, "value": {"11": "Y", "12": "N"}},
+            ],
+        )
+        self.assert_status_code(response, 200)
+        option = self.get_model("option/11")
+        assert option.get("vote_ids") == [1, 3]
+        assert option.get("yes") == "3.000000"
+        assert option.get("no") == "0.000000"
+        assert option.get("abstain") == "0.000000"
+        option = self.get_model("option/12")
+        assert option.get("vote_ids") == [2, 4]
+        assert option.get("yes") == "0.000000"
+        assert option.get("no") == "2.000000"
+        assert option.get("abstain") == "1.000000"
+        poll = self.get_model("poll/1")
+        assert poll.get("voted_ids") == [1, 2]
+        assert poll.get("votescast") == "2.000000"
+        assert poll.get("votesvalid") == "3.000000"
+
+    def test_vote_multiple_users_double_vote(self) -> None:
+        self.set_models(
+            {
+                "organisation/1": {"enable_electronic_voting": True},
+                "group/1": {"user_ids": [1]},
+                "option/11": {"meeting_id": 113, "poll_id": 1},
+                "user/1": {
+                    "is_present_in_meeting_ids": [113],
+                    "group_$113_ids": [1],
+                    "group_$_ids": ["113"],
+                },
+                "poll/1": {
+                    "title": "my test poll",
+                    "option_ids": [11],
+                    "pollmethod": "Y",
+                    "meeting_id": 113,
+                    "entitled_group_ids": [1],
+                    "state": Poll.STATE_STARTED,
+                    "min_votes_amount": 1,
+                    "max_votes_amount": 10,
+                },
+                "meeting/113": {"name": "my meeting"},
+            }
+        )
+        response = self.request_multi(
+            "poll.vote",
+            [
+                {"id": 1, "user_id": 1, "value": {"11": 1}},
+                {"id": 1, "user_id": 1, "value": {"11": 1}},
+            ],
+        )
+        self.assert_status_code(response, 400)
+        assert "Only one vote per poll per user allowed." in response.json["message"]
+        self.assert_model_not_exists("vote/1")
@@ -1,11 +1,12 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import simplejson as json
 
 from openslides_backend.services.datastore import commands
 from openslides_backend.services.datastore.adapter import DatastoreAdapter
 from openslides_backend.services.datastore.interface import GetManyRequest
+from openslides_backend.shared.exceptions import DatastoreException
 from openslides_backend.shared.filters import FilterOperator, Or
 from openslides_backend.shared.interfaces.write_request import WriteRequest
 from openslides_backend.shared.patterns import Collection, FullQualifiedId
@@ -15,6 +16,7 @@ class DatastoreAdapterTester(TestCase):
     def setUp(self) -> None:
         self.engine = Mock()
         log = Mock()
+        self.logger = log.getLogger.return_value
         self.db = DatastoreAdapter(self.engine, log)
 
     def test_get(self) -> None:
@@ -220,6 +222,38 @@ class DatastoreAdapterTester(TestCase):
         self.engine.retrieve.assert_called_with("reserve_ids", command.data)
         assert new_id == 42
 
+    def test_release_ids(self) -> None:
+        collection = Collection("a")
+        self.engine.retrieve.return_value = json.dumps({"ids": [1, 2, 3]}), 200
+        assert self.db.reserve_ids(collection, 3) == [1, 2, 3]
+        self.db.release_ids(collection, [3, 2])
+        self.engine.retrieve.return_value = json.dumps({"ids": [4]}), 200
+        assert self.db.reserve_ids(collection, 3) == [2, 3, 4]
+        self.engine.retrieve.assert_called_with(
+            "reserve_ids", commands.ReserveIds(collection=collection, amount=1).data
+        )
+        assert self.db.metrics.calls == {"reserve_ids": 2}
+
+    def test_reset_releases_ids(self) -> None:
+        collection = Collection("a")
+        self.engine.retrieve.return_value = json.dumps({"ids": [1, 2]}), 200
+        self.db.reserve_ids(collection, 2)
+        self.db.reset()
+        assert self.db.reserve_ids(collection, 2) == [1, 2]
+        assert self.db.metrics.calls == {"reserve_ids": 1}
+
+    def test_write_keeps_unused_ids(self) -> None:
+        collection = Collection("a")
+        self.engine.retrieve.return_value = json.dumps({"ids": [1, 2]}), 200
+        self.db.reserve_ids(collection, 2)
+        self.db.release_ids(collection, [2])
+        self.engine.retrieve.return_value = "", 200
+        self.db.write(
+            WriteRequest(events=[], information={}, user_id=42, locked_fields={})
+        )
+        assert self.db.reserved_fqids == {FullQualifiedId(collection, 2)}
+        assert self.db.reserve_id(collection) == 2
+
     def test_write_new_style(self) -> None:
         write_requests = [
             WriteRequest(events=[], information={}, user_id=42, locked_fields={})
@@ -243,3 +277,263 @@ class DatastoreAdapterTester(TestCase):
             command.data
             == '[{"events": [], "information": {}, "user_id": 42, "locked_fields": {}}]'
         )
+
+    def test_get_cached(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = json.dumps({"f": 1, "g": 2}), 200
+        self.db.get(fqid, ["f", "g"])
+        assert self.db.get(fqid, ["f"]) == {"f": 1}
+        assert self.engine.retrieve.call_count == 1
+
+    def test_get_cached_missing_field(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(fqid, ["f", "g"])
+        assert self.db.get(fqid, ["g"]) == {}
+        assert self.engine.retrieve.call_count == 1
+
+    def test_get_cached_merge_fields(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(fqid, ["f"])
+        self.engine.retrieve.return_value = json.dumps({"g": 2}), 200
+        self.db.get(fqid, ["g"])
+        assert self.engine.retrieve.call_count == 2
+        assert self.db.get(fqid, ["f", "g"]) == {"f": 1, "g": 2}
+        assert self.engine.retrieve.call_count == 2
+
+    def test_get_cached_full_model(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = (
+            json.dumps({"f": 1, "meta_deleted": False, "meta_position": 3}),
+            200,
+        )
+        self.db.get(fqid)
+        assert self.db.get(fqid, ["f", "g"], lock_result=True) == {
+            "f": 1,
+            "meta_position": 3,
+        }
+        assert self.engine.retrieve.call_count == 1
+        assert self.db.locked_fields == {str(fqid): 3}
+
+    def test_get_cached_lock_without_position(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(fqid, ["f"])
+        self.engine.retrieve.return_value = (
+            json.dumps({"f": 2, "meta_position": 5}),
+            200,
+        )
+        assert self.db.get(fqid, ["f"], lock_result=True) == {
+            "f": 2,
+            "meta_position": 5,
+        }
+        assert self.engine.retrieve.call_count == 2
+        assert self.db.get(fqid, ["f"]) == {"f": 2}
+        assert self.engine.retrieve.call_count == 2
+
+    def test_get_cached_keeps_lowest_position(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = (
+            json.dumps({"f": 1, "meta_position": 3}),
+            200,
+        )
+        self.db.get(fqid, ["f"], lock_result=True)
+        self.engine.retrieve.return_value = (
+            json.dumps({"g": 1, "meta_position": 5}),
+            200,
+        )
+        self.db.get(fqid, ["g"], lock_result=True)
+        self.db.locked_fields = {}
+        self.db.get(fqid, ["f", "g"], lock_result=True)
+        assert self.engine.retrieve.call_count == 2
+        assert self.db.locked_fields == {str(fqid): 3}
+
+    def test_get_cached_returns_copy(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = json.dumps({"f": [1, 2]}), 200
+        self.db.get(fqid, ["f"])["f"].remove(1)
+        self.db.get(fqid, ["f"])["f"].remove(1)
+        assert self.db.get(fqid, ["f"]) == {"f": [1, 2]}
+
+    def test_get_not_cached_with_position(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(fqid, ["f"])
+        self.db.get(fqid, ["f"], position=1)
+        assert self.engine.retrieve.call_count == 2
+
+    def test_get_cache_cleared(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(fqid, ["f"])
+        self.db.reset()
+        self.db.get(fqid, ["f"])
+        self.engine.retrieve.return_value = "", 200
+        self.db.write(
+            WriteRequest(events=[], information={}, user_id=42, locked_fields={})
+        )
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(fqid, ["f"])
+        assert self.engine.retrieve.call_count == 4
+
+    def test_get_many_cached(self) -> None:
+        collection = Collection("a")
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(FullQualifiedId(collection, 1), ["f"])
+        self.engine.retrieve.return_value = (
+            json.dumps({"a": {"2": {"f": 2}}}),
+            200,
+        )
+        result = self.db.get_many([GetManyRequest(collection, [1, 2], ["f"])])
+        assert result == {collection: {1: {"f": 1}, 2: {"f": 2}}}
+        call_args = self.engine.retrieve.call_args[0]
+        assert call_args[0] == "get_many"
+        assert json.loads(call_args[1])["requests"] == [
+            {"collection": "a", "ids": [2], "mapped_fields": ["f"]}
+        ]
+        result = self.db.get_many([GetManyRequest(collection, [1, 2], ["f"])])
+        assert result == {collection: {1: {"f": 1}, 2: {"f": 2}}}
+        assert self.engine.retrieve.call_count == 2
+
+    def test_fetch_models(self) -> None:
+        fqid_1 = FullQualifiedId(Collection("a"), 1)
+        fqid_2 = FullQualifiedId(Collection("a"), 2)
+        fqid_3 = FullQualifiedId(Collection("b"), 3)
+        self.engine.retrieve.return_value = (
+            json.dumps(
+                {
+                    "a": {
+                        "1": {"f": 1, "meta_position": 4},
+                        "2": {"f": 2, "meta_position": 5},
+                    },
+                    "b": {"3": {"f": 3, "meta_position": 6}},
+                }
+            ),
+            200,
+        )
+        result = self.db.fetch_models([fqid_1, fqid_2, fqid_3], ["f"], lock_result=True)
+        assert self.engine.retrieve.call_count == 1
+        assert result[fqid_1]["f"] == 1
+        assert result[fqid_3]["f"] == 3
+        assert self.db.locked_fields == {"a/1": 4, "a/2": 5, "b/3": 6}
+
+    def test_fetch_models_str_ids(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), "1")  # type: ignore
+        self.engine.retrieve.return_value = json.dumps({"a": {"1": {"f": 1}}}), 200
+        result = self.db.fetch_models([fqid], ["f"])
+        assert result == {fqid: {"f": 1}}
+        call_args = self.engine.retrieve.call_args[0]
+        assert json.loads(call_args[1])["requests"][0]["ids"] == [1]
+
+    def test_fetch_models_full_model_locked(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.engine.retrieve.return_value = (
+            json.dumps({"a": {"1": {"f": 1, "g": 2, "meta_position": 3}}}),
+            200,
+        )
+        result = self.db.fetch_models([fqid], [], lock_result=True)
+        assert result == {fqid: {"f": 1, "g": 2, "meta_position": 3}}
+        call_args = self.engine.retrieve.call_args[0]
+        assert json.loads(call_args[1])["requests"][0]["mapped_fields"] == []
+        assert self.db.fetch_models([fqid], ["g"]) == {fqid: {"g": 2}}
+        assert self.engine.retrieve.call_count == 1
+
+    def test_fetch_models_merge_additional(self) -> None:
+        fqid_1 = FullQualifiedId(Collection("a"), 1)
+        fqid_2 = FullQualifiedId(Collection("a"), 2)
+        self.db.update_additional_models(fqid_1, {"f": 10, "g": 11})
+        self.db.update_additional_models(fqid_2, {"f": 20})
+        self.engine.retrieve.return_value = (
+            json.dumps({"a": {"2": {"f": 2, "g": 3}}}),
+            200,
+        )
+        result = self.db.fetch_models([fqid_1, fqid_2], ["f", "g"])
+        assert result == {fqid_1: {"f": 10, "g": 11}, fqid_2: {"f": 20, "g": 3}}
+        call_args = self.engine.retrieve.call_args[0]
+        assert json.loads(call_args[1])["requests"][0]["ids"] == [2]
+
+    def test_fetch_models_missing(self) -> None:
+        fqid_1 = FullQualifiedId(Collection("a"), 1)
+        fqid_2 = FullQualifiedId(Collection("a"), 2)
+        self.engine.retrieve.return_value = json.dumps({"a": {"1": {"f": 1}}}), 200
+        result = self.db.fetch_models([fqid_1, fqid_2], ["f"], exception=False)
+        assert result == {fqid_1: {"f": 1}}
+        with self.assertRaises(DatastoreException) as context_manager:
+            self.db.fetch_models([fqid_1, fqid_2], ["f"])
+        assert context_manager.exception.message == "Model 'a/2' does not exist."
+
+    def test_fetch_reserved_models(self) -> None:
+        self.engine.retrieve.return_value = json.dumps({"ids": [1, 2]}), 200
+        self.db.reserve_ids(Collection("a"), 2)
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.db.update_additional_models(fqid, {"f": 1})
+        assert self.db.fetch_model(fqid, ["f", "g"]) == {"f": 1}
+        assert self.db.fetch_models([fqid], ["f", "g"]) == {fqid: {"f": 1}}
+        with self.assertRaises(DatastoreException) as context_manager:
+            self.db.get(FullQualifiedId(Collection("a"), 2), ["f"])
+        assert context_manager.exception.message == "Model 'a/2' does not exist."
+        assert self.db.metrics.calls == {"reserve_ids": 1}
+
+    def test_fetch_models_empty(self) -> None:
+        assert self.db.fetch_models([], ["f"]) == {}
+        self.engine.retrieve.assert_not_called()
+
+    def test_metrics(self) -> None:
+        content = json.dumps({"f": 1, "meta_deleted": False, "meta_position": 1})
+        self.engine.retrieve.return_value = content, 200
+        self.db.get(FullQualifiedId(Collection("a"), 1), ["f"])
+        self.db.get(FullQualifiedId(Collection("a"), 2), ["f"])
+        self.engine.retrieve.return_value = json.dumps({"ids": [1]}), 200
+        self.db.reserve_ids(Collection("a"), 1)
+        assert self.db.metrics.calls == {"get": 2, "reserve_ids": 1}
+        assert self.db.metrics.total_calls == 3
+        assert self.db.metrics.response_bytes == 2 * len(content) + len(
+            json.dumps({"ids": [1]})
+        )
+        assert self.db.metrics.additional_model_bypasses == 0
+
+    def test_metrics_additional_model_bypasses(self) -> None:
+        fqid = FullQualifiedId(Collection("a"), 1)
+        self.db.update_additional_models(fqid, {"f": 2})
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(fqid, ["f"])
+        self.engine.retrieve.return_value = json.dumps({"a": {"1": {"f": 1}}}), 200
+        self.db.get_many([GetManyRequest(Collection("a"), [1, 2], ["g"])])
+        self.db.fetch_model(fqid, ["f"])
+        assert self.db.metrics.total_calls == 2
+        assert self.db.metrics.additional_model_bypasses == 2
+
+    def test_metrics_difference(self) -> None:
+        self.engine.retrieve.return_value = json.dumps({"f": 1}), 200
+        self.db.get(FullQualifiedId(Collection("a"), 1), ["f"])
+        before = self.db.metrics.copy()
+        self.db.get(FullQualifiedId(Collection("a"), 2), ["f"])
+        self.engine.retrieve.return_value = json.dumps({"exists": True}), 200
+        self.db.exists(Collection("a"), FilterOperator("f", "=", 1))
+        difference = self.db.metrics - before
+        assert difference.calls == {"get": 1, "exists": 1}
+        assert before.calls == {"get": 1}
+
+    def test_command_data_cached(self) -> None:
+        command = commands.Get(fqid=FullQualifiedId(Collection("a"), 1))
+        with patch(
+            "openslides_backend.services.datastore.commands.json.dumps",
+            wraps=json.dumps,
+        ) as dumps:
+            assert command.data == command.data
+        dumps.assert_called_once()
+
+    def test_write_encoded_once(self) -> None:
+        write_request = WriteRequest(
+            events=[], information={}, user_id=42, locked_fields={}
+        )
+        self.engine.retrieve.return_value = "", 200
+        with patch(
+            "openslides_backend.services.datastore.commands.json.dumps",
+            wraps=json.dumps,
+        ) as dumps:
+            self.db.write(write_request)
+        dumps.assert_called_once()
+        data = self.engine.retrieve.call_args[0][1]
+        assert self.logger.debug.call_args_list[0][0][1] is data
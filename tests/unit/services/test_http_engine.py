@@ -0,0 +1,83 @@
+from typing import cast
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock
+
+from requests.adapters import HTTPAdapter
+
+from openslides_backend.services.datastore.http_engine import (
+    DEFAULT_POOL_SIZE,
+    HTTPEngine,
+)
+from openslides_backend.shared.exceptions import DatastoreConnectionException
+
+
+class HTTPEngineTester(TestCase):
+    def setUp(self) -> None:
+        self.engine = HTTPEngine("http://reader", "http://writer", MagicMock(), 3)
+
+    def mock_session(self, name: str) -> Mock:
+        session = Mock()
+        session.post.return_value = Mock(content=b"{}", status_code=200)
+        setattr(self.engine, name, session)
+        return session
+
+    def test_pool_size(self) -> None:
+        for session in (self.engine.reader_session, self.engine.writer_session):
+            adapter = cast(HTTPAdapter, session.get_adapter("http://reader"))
+            assert adapter._pool_maxsize == 3
+            assert adapter._pool_block
+
+    def test_default_pool_size(self) -> None:
+        engine = HTTPEngine("http://reader", "http://writer", MagicMock())
+        assert engine.pool_size == DEFAULT_POOL_SIZE
+
+    def test_separate_sessions(self) -> None:
+        assert self.engine.reader_session is not self.engine.writer_session
+
+    def test_reader_endpoint(self) -> None:
+        reader = self.mock_session("reader_session")
+        writer = self.mock_session("writer_session")
+        content, status_code = self.engine.retrieve("get", "{}")
+        assert (content, status_code) == (b"{}", 200)
+        reader.post.assert_called_once_with(url="http://reader/get", data="{}")
+        writer.post.assert_not_called()
+
+    def test_writer_endpoint(self) -> None:
+        reader = self.mock_session("reader_session")
+        writer = self.mock_session("writer_session")
+        self.engine.retrieve("reserve_ids", "{}")
+        writer.post.assert_called_once_with(url="http://writer/reserve_ids", data="{}")
+        reader.post.assert_not_called()
+
+    def test_unknown_endpoint(self) -> None:
+        with self.assertRaises(DatastoreConnectionException):
+            self.engine.retrieve("unknown", "{}")
+
+    def test_pool_metrics_empty(self) -> None:
+        metrics = self.engine.get_pool_metrics()
+        assert metrics == {
+            "reader": {
+                "pool_size": 3,
+                "requests": 0,
+                "connections": 0,
+                "idle_connections": 0,
+            },
+            "writer": {
+                "pool_size": 3,
+                "requests": 0,
+                "connections": 0,
+                "idle_connections": 0,
+            },
+        }
+
+    def test_pool_metrics(self) -> None:
+        adapter = cast(
+            HTTPAdapter, self.engine.reader_session.get_adapter("http://reader")
+        )
+        pool = adapter.poolmanager.connection_from_url("http://reader")
+        pool.num_requests = 5
+        pool.num_connections = 1
+        metrics = self.engine.get_pool_metrics()
+        assert metrics["reader"]["requests"] == 5
+        assert metrics["reader"]["connections"] == 1
+        assert metrics["writer"]["requests"] == 0
@@ -0,0 +1,64 @@
+import base64
+import os
+from typing import cast
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock
+
+import requests
+import simplejson as json
+from requests.adapters import HTTPAdapter
+
+from openslides_backend.services.media.adapter import (
+    CHUNK_SIZE,
+    MediaServiceAdapter,
+    UploadBody,
+)
+from openslides_backend.shared.exceptions import MediaServiceException
+
+
+class MediaServiceAdapterTester(TestCase):
+    def setUp(self) -> None:
+        self.adapter = MediaServiceAdapter("http://media", MagicMock(), 3)
+        self.session = Mock()
+        self.session.post.return_value = Mock(content=b"", status_code=200)
+        self.adapter.session = self.session
+
+    def test_pool_size(self) -> None:
+        adapter = MediaServiceAdapter("http://media", MagicMock(), 3)
+        http_adapter = cast(HTTPAdapter, adapter.session.get_adapter("http://media"))
+        assert http_adapter._pool_maxsize == 3
+        assert http_adapter._pool_block
+
+    def test_upload_mediafile(self) -> None:
+        file = base64.b64encode(os.urandom(CHUNK_SIZE)).decode()
+        self.adapter.upload_mediafile(file, 1, "application/pdf")
+        url, body = (
+            self.session.post.call_args[0][0],
+            self.session.post.call_args[1]["data"],
+        )
+        assert url == "http://media/upload_mediafile/"
+        chunks = list(body)
+        assert len(chunks) > 3
+        assert len(body) == sum(len(chunk) for chunk in chunks)
+        assert json.loads(b"".join(chunks)) == {
+            "id": 1,
+            "mimetype": "application/pdf",
+            "file": file,
+        }
+
+    def test_upload_error(self) -> None:
+        self.session.post.return_value = Mock(content=b"error", status_code=500)
+        with self.assertRaises(MediaServiceException):
+            self.adapter.upload_resource("YQ==", 1, "text/plain")
+
+    def test_connection_error(self) -> None:
+        self.session.post.side_effect = requests.exceptions.ConnectionError
+        with self.assertRaises(MediaServiceException):
+            self.adapter.upload_resource("YQ==", 1, "text/plain")
+
+    def test_upload_body_escaping(self) -> None:
+        file = 'a"b\\c\ndü'
+        body = UploadBody(file, 2, "text/plain")
+        data = b"".join(body)
+        assert len(body) == len(data)
+        assert json.loads(data)["file"] == file
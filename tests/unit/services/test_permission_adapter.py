@@ -0,0 +1,46 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, patch
+
+import requests
+import simplejson as json
+
+from openslides_backend.services.permission.adapter import PermissionHTTPAdapter
+from openslides_backend.shared.exceptions import PermissionException
+
+
+class PermissionAdapterTester(TestCase):
+    def setUp(self) -> None:
+        self.adapter = PermissionHTTPAdapter("http://permission", MagicMock())
+        self.session = Mock()
+        self.adapter.session = self.session
+        self.response = Mock(status_code=200)
+        self.response.json.return_value = True
+        self.session.post.return_value = self.response
+
+    def test_is_allowed(self) -> None:
+        data_list = [{"id": 1}, {"id": 2}]
+        assert self.adapter.is_allowed("topic.update", 1, data_list)
+        self.session.post.assert_called_once()
+        kwargs = self.session.post.call_args[1]
+        assert kwargs["url"] == "http://permission/is_allowed"
+        assert json.loads(kwargs["data"]) == {
+            "name": "topic.update",
+            "user_id": 1,
+            "data": data_list,
+        }
+
+    def test_session_reused(self) -> None:
+        adapter = PermissionHTTPAdapter("http://permission", MagicMock())
+        with patch.object(
+            requests.Session, "post", autospec=True, return_value=self.response
+        ) as post:
+            adapter.is_allowed("topic.update", 1, [{"id": 1}])
+            adapter.is_allowed("topic.update", 1, [{"id": 2}])
+        first_session, second_session = (args[0] for args, _ in post.call_args_list)
+        assert first_session is adapter.session
+        assert second_session is adapter.session
+
+    def test_bad_response(self) -> None:
+        self.response.json.return_value = {"allowed": True}
+        with self.assertRaises(PermissionException):
+            self.adapter.is_allowed("topic.update", 1, [{"id": 1}])
@@ -0,0 +1,164 @@
+import logging
+import os
+from copy import deepcopy
+from typing import List, cast
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from openslides_backend.action.action_handler import ActionHandler
+from openslides_backend.action.util.typing import PayloadElement
+from openslides_backend.services.datastore.adapter import DatastoreAdapter
+from openslides_backend.shared.exceptions import (
+    ActionException,
+    DatastoreLockedException,
+    MediaServiceException,
+)
+from openslides_backend.shared.patterns import Collection
+
+from ..benchmark.benchmark import BenchmarkServices
+from ..benchmark.fake_engine import FakeEngine
+from ..benchmark.fixtures import MEETING_ID, create_meeting_fixture
+
+PAYLOAD: List[PayloadElement] = [
+    {
+        "action": "user.update",
+        "data": [{"id": 2, "first_name": "Updated", "group_$_ids": {"1": [1]}}],
+    }
+]
+
+UPLOAD_PAYLOAD: List[PayloadElement] = [
+    {
+        "action": "mediafile.upload",
+        "data": [
+            {
+                "title": "title",
+                "meeting_id": MEETING_ID,
+                "filename": "file.txt",
+                "file": "YQ==",
+            }
+        ],
+    }
+]
+
+
+class ActionHandlerMetricsTester(TestCase):
+    def setUp(self) -> None:
+        self.engine = FakeEngine()
+        self.engine.set_models(create_meeting_fixture(10))
+        self.services = BenchmarkServices(self.engine)
+        self.media = self.services.media()
+        self.handler = ActionHandler(self.services, logging)
+
+    def test_action_metrics(self) -> None:
+        self.handler.handle_request(PAYLOAD, 1)
+        metrics = self.handler.action_metrics["user.update"]
+        assert metrics.total_calls > 0
+        assert "write" not in metrics.calls
+        assert self.handler.datastore.metrics.calls["write"] == 1
+        assert self.handler.datastore.metrics.total_calls == metrics.total_calls + 1
+
+    @patch.dict(
+        os.environ,
+        {"OPENSLIDES_DEVELOPMENT": "1", "OPENSLIDES_BACKEND_QUERY_BUDGET": "1"},
+    )
+    def test_query_budget_dev_mode(self) -> None:
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.handle_request(PAYLOAD, 1)
+        assert context_manager.exception.message.startswith(
+            "Action user.update exceeded the query budget of 1 datastore calls"
+        )
+        assert "write" not in self.engine.stats.calls
+
+    @patch.dict(
+        os.environ,
+        {"OPENSLIDES_DEVELOPMENT": "0", "OPENSLIDES_BACKEND_QUERY_BUDGET": "1"},
+    )
+    def test_query_budget_production(self) -> None:
+        self.handler.handle_request(PAYLOAD, 1)
+        assert self.engine.stats.calls["write"] == 1
+
+    @patch.dict(
+        os.environ,
+        {"OPENSLIDES_DEVELOPMENT": "1", "OPENSLIDES_BACKEND_QUERY_BUDGET": "100"},
+    )
+    def test_query_budget_not_exceeded(self) -> None:
+        self.handler.handle_request(PAYLOAD, 1)
+        assert self.engine.stats.calls["write"] == 1
+
+    def test_release_unused_ids(self) -> None:
+        payload: List[PayloadElement] = [
+            {
+                "action": "motion.create",
+                "data": [
+                    {"meeting_id": MEETING_ID, "title": "title", "text": "text"},
+                    {"meeting_id": MEETING_ID, "title": "title"},
+                    {"meeting_id": MEETING_ID, "title": "title", "text": "text"},
+                ],
+            }
+        ]
+        with self.assertRaises(ActionException) as context_manager:
+            self.handler.handle_request(payload, 1)
+        assert context_manager.exception.message == "Text is required"
+        assert self.engine.stats.calls["reserve_ids"] == 1
+        datastore = cast(DatastoreAdapter, self.handler.datastore)
+        assert datastore.unused_ids[Collection("motion")] == [13]
+
+    def test_payload_not_modified(self) -> None:
+        payload: List[PayloadElement] = PAYLOAD + [
+            {
+                "action": "motion.create",
+                "data": [
+                    {
+                        "meeting_id": MEETING_ID,
+                        "title": "title",
+                        "text": "text",
+                        "agenda_create": True,
+                        "tag_ids": [],
+                    }
+                ],
+            }
+        ]
+        original_payload = deepcopy(payload)
+        self.handler.handle_request(payload, 1)
+        assert payload == original_payload
+
+    def test_sort_retried_payload_not_modified(self) -> None:
+        payload: List[PayloadElement] = [
+            {
+                "action": "agenda_item.sort",
+                "data": [
+                    {
+                        "meeting_id": MEETING_ID,
+                        "tree": [
+                            {"id": 1, "children": [{"id": 2}, {"id": 3}]},
+                            {"id": 4, "children": [{"id": 5, "children": [{"id": 6}]}]},
+                            {"id": 7},
+                            {"id": 8},
+                            {"id": 9},
+                            {"id": 10},
+                        ],
+                    }
+                ],
+            }
+        ]
+        original_payload = deepcopy(payload)
+        self.handler.datastore.write = Mock(  # type: ignore
+            side_effect=[DatastoreLockedException("locked"), None]
+        )
+        self.handler.handle_request(payload, 1)
+        assert self.handler.datastore.write.call_count == 2
+        assert payload == original_payload
+
+    def test_media_upload_not_repeated_on_retry(self) -> None:
+        self.handler.datastore.write = Mock(  # type: ignore
+            side_effect=[DatastoreLockedException("locked"), None]
+        )
+        self.handler.handle_request(UPLOAD_PAYLOAD, 1)
+        self.media.upload_mediafile.assert_called_once_with("YQ==", 1, "text/plain")
+        assert self.handler.datastore.write.call_count == 2
+
+    def test_media_upload_error(self) -> None:
+        self.media.upload_mediafile.side_effect = MediaServiceException("error")
+        with self.assertRaises(MediaServiceException):
+            self.handler.handle_request(UPLOAD_PAYLOAD, 1)
+        assert "write" not in self.engine.stats.calls
@@ -0,0 +1,86 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock
+
+import simplejson as json
+
+from openslides_backend.action.util.assert_belongs_to_meeting import (
+    assert_belongs_to_meeting,
+    get_fqids_not_belonging_to_meeting,
+)
+from openslides_backend.services.datastore.adapter import DatastoreAdapter
+from openslides_backend.shared.exceptions import ActionException
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+
+class AssertBelongsToMeetingTester(TestCase):
+    def setUp(self) -> None:
+        self.engine = Mock()
+        self.datastore = DatastoreAdapter(self.engine, MagicMock())
+        self.engine.retrieve.return_value = (
+            json.dumps(
+                {
+                    "tag": {
+                        "1": {"meeting_id": 1},
+                        "2": {"meeting_id": 2},
+                        "3": {"meeting_id": 1},
+                    },
+                    "user": {
+                        "4": {"group_$1_ids": [1]},
+                        "5": {"guest_meeting_ids": [1]},
+                        "6": {"meeting_id": 2},
+                    },
+                }
+            ),
+            200,
+        )
+
+    def get_fqid(self, collection: str, id: int) -> FullQualifiedId:
+        return FullQualifiedId(Collection(collection), id)
+
+    def test_single_request(self) -> None:
+        fqids = [self.get_fqid("tag", id) for id in (1, 2, 3)] + [
+            self.get_fqid("user", id) for id in (4, 5, 6, 7)
+        ]
+        errors = get_fqids_not_belonging_to_meeting(self.datastore, fqids, 1)
+        assert errors == [
+            self.get_fqid("tag", 2),
+            self.get_fqid("user", 6),
+            self.get_fqid("user", 7),
+        ]
+        self.engine.retrieve.assert_called_once()
+        requests = json.loads(self.engine.retrieve.call_args[0][1])["requests"]
+        assert [(request["collection"], request["ids"]) for request in requests] == [
+            ("tag", [1, 2, 3]),
+            ("user", [4, 5, 6, 7]),
+        ]
+        assert set(requests[1]["mapped_fields"]) == {
+            "meeting_id",
+            "guest_meeting_ids",
+            "group_$1_ids",
+        }
+
+    def test_additional_models(self) -> None:
+        fqid = self.get_fqid("tag", 8)
+        self.datastore.update_additional_models(fqid, {"meeting_id": 1})
+        assert_belongs_to_meeting(self.datastore, [fqid], 1)
+        self.engine.retrieve.assert_not_called()
+
+    def test_meeting(self) -> None:
+        assert get_fqids_not_belonging_to_meeting(
+            self.datastore,
+            [self.get_fqid("meeting", 1), self.get_fqid("meeting", 2)],
+            1,
+        ) == [self.get_fqid("meeting", 2)]
+        self.engine.retrieve.assert_not_called()
+
+    def test_error_message(self) -> None:
+        with self.assertRaises(ActionException) as context_manager:
+            assert_belongs_to_meeting(
+                self.datastore,
+                [self.get_fqid("tag", 1), self.get_fqid("tag", 2)],
+                1,
+            )
+        assert (
+            context_manager.exception.message
+            == "The following models do not belong to meeting 1: ['tag/2']"
+        )
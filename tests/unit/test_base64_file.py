@@ -0,0 +1,61 @@
+import base64
+import os
+from io import SEEK_CUR, SEEK_END, BytesIO
+from unittest import TestCase
+
+from PyPDF2 import PdfFileReader, PdfFileWriter
+
+from openslides_backend.action.util.base64_file import (
+    Base64FileReader,
+    get_decoded_size,
+    open_base64_file,
+)
+from openslides_backend.shared.exceptions import ActionException
+
+
+def create_pdf(pages: int) -> bytes:
+    writer = PdfFileWriter()
+    for _ in range(pages):
+        writer.addBlankPage(100, 100)
+    bytes_io = BytesIO()
+    writer.write(bytes_io)
+    return bytes_io.getvalue()
+
+
+class Base64FileTester(TestCase):
+    def test_get_decoded_size(self) -> None:
+        for size in range(10):
+            file = base64.b64encode(os.urandom(size)).decode()
+            assert get_decoded_size(file) == size
+
+    def test_get_decoded_size_whitespace(self) -> None:
+        file = base64.encodebytes(os.urandom(100)).decode()
+        assert "\n" in file
+        assert get_decoded_size(file) == 100
+        assert get_decoded_size("YQ==\n ") == 1
+
+    def test_get_decoded_size_invalid(self) -> None:
+        with self.assertRaises(ActionException):
+            get_decoded_size("YWJ")
+
+    def test_reader(self) -> None:
+        content = os.urandom(100)
+        reader = Base64FileReader(base64.b64encode(content).decode())
+        for offset, length in ((0, 10), (1, 5), (50, 50), (98, 10), (100, 1)):
+            reader.seek(offset)
+            assert reader.read(length) == content[offset : offset + length]
+        reader.seek(-5, SEEK_END)
+        assert reader.read() == content[-5:]
+        reader.seek(-10, SEEK_CUR)
+        assert reader.tell() == 90
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+
+    def test_open_base64_file(self) -> None:
+        content = os.urandom(1000)
+        for file in (base64.b64encode(content), base64.encodebytes(content)):
+            assert open_base64_file(file.decode()).read() == content
+
+    def test_pdf_pages(self) -> None:
+        file = base64.b64encode(create_pdf(3)).decode()
+        assert PdfFileReader(open_base64_file(file)).getNumPages() == 3
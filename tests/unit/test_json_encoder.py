@@ -0,0 +1,57 @@
+import os
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+import simplejson as json
+
+from openslides_backend.http import json_encoder
+from openslides_backend.http.json_encoder import encode_json, iter_json
+
+BODIES = [
+    [],
+    {},
+    "text",
+    [[[[[1]]]]],
+    {"success": True, "results": [[{"id": id} for id in range(2500)], None]},
+    [{"users": list(range(2500))}, {"data": {"1": {"id": 1}}}],
+    {1: "int key", "a": [Decimal("1.50"), {"b": None}]},
+]
+
+
+class JSONEncoderTester(TestCase):
+    def test_iter_json(self) -> None:
+        for body in BODIES:
+            assert b"".join(iter_json(body)).decode() == json.dumps(body)
+
+    def test_iter_json_chunks(self) -> None:
+        body = {"results": [[{"id": id} for id in range(2500)]]}
+        chunks = list(iter_json(body, chunk_size=1024))
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 1024 for chunk in chunks[:-1])
+        assert b"".join(chunks).decode() == json.dumps(body)
+
+    def test_encode_json_default(self) -> None:
+        body = BODIES[4]
+        assert json.loads(b"".join(encode_json(body))) == body
+
+    @patch.dict(os.environ, {"OPENSLIDES_BACKEND_JSON_ENCODER": "orjson"})
+    def test_encode_json_orjson(self) -> None:
+        if json_encoder.orjson is None:
+            self.skipTest("orjson is not installed")
+        body = BODIES[4]
+        chunks = encode_json(body)
+        assert isinstance(chunks, list)
+        assert json.loads(b"".join(chunks)) == body
+
+    @patch.dict(os.environ, {"OPENSLIDES_BACKEND_JSON_ENCODER": "orjson"})
+    def test_encode_json_orjson_fallback(self) -> None:
+        if json_encoder.orjson is None:
+            self.skipTest("orjson is not installed")
+        body = BODIES[6]
+        assert b"".join(encode_json(body)).decode() == json.dumps(body)
+
+    @patch.dict(os.environ, {"OPENSLIDES_BACKEND_JSON_ENCODER": "unknown"})
+    def test_encode_json_unknown_encoder(self) -> None:
+        with self.assertRaises(ValueError):
+            encode_json([])
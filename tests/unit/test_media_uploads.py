@@ -0,0 +1,55 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from openslides_backend.action.util.media_uploads import MediaUploads
+from openslides_backend.services.media.interface import MediaService
+from openslides_backend.shared.exceptions import MediaServiceException
+
+
+class MediaUploadsTester(TestCase):
+    def setUp(self) -> None:
+        self.media = Mock(MediaService)
+        self.uploads = MediaUploads(self.media)
+        self.uploads.start_attempt()
+
+    def test_join(self) -> None:
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        self.uploads.upload_resource("Yg==", 2, "text/plain")
+        self.uploads.join()
+        self.media.upload_mediafile.assert_called_once_with("YQ==", 1, "text/plain")
+        self.media.upload_resource.assert_called_once_with("Yg==", 2, "text/plain")
+
+    def test_join_error(self) -> None:
+        self.media.upload_mediafile.side_effect = MediaServiceException("error")
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        with self.assertRaises(MediaServiceException):
+            self.uploads.join()
+
+    def test_retry_same_upload(self) -> None:
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        self.uploads.start_attempt()
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        self.uploads.join()
+        self.media.upload_mediafile.assert_called_once()
+
+    def test_retry_changed_upload(self) -> None:
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        self.uploads.start_attempt()
+        self.uploads.upload_mediafile("Yg==", 1, "text/plain")
+        self.uploads.join()
+        assert self.media.upload_mediafile.call_count == 2
+        assert self.uploads.uploads[("mediafile", 1)].file == "Yg=="
+
+    def test_retry_ignores_failed_upload_not_requested_again(self) -> None:
+        self.media.upload_mediafile.side_effect = MediaServiceException("error")
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        self.uploads.start_attempt()
+        self.uploads.join()
+
+    def test_reset(self) -> None:
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        self.uploads.join()
+        self.uploads.reset()
+        self.uploads.upload_mediafile("YQ==", 1, "text/plain")
+        self.uploads.join()
+        assert self.media.upload_mediafile.call_count == 2
@@ -1,8 +1,10 @@
 from typing import cast
 from unittest import TestCase
+from unittest.mock import patch
 
 from openslides_backend.models import fields
 from openslides_backend.models.base import Model
+from openslides_backend.models.models import User
 from openslides_backend.shared.exceptions import ActionException
 from openslides_backend.shared.patterns import Collection
 
@@ -76,6 +78,18 @@ class ModelBaseTester(TestCase):
             [field.own_field_name for field in FakeModel().get_fields()],
         )
 
+    def test_field_tuples_fake_model(self) -> None:
+        self.assertEqual(
+            ["fake_model_2_generic_ids", "fake_model_2_ids"],
+            [field.own_field_name for field in FakeModel.relation_fields],
+        )
+        self.assertEqual(
+            ["id", "text"],
+            [field.own_field_name for field in FakeModel.required_fields],
+        )
+        self.assertEqual(FakeModel.default_fields, ())
+        self.assertEqual(FakeModel2.on_delete_relation_fields, ())
+
     def test_own_collection_attr(self) -> None:
         rels = [
             FakeModel().get_field("fake_model_2_ids"),
@@ -93,3 +107,25 @@ class ModelBaseTester(TestCase):
     def test_get_read_only_field(self) -> None:
         with self.assertRaises(ActionException):
             FakeModel().get_property("read_only")
+
+    def test_resolve_structured_field(self) -> None:
+        field = User().get_field("group_$_ids")
+        self.assertEqual(User.resolve_field("group_$42_ids"), (field, "42"))
+        self.assertEqual(User.resolve_field("group_$_ids"), (field, ""))
+        self.assertEqual(User.resolve_field("group_ids"), None)
+        self.assertEqual(User.resolve_field("group_$4_2_idss"), None)
+        self.assertIs(User().try_get_field("group_$42_ids"), field)
+
+    def test_resolve_field_cache_per_model(self) -> None:
+        User.resolve_field("group_$42_ids")
+        self.assertIn("group_$42_ids", User.resolved_fields)
+        self.assertNotIn("group_$42_ids", FakeModel.resolved_fields)
+
+    @patch("openslides_backend.models.base.RESOLVED_FIELDS_CACHE_SIZE", 2)
+    def test_resolve_field_cache_evicts_least_recently_used(self) -> None:
+        User.resolved_fields.clear()
+        User.resolve_field("group_$1_ids")
+        User.resolve_field("group_$2_ids")
+        User.resolve_field("group_$1_ids")
+        User.resolve_field("group_$3_ids")
+        self.assertEqual(list(User.resolved_fields), ["group_$1_ids", "group_$3_ids"])
@@ -1,5 +1,20 @@
-from openslides_backend.permissions.permission_helper import is_child_permission
-from openslides_backend.permissions.permissions import Permissions
+from typing import Any, Dict
+from unittest.mock import Mock
+
+import pytest
+
+from openslides_backend.permissions.permission_helper import (
+    PermissionResolver,
+    get_child_permissions,
+    is_child_permission,
+)
+from openslides_backend.permissions.permissions import (
+    Permissions,
+    permission_ancestors,
+    permission_parents,
+)
+from openslides_backend.shared.exceptions import PermissionDenied
+from openslides_backend.shared.patterns import Collection
 
 
 def test_is_child_permission_equal() -> None:
@@ -42,3 +57,68 @@ def test_is_child_permission_different_collections() -> None:
     assert not is_child_permission(
         Permissions.AgendaItem.CAN_SEE, Permissions.Motion.CAN_MANAGE
     )
+
+
+def test_get_child_permissions() -> None:
+    assert get_child_permissions(Permissions.AgendaItem.CAN_MANAGE) == {
+        Permissions.AgendaItem.CAN_MANAGE,
+        Permissions.AgendaItem.CAN_SEE_INTERNAL,
+        Permissions.AgendaItem.CAN_SEE,
+    }
+
+
+def test_get_child_permissions_matches_is_child_permission() -> None:
+    for parent in permission_parents:
+        for child in permission_parents:
+            assert (child in get_child_permissions(parent)) == is_child_permission(
+                child, parent
+            )
+
+
+def test_permission_ancestors_closed_under_parents() -> None:
+    for child, parents in permission_parents.items():
+        assert child in permission_ancestors[child]
+        for parent in parents:
+            assert permission_ancestors[parent] <= permission_ancestors[child]
+
+
+def get_datastore_mock(groups: Dict[int, Dict[str, Any]]) -> Mock:
+    datastore = Mock()
+    datastore.get.return_value = {"group_$1_ids": list(groups)}
+    datastore.get_many.return_value = {Collection("group"): groups}
+    return datastore
+
+
+def test_permission_resolver() -> None:
+    datastore = get_datastore_mock(
+        {2: {"permissions": ["motion.can_manage", "agenda_item.can_see"]}}
+    )
+    resolver = PermissionResolver(datastore)
+    assert resolver.has_perm(1, Permissions.Motion.CAN_SEE, 1)
+    assert resolver.has_perm(1, Permissions.Motion.CAN_MANAGE, 1)
+    assert resolver.has_perm(1, Permissions.AgendaItem.CAN_SEE, 1)
+    assert not resolver.has_perm(1, Permissions.AgendaItem.CAN_MANAGE, 1)
+    assert datastore.get.call_count == 1
+    assert datastore.get_many.call_count == 1
+
+
+def test_permission_resolver_admin_group() -> None:
+    datastore = get_datastore_mock({2: {"admin_group_for_meeting_id": 1}})
+    resolver = PermissionResolver(datastore)
+    assert resolver.has_perm(1, Permissions.User.CAN_MANAGE, 1)
+
+
+def test_permission_resolver_not_in_meeting() -> None:
+    datastore = get_datastore_mock({})
+    resolver = PermissionResolver(datastore)
+    with pytest.raises(PermissionDenied):
+        resolver.has_perm(1, Permissions.User.CAN_MANAGE, 1)
+
+
+def test_permission_resolver_reset() -> None:
+    datastore = get_datastore_mock({2: {"permissions": ["motion.can_see"]}})
+    resolver = PermissionResolver(datastore)
+    resolver.has_perm(1, Permissions.Motion.CAN_SEE, 1)
+    resolver.reset()
+    resolver.has_perm(1, Permissions.Motion.CAN_SEE, 1)
+    assert datastore.get_many.call_count == 2